@@ -5,35 +5,193 @@ Main Application Factory
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.services.identity_cache import IdentityCache
 import os
+import sqlite3
 
 # Initialize extensions
 db = SQLAlchemy()
 login_manager = LoginManager()
+user_cache = IdentityCache()
+
+
+@event.listens_for(Engine, 'connect')
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite ignores ON DELETE CASCADE unless foreign keys are enabled per connection."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
 
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
     
     # Configuration
-    app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///ivy_league_system.db'
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///ivy_league_system.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     
+    # Opportunity lifecycle jobs
+    app.config['EXPIRY_INTERVAL_SECONDS'] = 15 * 60
+    app.config['ARCHIVE_INTERVAL_SECONDS'] = 24 * 60 * 60
+    app.config['ARCHIVE_AFTER_DAYS'] = 180
+    app.config['DIGEST_INTERVAL_SECONDS'] = 60 * 60
+    app.config['ANALYTICS_REFRESH_INTERVAL_SECONDS'] = 60 * 60
+    app.config['REMINDER_INTERVAL_SECONDS'] = 60
+    app.config['DEADLINE_REMINDER_HOURS'] = 48  # Remind applicants this long before a deadline
+    app.config['LEADERBOARD_SNAPSHOT_INTERVAL_SECONDS'] = 60 * 60
+    app.config['LEADERBOARD_KEEP_HOURLY_DAYS'] = 7  # Older snapshots are thinned to one per day
+    app.config['LEADERBOARD_RETENTION_DAYS'] = 365
+    
+    # Session principal cache (per worker process)
+    app.config['USER_CACHE_TTL_SECONDS'] = 30
+    app.config['USER_CACHE_MAX_SIZE'] = 10000
+    
+    # Community feed
+    app.config['COMMUNITY_PAGE_SIZE'] = 20
+    app.config['TIMELINE_CACHE_SIZE'] = 500  # Newest posts buffered per domain
+    app.config['TIMELINE_CACHE_TTL_SECONDS'] = 300
+    app.config['TIMELINE_CACHE_MAX_DOMAINS'] = 32  # Domain feeds kept in memory (least recently read dropped)
+    
+    # Deletes with more dependent rows than this run as background purge jobs
+    app.config['PURGE_SYNC_LIMIT'] = 1000
+    app.config['PURGE_BATCH_SIZE'] = 5000
+    
+    # Candidate matching
+    app.config['SKILL_INDEX_SYNC_SECONDS'] = 5
+    
+    # Bulk exports (GET /export/...); with neither set, only `flask export` can export
+    app.config['EXPORT_ANALYSTS'] = {name.strip() for name in os.environ.get('EXPORT_ANALYSTS', '').split(',')
+                                     if name.strip()}  # Usernames
+    app.config['EXPORT_API_TOKEN'] = os.environ.get('EXPORT_API_TOKEN')  # Sent as Authorization: Bearer <token>
+    
+    # Bulk imports (POST /opportunities/import); with none set, only `flask import-opportunities` can import
+    app.config['IMPORT_ADMINS'] = {name.strip() for name in os.environ.get('IMPORT_ADMINS', '').split(',')
+                                   if name.strip()}  # Usernames
+    
+    # Background jobs
+    app.config['JOB_WORKERS'] = 2
+    
+    # Resume uploads
+    app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024
+    app.config['RESUME_UPLOAD_FOLDER'] = os.path.join(app.instance_path, 'resumes')
+    app.config['RESUME_PARSE_WORKERS'] = 2
+    app.config['RESUME_PARSE_TIMEOUT'] = 120
+    app.config['RESUME_MAX_PAGES'] = 50
+    
+    # Static assets and response compression
+    app.config['ASSETS_FOLDER'] = os.path.join(app.static_folder, 'dist')  # Output of `flask build-assets`
+    app.config['COMPRESS_MIN_SIZE'] = 1024  # Bytes; smaller HTML/JSON responses are sent as is
+    app.config['COMPRESS_LEVEL'] = 6
+    
+    # Read snapshot of the active opportunity catalog
+    app.config['CATALOG_ENABLED'] = True
+    app.config['CATALOG_SNAPSHOT_PATH'] = os.path.join(app.instance_path, 'catalog.snapshot')
+    app.config['CATALOG_REFRESH_SECONDS'] = 60  # Rebuild interval of the scheduler job
+    app.config['CATALOG_STALE_CHECK_SECONDS'] = 5  # Scheduler rebuilds this soon after opportunity writes
+    app.config['CATALOG_CHECK_SECONDS'] = 5  # How often workers look for a new snapshot file
+    app.config['CATALOG_MAX_AGE_SECONDS'] = 600  # Older snapshots are ignored (views query the database)
+    
+    # Live events (Server-Sent Events)
+    app.config['EVENTS_REDIS_URL'] = os.environ.get('EVENTS_REDIS_URL')  # Share events across processes
+    app.config['EVENTS_COUNT_DEBOUNCE_SECONDS'] = 1.0
+    app.config['EVENTS_HEARTBEAT_SECONDS'] = 15
+    app.config['EVENTS_MAX_STREAM_SECONDS'] = 300  # Clients reconnect after this
+    app.config['EVENTS_MAX_SUBSCRIBERS'] = int(os.environ.get('EVENTS_MAX_SUBSCRIBERS', 1000))  # Open streams per process
+    app.config['EVENTS_LIVE_UPDATES'] = os.environ.get('EVENTS_LIVE_UPDATES', '1') == '1'  # Pages connect to /events/stream
+    
+    # Password hashing pool (per worker process)
+    app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')  # Changing it upgrades hashes at next login
+    app.config['PASSWORD_HASH_WORKERS'] = 1  # Hashes computed at once; scale with cores / WEB_CONCURRENCY
+    app.config['PASSWORD_HASH_MAX_PENDING'] = 32  # Running + queued; further logins get 503
+    app.config['PASSWORD_HASH_RETRY_AFTER'] = 2
+    
+    # JSON API (/api/v1)
+    app.config['API_PAGE_SIZE'] = 50
+    app.config['API_MAX_PAGE_SIZE'] = 500
+    app.config['API_MAX_BATCH_IDS'] = 500  # ?ids= per request
+    
+    # Rate limits and load shedding for expensive endpoints (see app/services/ratelimit.py)
+    app.config['RATELIMIT_ENABLED'] = True
+    app.config['RATELIMIT_STORAGE'] = os.environ.get('RATELIMIT_STORAGE', 'sqlite')  # 'sqlite' (shared by workers) or 'memory'
+    app.config['RATELIMIT_SQLITE_PATH'] = os.path.join(app.instance_path, 'ratelimit.sqlite')
+    app.config['RATELIMIT_SLOT_TTL_SECONDS'] = 300  # Concurrency slots of killed workers free up after this
+    app.config['RATELIMIT_BUSY_RETRY_AFTER'] = 5  # Retry-After when the concurrency cap is reached
+    app.config['RATE_LIMITS'] = {
+        'scrape': {'user': '2/hour', 'route': '10/hour', 'concurrency': 1},
+        'rescore': {'user': '2/hour', 'route': '6/hour', 'concurrency': 1},
+        'auto-apply': {'user': '10/hour', 'route': '300/hour'},
+        'import': {'user': '20/hour', 'route': '200/hour'},
+    }
+    
+    # Cold start budget checked by `flask bench-startup` (import + create_app, ms)
+    app.config['STARTUP_BUDGET_MS'] = 1500
+    
+    # The bulk write helpers need a database with INSERT conflict clauses
+    from sqlalchemy.engine import make_url
+    from app.services.bulk import check_dialect
+    check_dialect(make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name())
+    
     # Initialize extensions
     db.init_app(app)
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
+    user_cache.init_app(app)
+    from app.services.passwords import password_hasher
+    password_hasher.init_app(app)
     
     # Register blueprints
-    from app.routes import auth, opportunities, community, ranking
+    from app.routes import auth, opportunities, community, ranking, jobs, export, analytics, health, assets, events, api
     app.register_blueprint(auth.bp)
     app.register_blueprint(opportunities.bp)
     app.register_blueprint(community.bp)
     app.register_blueprint(ranking.bp)
+    app.register_blueprint(jobs.bp)
+    app.register_blueprint(export.bp)
+    app.register_blueprint(analytics.bp)
+    app.register_blueprint(health.bp)
+    app.register_blueprint(assets.bp)
+    app.register_blueprint(events.bp)
+    app.register_blueprint(api.bp)
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Background job runner
+    from app.services.jobs import job_runner
+    job_runner.init_app(app)
+
+    # Community timeline cache
+    from app.services.timeline import timeline_cache
+    timeline_cache.init_app(app)
+
+    # Skill index for candidate matching
+    from app.services.skill_index import skill_index
+    skill_index.init_app(app)
+
+    # Opportunity catalog snapshot
+    from app.services.catalog import catalog
+    catalog.init_app(app)
+
+    # Live event streams
+    from app.services.events import event_broker
+    event_broker.init_app(app)
+
+    # Rate limiting and admission control
+    from app.services.ratelimit import rate_limiter
+    rate_limiter.init_app(app)
+
+    # Fingerprinted static assets and gzip for large dynamic responses
+    from app.services.assets import asset_pipeline, response_compressor
+    asset_pipeline.init_app(app)
+    response_compressor.init_app(app)
+
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+
+    # Models not imported by any blueprint
+    from app.models import archive, leaderboard, notification, resume  # noqa: F401
     
     return app
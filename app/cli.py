@@ -0,0 +1,382 @@
+"""
+Command Line Interface
+Operational commands registered on the Flask CLI (run with ``flask --app run <command>``).
+"""
+import click
+from flask import Flask
+
+
+def register_commands(app: Flask) -> None:
+    """Attach all custom CLI commands to the application."""
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(loadtest_command)
+    app.cli.add_command(expire_opportunities_command)
+    app.cli.add_command(archive_opportunities_command)
+    app.cli.add_command(run_scheduler_command)
+    app.cli.add_command(auto_apply_command)
+    app.cli.add_command(export_command)
+    app.cli.add_command(import_opportunities_command)
+    app.cli.add_command(refresh_analytics_command)
+    app.cli.add_command(purge_command)
+    app.cli.add_command(profile_imports_command)
+    app.cli.add_command(bench_startup_command)
+    app.cli.add_command(build_assets_command)
+    app.cli.add_command(build_catalog_command)
+    app.cli.add_command(send_reminders_command)
+    app.cli.add_command(snapshot_leaderboard_command)
+    app.cli.add_command(bench_login_command)
+
+
+@click.command('init-db')
+def init_db_command():
+    """Create missing tables and upgrade existing ones (run once per deploy, before starting workers)."""
+    from app import db
+    from app.services.schema import upgrade_schema
+
+    db.create_all()
+    for upgrade in upgrade_schema():
+        click.echo(f'Upgraded: {upgrade}')
+    click.echo(f'Database ready: {len(db.metadata.tables)} tables.')
+
+
+@click.command('seed')
+@click.option('--users', default=1000, show_default=True, help='Students to create.')
+@click.option('--opportunities', default=500, show_default=True, help='Opportunities across all domains.')
+@click.option('--applications-per-user', default=5, show_default=True)
+@click.option('--posts', default=2000, show_default=True)
+@click.option('--comments-per-post', default=3, show_default=True)
+@click.option('--likes-per-post', default=10, show_default=True)
+@click.option('--batch-size', default=5000, show_default=True, help='Rows per bulk insert.')
+@click.option('--seed', 'random_seed', type=int, default=None, help='Random seed for reproducible data.')
+def seed_command(users, opportunities, applications_per_user, posts, comments_per_post,
+                 likes_per_post, batch_size, random_seed):
+    """Bulk-generate synthetic data for capacity planning."""
+    from app.services.analytics import AnalyticsRollups
+    from app.services.seeder import DataSeeder
+
+    seeder = DataSeeder(batch_size=batch_size, seed=random_seed)
+    counts = seeder.seed(
+        users=users,
+        opportunities=opportunities,
+        applications_per_user=applications_per_user,
+        posts=posts,
+        comments_per_post=comments_per_post,
+        likes_per_post=likes_per_post,
+        progress=lambda table, rows: click.echo(f'  {table}: {rows} rows'),
+    )
+    for table, rows in counts.items():
+        click.echo(f'{table:>14}: {rows}')
+    AnalyticsRollups.refresh()
+    click.echo(f'Seeded users log in with password "{DataSeeder.DEFAULT_PASSWORD}".')
+
+
+@click.command('loadtest')
+@click.option('--base-url', default='http://localhost:5001', show_default=True)
+@click.option('--concurrency', default=10, show_default=True, help='Concurrent logged-in sessions.')
+@click.option('--duration', default=30.0, show_default=True, help='Seconds to run.')
+@click.option('--route', 'routes', multiple=True,
+              type=click.Choice(['dashboard', 'leaderboard', 'community', 'apply']),
+              help='Restrict to these routes (repeatable). Defaults to all.')
+@click.option('--password', default=None, help='Password of the seeded users.')
+def loadtest_command(base_url, concurrency, duration, routes, password):
+    """Drive the running app with authenticated sessions and report latency percentiles."""
+    from app import db
+    from app.models.opportunity import Opportunity
+    from app.models.user import User
+    from app.services.loadtest import LoadTester
+    from app.services.seeder import DataSeeder
+
+    usernames = db.session.query(User.username)\
+        .filter(User.username.like(f'{DataSeeder.USERNAME_PREFIX}%'))\
+        .limit(concurrency).all()
+    if not usernames:
+        raise click.ClickException('No seeded users found. Run "flask seed" first.')
+
+    password = password or DataSeeder.DEFAULT_PASSWORD
+    opportunity_ids = [row[0] for row in db.session.query(Opportunity.id)
+                       .filter_by(is_active=True).limit(10000).all()]
+
+    tester = LoadTester(
+        base_url=base_url,
+        credentials=[(row[0], password) for row in usernames],
+        opportunity_ids=opportunity_ids,
+        concurrency=concurrency,
+        duration=duration,
+        routes=list(routes) or None,
+    )
+    click.echo(f'Running {concurrency} sessions against {base_url} for {duration:.0f}s...')
+    report = tester.run()
+
+    click.echo(f'{"route":<12} {"requests":>9} {"errors":>7} {"429s":>7} {"req/s":>9} '
+               f'{"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}')
+    for route, stats in report.items():
+        click.echo(f'{route:<12} {stats["requests"]:>9} {stats["errors"]:>7} {stats["throttled"]:>7} '
+                   f'{stats["throughput"]:>9} {stats["p50_ms"]:>9} {stats["p95_ms"]:>9} {stats["p99_ms"]:>9}')
+
+
+@click.command('expire-opportunities')
+@click.option('--batch-size', default=1000, show_default=True)
+def expire_opportunities_command(batch_size):
+    """Deactivate opportunities whose deadline has passed."""
+    from app.services.lifecycle import OpportunityLifecycle
+
+    expired = OpportunityLifecycle.expire_past_deadline(batch_size=batch_size)
+    click.echo(f'Expired {expired} opportunities.')
+
+
+@click.command('archive-opportunities')
+@click.option('--days', type=int, default=None, help='Archive rows inactive for this many days.')
+@click.option('--batch-size', default=500, show_default=True)
+def archive_opportunities_command(days, batch_size):
+    """Move long-inactive opportunities and their applications to the archive tables."""
+    from flask import current_app
+    from app.services.lifecycle import OpportunityLifecycle
+
+    days = days if days is not None else current_app.config['ARCHIVE_AFTER_DAYS']
+    archived = OpportunityLifecycle.archive_inactive(older_than_days=days, batch_size=batch_size)
+    click.echo(f'Archived {archived} opportunities.')
+
+
+@click.command('run-scheduler')
+def run_scheduler_command():
+    """Run periodic maintenance jobs in the foreground (one instance per deployment)."""
+    from flask import current_app
+    from app.services.scheduler import create_scheduler
+
+    create_scheduler(current_app._get_current_object()).run_forever()
+
+
+@click.command('auto-apply')
+@click.option('--student-id', 'student_ids', type=int, multiple=True, help='Student to apply for (repeatable).')
+@click.option('--domain', default=None, help='Apply for every student in this domain.')
+@click.option('--all-students', is_flag=True, help='Apply for every student.')
+@click.option('--batch-size', default=500, show_default=True, help='Students per INSERT statement.')
+def auto_apply_command(student_ids, domain, all_students, batch_size):
+    """Apply a student cohort to all matching active opportunities."""
+    from app.services.auto_apply import AutoApplyEngine
+    from app.services.jobs import job_runner
+
+    if not student_ids and not domain and not all_students:
+        raise click.UsageError('Pass --student-id, --domain or --all-students.')
+
+    ids = list(student_ids) or AutoApplyEngine.cohort(domain)
+    result = job_runner.run_now('auto-apply', AutoApplyEngine.apply_students, ids, batch_size=batch_size)
+    click.echo(f'Processed {result["students"]} students, '
+               f'created {result["applications_created"]} applications.')
+
+
+@click.command('export')
+@click.argument('dataset', type=click.Choice(['opportunities', 'applications', 'leaderboard']))
+@click.option('--format', 'fmt', type=click.Choice(['ndjson', 'csv', 'parquet']), default='ndjson', show_default=True)
+@click.option('--output', '-o', default='-', help='Output file ("-" for stdout; required for parquet).')
+@click.option('--since', type=click.DateTime(), default=None, help='Only rows updated after this time.')
+@click.option('--chunk-size', default=1000, show_default=True, help='Rows fetched per cursor batch.')
+def export_command(dataset, fmt, output, since, chunk_size):
+    """Stream a dataset export to a file or stdout."""
+    from app.services.exporter import DataExporter
+
+    exporter = DataExporter(dataset, since=since, chunk_size=chunk_size)
+
+    if fmt == 'parquet':
+        if output == '-':
+            raise click.UsageError('Parquet export needs --output FILE.')
+        try:
+            rows = exporter.write_parquet(output)
+        except RuntimeError as e:
+            raise click.ClickException(str(e))
+        click.echo(f'Wrote {rows} rows to {output}', err=True)
+    else:
+        chunks = exporter.iter_ndjson() if fmt == 'ndjson' else exporter.iter_csv()
+        with click.open_file(output, 'w') as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+
+    if exporter.watermark:
+        click.echo(f'Watermark (use as --since next time): {exporter.watermark.isoformat()}', err=True)
+
+
+@click.command('import-opportunities')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl', 'json']), default=None,
+              help='File format (defaults to the file extension).')
+@click.option('--chunk-size', default=5000, show_default=True, help='Rows validated and inserted per batch.')
+@click.option('--show-errors', default=20, show_default=True, help='Row errors to print.')
+def import_opportunities_command(path, fmt, chunk_size, show_errors):
+    """Bulk import opportunities from a CSV, JSON Lines or JSON file."""
+    import os
+    import time
+    from app.services.importer import OpportunityImporter
+
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in OpportunityImporter.FORMATS:
+        raise click.UsageError('Cannot infer format from extension, pass --format.')
+
+    started = time.perf_counter()
+    report = OpportunityImporter(chunk_size=chunk_size).import_file(path, fmt)
+    elapsed = time.perf_counter() - started
+
+    click.echo(f'Read {report["rows"]} rows in {elapsed:.2f}s ({report["rows"] / max(elapsed, 1e-9):.0f} rows/s): '
+               f'{report["inserted"]} inserted, {report["duplicates"]} duplicates, {report["error_count"]} errors.')
+    for error in report['errors'][:show_errors]:
+        click.echo(f'  row {error["row"]}: {error["error"]}')
+
+
+@click.command('refresh-analytics')
+def refresh_analytics_command():
+    """Rebuild the analytics rollup tables from the base tables."""
+    from app.services.analytics import AnalyticsRollups
+
+    for table, rows in AnalyticsRollups.refresh().items():
+        click.echo(f'{table:>20}: {rows} rows')
+
+
+@click.command('purge')
+@click.argument('target', type=click.Choice(['user', 'post', 'opportunity']))
+@click.argument('object_id', type=int)
+@click.option('--batch-size', default=5000, show_default=True, help='Rows deleted per transaction.')
+def purge_command(target, object_id, batch_size):
+    """Delete a user, post or opportunity with all dependent rows in batches."""
+    from app.services.purge import BulkPurge
+
+    purge = BulkPurge(batch_size=batch_size)
+    click.echo(f'{BulkPurge.dependent_rows(target, object_id)} dependent rows')
+    result = purge.purge(target, object_id)
+    click.echo(f'Deleted {result["deleted"]} rows.')
+
+
+@click.command('profile-imports')
+@click.option('--limit', default=25, show_default=True, help='Modules and packages to list.')
+def profile_imports_command(limit):
+    """Show which imports a cold start of the app spends its time on."""
+    from app.services.startup import StartupProfiler
+
+    profile = StartupProfiler.import_profile(limit=limit)
+    click.echo(f'{"cumulative ms":>14} {"self ms":>9}  module')
+    for module in profile['modules']:
+        click.echo(f'{module["cumulative_ms"]:>14.1f} {module["self_ms"]:>9.1f}  '
+                   f'{"  " * module["depth"]}{module["module"]}')
+    click.echo(f'\n{"self ms":>14}  top-level package')
+    for package, self_ms in profile['packages']:
+        click.echo(f'{self_ms:>14.1f}  {package}')
+
+    boot = profile['boot']
+    click.echo(f'\nimport app: {boot["import_ms"]:.0f} ms, create_app(): {boot["create_app_ms"]:.0f} ms '
+               f'(with -X importtime overhead)')
+    if boot['lazy_loaded']:
+        click.echo(f'Loaded at startup but meant to be lazy: {", ".join(boot["lazy_loaded"])}')
+
+
+@click.command('bench-startup')
+@click.option('--runs', default=5, show_default=True, help='Fresh interpreters to time.')
+@click.option('--max-ms', type=float, default=None, help='Budget for the median cold start (default STARTUP_BUDGET_MS).')
+def bench_startup_command(runs, max_ms):
+    """Time cold starts and fail if they exceed the budget or load lazy dependencies."""
+    from flask import current_app
+    from app.services.startup import StartupProfiler
+
+    budget = max_ms if max_ms is not None else current_app.config['STARTUP_BUDGET_MS']
+    report = StartupProfiler.cold_start(runs=runs)
+    for key in ('import_ms', 'create_app_ms', 'total_ms'):
+        click.echo(f'{key:>14}: median {report[key]["median"]:>7.1f}  max {report[key]["max"]:>7.1f}')
+
+    if report['lazy_loaded']:
+        raise click.ClickException(f'Loaded at startup but meant to be lazy: {", ".join(report["lazy_loaded"])}')
+    if report['total_ms']['median'] > budget:
+        raise click.ClickException(f'Median cold start {report["total_ms"]["median"]:.0f} ms exceeds '
+                                   f'the {budget:.0f} ms budget')
+    click.echo(f'Within the {budget:.0f} ms budget.')
+
+
+@click.command('build-assets')
+def build_assets_command():
+    """Fingerprint, minify and precompress app/static into ASSETS_FOLDER."""
+    from app.services.assets import asset_pipeline
+
+    report = asset_pipeline.build()
+    click.echo(f'{"asset":<40} {"raw":>8} {"minified":>9} {"gzip":>8} {"brotli":>8}')
+    for asset in report:
+        click.echo(f'{asset["built"]:<40} {asset["raw"]:>8} {asset["minified"]:>9} '
+                   f'{asset["gz"]:>8} {asset.get("br", "-"):>8}')
+    click.echo(f'Wrote {asset_pipeline.folder}/manifest.json; restart the server to pick up the new build.')
+
+
+@click.command('build-catalog')
+def build_catalog_command():
+    """Rebuild the memory-mapped snapshot of active opportunities and report its size."""
+    from app.services.catalog import catalog
+
+    build = catalog.rebuild()
+    snapshot = catalog.snapshot()
+    click.echo(f'Wrote {build["rows"]} opportunities to {catalog.path} in {build["seconds"]:.2f}s.')
+    if snapshot is not None:
+        for key, value in snapshot.stats().items():
+            click.echo(f'{key:>26}: {value}')
+
+
+@click.command('send-reminders')
+@click.option('--hours', type=float, default=None, help='Lead time before the deadline (default DEADLINE_REMINDER_HOURS).')
+def send_reminders_command(hours):
+    """Send deadline reminders that are due now (the scheduler does this every minute)."""
+    from flask import current_app
+    from app.services.reminders import DeadlineReminders
+
+    hours = hours if hours is not None else current_app.config['DEADLINE_REMINDER_HOURS']
+    result = DeadlineReminders(lead_hours=hours).run_due()
+    click.echo(f'Sent {result["reminders"]} reminders for {result["due"]} opportunities '
+               f'({result["rows_read"]} opportunity rows read).')
+
+
+@click.command('snapshot-leaderboard')
+@click.option('--prune/--no-prune', default=True, show_default=True, help='Thin out and expire old snapshots.')
+def snapshot_leaderboard_command(prune):
+    """Record the current leaderboard standings overall and per domain."""
+    from flask import current_app
+    from app.services.leaderboard import LeaderboardHistory
+
+    stats = LeaderboardHistory.snapshot()
+    click.echo(f'Snapshot of {stats["users"]} students in {stats["snapshots"]} rankings: '
+               f'{stats["bytes"]} bytes ({stats["bytes"] / max(stats["users"], 1):.2f} per student), '
+               f'{stats["seconds"]:.2f}s.')
+    if prune:
+        pruned = LeaderboardHistory.prune(current_app.config['LEADERBOARD_KEEP_HOURLY_DAYS'],
+                                          current_app.config['LEADERBOARD_RETENTION_DAYS'])
+        click.echo(f'Pruned {pruned} old snapshots.')
+
+
+@click.command('bench-login')
+@click.option('--threads', type=int, default=None, help='Concurrent logins (default: available cores).')
+@click.option('--duration', default=5.0, show_default=True, help='Seconds per measurement.')
+@click.option('--password', default=None, help='Password of the seeded users.')
+def bench_login_command(threads, duration, password):
+    """Measure password verifications and logins per second per core."""
+    from flask import current_app
+    from app import db
+    from app.models.user import User
+    from app.services.passwords import PasswordHasher, available_cores, password_hasher
+    from app.services.seeder import DataSeeder
+
+    cores = available_cores()
+    threads = threads or cores
+    click.echo(f'Method {password_hasher.prefix}, {cores} cores, '
+               f'PASSWORD_HASH_WORKERS={password_hasher.workers}.')
+
+    sample = password_hasher.hash('benchmark')
+    for count in sorted({1, threads}):
+        rate = PasswordHasher.measure_verify(sample, 'benchmark', count, duration)
+        click.echo(f'verify   {count:>3} threads: {rate:>8.1f}/s  {rate / min(count, cores):>8.1f}/s per core')
+
+    usernames = db.session.query(User.username)\
+        .filter(User.username.like(f'{DataSeeder.USERNAME_PREFIX}%'))\
+        .limit(max(threads * 4, 100)).all()
+    if not usernames:
+        click.echo('No seeded users; run "flask seed" to benchmark the login route.')
+        return
+    password = password or DataSeeder.DEFAULT_PASSWORD
+    report = PasswordHasher.measure_logins(current_app._get_current_object(),
+                                           [(row[0], password) for row in usernames], threads, duration)
+    used = min(threads, cores, password_hasher.workers)
+    click.echo(f'POST /login {threads:>3} threads: {report["per_second"]:>8.1f}/s  '
+               f'{report["per_second"] / used:>8.1f}/s per hashing core  '
+               f'p50 {report["p50_ms"]} ms  p95 {report["p95_ms"]} ms  '
+               f'({report["rejected"]} shed with 503, {report["failed"]} failed)')
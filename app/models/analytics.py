@@ -0,0 +1,59 @@
+"""
+Analytics Models - Precomputed rollups read by the analytics API
+Dimension columns use '' instead of NULL so the unique constraints hold.
+"""
+from app import db
+
+
+class OpportunityRollup(db.Model):
+    """Opportunity counts per domain, university, category and extraction day."""
+    __tablename__ = 'opportunity_rollups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    domain = db.Column(db.String(50), nullable=False, default='')
+    university = db.Column(db.String(100), nullable=False, default='')
+    category = db.Column(db.String(50), nullable=False, default='')
+    day = db.Column(db.Date, nullable=False)  # Date of extracted_at
+
+    total = db.Column(db.Integer, nullable=False, default=0)
+    active = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint('domain', 'university', 'category', 'day', name='unique_opportunity_rollup'),
+        db.Index('ix_opportunity_rollups_day', 'day'),
+    )
+
+    def __repr__(self) -> str:
+        return f'<OpportunityRollup {self.domain}/{self.university}/{self.category} {self.day}>'
+
+
+class ApplicationRollup(db.Model):
+    """Application counts per status."""
+    __tablename__ = 'application_rollups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default='')
+
+    total = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.UniqueConstraint('status', name='unique_application_rollup'),)
+
+    def __repr__(self) -> str:
+        return f'<ApplicationRollup {self.status}>'
+
+
+class CommunityRollup(db.Model):
+    """Post, like and comment counts per domain."""
+    __tablename__ = 'community_rollups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    domain = db.Column(db.String(50), nullable=False, default='')
+
+    posts = db.Column(db.Integer, nullable=False, default=0)
+    likes = db.Column(db.Integer, nullable=False, default=0)
+    comments = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.UniqueConstraint('domain', name='unique_community_rollup'),)
+
+    def __repr__(self) -> str:
+        return f'<CommunityRollup {self.domain}>'
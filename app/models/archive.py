@@ -0,0 +1,44 @@
+"""
+Archive Models - Cold storage for long-inactive opportunities and their applications
+"""
+from app import db
+from datetime import datetime
+
+
+class ArchivedOpportunity(db.Model):
+    """Opportunity moved out of the hot ``opportunities`` table."""
+    __tablename__ = 'archived_opportunities'
+
+    id = db.Column(db.Integer, primary_key=True)  # Original opportunity ID
+    title = db.Column(db.String(255), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    university = db.Column(db.String(100))
+    domain = db.Column(db.String(50))
+    category = db.Column(db.String(50))
+    deadline = db.Column(db.DateTime)
+    url = db.Column(db.String(500))
+    requirements = db.Column(db.Text)
+    location = db.Column(db.String(100))
+    is_active = db.Column(db.Boolean, default=False)
+    created_by = db.Column(db.Integer)
+    extracted_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f'<ArchivedOpportunity {self.title}>'
+
+
+class ArchivedApplication(db.Model):
+    """Application history of an archived opportunity."""
+    __tablename__ = 'archived_applications'
+
+    id = db.Column(db.Integer, primary_key=True)  # Original application ID
+    student_id = db.Column(db.Integer, nullable=False, index=True)
+    opportunity_id = db.Column(db.Integer, nullable=False, index=True)
+    status = db.Column(db.String(20))
+    submitted_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f'<ArchivedApplication {self.id}>'
@@ -3,6 +3,7 @@ Community Models - Academic Social Network (Posts, Comments, Likes)
 """
 from app import db
 from datetime import datetime
+import math
 
 
 class Post(db.Model):
@@ -10,7 +11,7 @@ class Post(db.Model):
     __tablename__ = 'posts'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
     domain = db.Column(db.String(50))  # AI, Law, etc.
@@ -18,13 +19,41 @@ class Post(db.Model):
     # Engagement metrics
     likes_count = db.Column(db.Integer, default=0)
     comments_count = db.Column(db.Integer, default=0)
+    hot_score = db.Column(db.Float, default=0.0, index=True)  # See hot_score_for()
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    comments = db.relationship('Comment', backref='post', lazy=True, cascade='all, delete-orphan')
-    likes = db.relationship('Like', backref='post', lazy=True, cascade='all, delete-orphan')
+    # Children are removed by ON DELETE CASCADE (passive_deletes), not loaded and deleted one by one
+    comments = db.relationship('Comment', backref='post', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    likes = db.relationship('Like', backref='post', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    
+    # Hot feed per domain is an index range scan
+    __table_args__ = (db.Index('ix_posts_domain_hot_score', 'domain', 'hot_score'),)
+    
+    # A post needs 10x the engagement to outrank one created this much later
+    HOT_SCORE_DECAY_SECONDS = 12 * 60 * 60
+    HOT_SCORE_EPOCH = datetime(2024, 1, 1)
+    COMMENT_WEIGHT = 2
+    
+    @classmethod
+    def hot_score_for(cls, likes_count: int, comments_count: int, created_at: datetime) -> float:
+        """
+        Time-decayed popularity score.
+        
+        Decay is encoded as a bonus for newer posts rather than a penalty that grows
+        with age, so a stored score only changes when engagement does.
+        """
+        engagement = max((likes_count or 0) + cls.COMMENT_WEIGHT * (comments_count or 0), 0)
+        age_bonus = (created_at - cls.HOT_SCORE_EPOCH).total_seconds() / cls.HOT_SCORE_DECAY_SECONDS
+        return math.log10(1 + engagement) + age_bonus
+    
+    def refresh_hot_score(self) -> None:
+        """Recompute ``hot_score`` after a like, unlike or comment."""
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+        self.hot_score = self.hot_score_for(self.likes_count, self.comments_count, self.created_at)
     
     def __repr__(self) -> str:
         return f'<Post {self.title}>'
@@ -35,8 +64,8 @@ class Comment(db.Model):
     __tablename__ = 'comments'
     
     id = db.Column(db.Integer, primary_key=True)
-    post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    post_id = db.Column(db.Integer, db.ForeignKey('posts.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -49,8 +78,8 @@ class Like(db.Model):
     __tablename__ = 'likes'
     
     id = db.Column(db.Integer, primary_key=True)
-    post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    post_id = db.Column(db.Integer, db.ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Unique constraint: one user can like a post only once
@@ -0,0 +1,40 @@
+"""
+Job Model - Status and progress of background jobs
+"""
+from app import db
+from datetime import datetime
+import json
+
+
+class Job(db.Model):
+    """Background job record, shared by all worker processes."""
+    __tablename__ = 'jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.String(20), default='queued')  # queued, running, finished, failed
+    progress = db.Column(db.Integer, default=0)
+    total = db.Column(db.Integer, default=0)
+    result = db.Column(db.Text)  # JSON
+    error = db.Column(db.Text)
+
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self) -> dict:
+        """Serialize job status for the API."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'progress': self.progress,
+            'total': self.total,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return f'<Job {self.name} {self.status}>'
@@ -0,0 +1,39 @@
+"""
+Leaderboard Snapshot Model - Periodic InCoScore standings for rank-change history
+"""
+from app import db
+from datetime import datetime
+
+
+class LeaderboardSnapshot(db.Model):
+    """
+    Standings of one domain at one point in time.
+
+    ``data`` holds the (user_id, rank, score) columns in the compact block format of
+    ``app.services.leaderboard``; ``domain`` is '' for the overall leaderboard.
+    """
+    __tablename__ = 'leaderboard_snapshots'
+
+    id = db.Column(db.Integer, primary_key=True)
+    taken_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    domain = db.Column(db.String(50), nullable=False, default='')
+    users = db.Column(db.Integer, nullable=False, default=0)
+    size = db.Column(db.Integer, nullable=False, default=0)  # Bytes of data
+    data = db.deferred(db.Column(db.LargeBinary, nullable=False))  # Loaded only when decoded
+
+    __table_args__ = (
+        db.UniqueConstraint('domain', 'taken_at', name='unique_leaderboard_snapshot'),
+        db.Index('ix_leaderboard_snapshots_taken_at', 'taken_at'),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'domain': self.domain or None,
+            'taken_at': self.taken_at.isoformat() if self.taken_at else None,
+            'users': self.users,
+            'bytes': self.size,
+        }
+
+    def __repr__(self) -> str:
+        return f'<LeaderboardSnapshot {self.domain or "all"} {self.taken_at}>'
@@ -0,0 +1,58 @@
+"""
+Notification Models - New-opportunity alerts and periodic digests
+"""
+from app import db
+from datetime import datetime
+
+
+class Notification(db.Model):
+    """A coalesced alert for one user, e.g. "5 new opportunities in Law"."""
+    __tablename__ = 'notifications'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String(30), nullable=False, default='new_opportunities')
+    domain = db.Column(db.String(50))
+    # Newest opportunity of the group; together with kind it makes fan-out idempotent
+    opportunity_id = db.Column(db.Integer, db.ForeignKey('opportunities.id', ondelete='CASCADE'), index=True)
+    item_count = db.Column(db.Integer, default=1)
+    digest_id = db.Column(db.Integer, db.ForeignKey('digests.id', ondelete='SET NULL'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'opportunity_id', 'kind', name='unique_notification'),
+        db.Index('ix_notifications_digest_user', 'digest_id', 'user_id'),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'domain': self.domain,
+            'opportunity_id': self.opportunity_id,
+            'item_count': self.item_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return f'<Notification {self.kind} user={self.user_id}>'
+
+
+class Digest(db.Model):
+    """Periodic roll-up of a user's pending notifications."""
+    __tablename__ = 'digests'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    item_count = db.Column(db.Integer, default=0)
+    is_read = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    notifications = db.relationship('Notification', backref='digest', lazy=True, passive_deletes=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'created_at', name='unique_digest'),
+    )
+
+    def __repr__(self) -> str:
+        return f'<Digest user={self.user_id} items={self.item_count}>'
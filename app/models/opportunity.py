@@ -2,7 +2,7 @@
 Opportunity Model - Stores extracted opportunities from Ivy League universities
 """
 from app import db
-from datetime import datetime
+from datetime import datetime, time, timedelta
 
 
 class Opportunity(db.Model):
@@ -10,7 +10,7 @@ class Opportunity(db.Model):
     __tablename__ = 'opportunities'
     
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(255), nullable=False)
+    title = db.Column(db.String(255), nullable=False, index=True)
     description = db.Column(db.Text, nullable=False)
     university = db.Column(db.String(100))  # Harvard, MIT, Yale, etc.
     
@@ -24,20 +24,42 @@ class Opportunity(db.Model):
     requirements = db.Column(db.Text)
     location = db.Column(db.String(100))
     is_active = db.Column(db.Boolean, default=True)
+    content_hash = db.Column(db.String(40))  # Of the scraped source fields; see OpportunityHistory
     
     # Track who created this opportunity (for user-generated opportunities)
-    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True)
     
     # Timestamps
     extracted_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
-    applications = db.relationship('Application', backref='opportunity', lazy=True, cascade='all, delete-orphan')
-    creator = db.relationship('User', backref='created_opportunities', foreign_keys=[created_by])
+    applications = db.relationship('Application', backref='opportunity', lazy=True, cascade='all, delete-orphan',
+                                   passive_deletes=True)
+    creator = db.relationship('User', backref=db.backref('created_opportunities', passive_deletes=True),
+                              foreign_keys=[created_by])
+    
+    # Indexes for the expiry and archival jobs
+    __table_args__ = (
+        db.Index('ix_opportunities_active_deadline', 'is_active', 'deadline'),
+        db.Index('ix_opportunities_active_updated', 'is_active', 'updated_at'),
+        db.Index('ix_opportunities_url', 'url'),  # Matches re-scraped events whose title changed
+    )
     
     def __repr__(self) -> str:
         return f'<Opportunity {self.title}>'
+    
+    # Deadlines are entered as dates (stored at midnight): an opportunity stays open
+    # through the whole deadline day
+    @staticmethod
+    def closes_at(deadline: datetime) -> datetime:
+        """Moment an opportunity with this deadline closes (the start of the next day)."""
+        return datetime.combine(deadline.date(), time.min) + timedelta(days=1)
+    
+    @staticmethod
+    def open_deadline_from(now: datetime) -> datetime:
+        """Deadlines at or after this value are still open at ``now`` (the start of today)."""
+        return datetime.combine(now.date(), time.min)
 
 
 class Application(db.Model):
@@ -45,11 +67,39 @@ class Application(db.Model):
     __tablename__ = 'applications'
     
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    opportunity_id = db.Column(db.Integer, db.ForeignKey('opportunities.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    opportunity_id = db.Column(db.Integer, db.ForeignKey('opportunities.id', ondelete='CASCADE'), nullable=False, index=True)
     
     status = db.Column(db.String(20), default='pending')  # pending, submitted, accepted, rejected
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    # Unique constraint: one application per student per opportunity
+    __table_args__ = (db.UniqueConstraint('student_id', 'opportunity_id', name='unique_application'),)
     
     def __repr__(self) -> str:
         return f'<Application {self.id}>'
+
+
+class OpportunityChange(db.Model):
+    """
+    Append-only log entry: the fields of one opportunity that changed at one time.
+    
+    ``delta`` is zlib-compressed JSON ``{field: [old, new]}`` of the changed fields only.
+    The auto-increment id is the cursor for incremental consumers. There is no foreign
+    key, so the history outlives archived or purged opportunities.
+    """
+    __tablename__ = 'opportunity_changes'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    opportunity_id = db.Column(db.Integer, nullable=False)
+    kind = db.Column(db.String(10), nullable=False, default='updated')  # created, updated
+    fields = db.Column(db.String(255), nullable=False)  # Comma-separated changed fields
+    content_hash = db.Column(db.String(40))  # Opportunity.content_hash after the change
+    delta = db.Column(db.LargeBinary, nullable=False)
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    __table_args__ = (db.Index('ix_opportunity_changes_opportunity', 'opportunity_id', 'id'),)
+    
+    def __repr__(self) -> str:
+        return f'<OpportunityChange {self.kind} opportunity={self.opportunity_id}>'
@@ -0,0 +1,19 @@
+"""
+Resume Model - Cached skill extraction results keyed by file content
+"""
+from app import db
+from datetime import datetime
+
+
+class ResumeExtraction(db.Model):
+    """Parsed skills/interests of a resume, shared by every upload with the same content."""
+    __tablename__ = 'resume_extractions'
+
+    content_hash = db.Column(db.String(64), primary_key=True)  # SHA-256 of the PDF bytes
+    skills = db.Column(db.Text)  # Comma-separated
+    interests = db.Column(db.Text)  # Comma-separated
+    pages = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f'<ResumeExtraction {self.content_hash[:12]}>'
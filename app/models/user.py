@@ -1,16 +1,38 @@
 """
 User Model - Student Profile & Authentication
 """
-from app import db, login_manager
+from app import db, login_manager, user_cache
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached, validates
+from app.services.passwords import password_hasher
 from datetime import datetime
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Load user by ID for Flask-Login."""
-    return User.query.get(int(user_id))
+    """
+    Load user by ID for Flask-Login.
+    
+    Only the slim session projection is fetched (and cached per process for a
+    short TTL). The returned instance is attached to the session without a query;
+    the remaining columns (skills, interests, ...) are loaded lazily on first access.
+    """
+    user_id = int(user_id)
+    columns = user_cache.get(user_id)
+    
+    if columns is None:
+        row = db.session.execute(
+            select(*[getattr(User, name) for name in User.SESSION_COLUMNS]).where(User.id == user_id)
+        ).mappings().first()
+        if row is None:
+            return None
+        columns = dict(row)
+        user_cache.set(user_id, columns)
+    
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
 
 
 class User(UserMixin, db.Model):
@@ -24,9 +46,9 @@ class User(UserMixin, db.Model):
     full_name = db.Column(db.String(100))
     
     # Student Profile Information
-    domain = db.Column(db.String(50))  # AI, Law, Engineering, etc.
+    domain = db.Column(db.String(50), index=True)  # AI, Law, Engineering, etc.
     skills = db.Column(db.Text)  # Comma-separated skills
-    interests = db.Column(db.Text)  # Student interests
+    interests = db.Column(db.Text)  # Comma-separated, no spaces around commas (see normalize_list)
     academic_background = db.Column(db.Text)
     resume_path = db.Column(db.String(255))
     
@@ -40,20 +62,42 @@ class User(UserMixin, db.Model):
     
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
-    posts = db.relationship('Post', backref='author', lazy=True, cascade='all, delete-orphan')
-    comments = db.relationship('Comment', backref='author', lazy=True, cascade='all, delete-orphan')
-    applications = db.relationship('Application', backref='student', lazy=True, cascade='all, delete-orphan')
+    # Children are removed by ON DELETE CASCADE (passive_deletes); see BulkPurge for large accounts
+    posts = db.relationship('Post', backref='author', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    comments = db.relationship('Comment', backref='author', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    applications = db.relationship('Application', backref='student', lazy=True, cascade='all, delete-orphan',
+                                   passive_deletes=True)
+    
+    # Columns cached for the logged-in principal; large text columns and the
+    # password hash are excluded and load on demand
+    SESSION_COLUMNS = (
+        'id', 'username', 'email', 'full_name', 'domain', 'resume_path',
+        'hackathons_count', 'internships_count', 'research_papers_count',
+        'coding_score', 'competition_wins', 'incoscore', 'created_at', 'updated_at',
+    )
+    
+    @staticmethod
+    def normalize_list(value):
+        """Rejoin comma- or line-separated free text as ``a,b`` with each entry stripped."""
+        if value is None:
+            return None
+        return ','.join(entry.strip() for entry in value.replace('\n', ',').split(',') if entry.strip())
+    
+    @validates('interests')
+    def _normalize_interests(self, key, value):
+        # Notification fan-out matches whole entries with ',' || interests || ','
+        return self.normalize_list(value)
     
     def set_password(self, password: str) -> None:
-        """Hash and set the user password."""
-        self.password_hash = generate_password_hash(password)
+        """Hash and set the user password (on the hashing pool; may raise HasherBusy)."""
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password: str) -> bool:
-        """Check if the provided password matches the hash."""
-        return check_password_hash(self.password_hash, password)
+        """Check if the provided password matches the hash (may raise HasherBusy)."""
+        return password_hasher.verify(self.password_hash, password)
     
     def calculate_incoscore(self) -> float:
         """
@@ -0,0 +1,77 @@
+"""
+Analytics Routes
+Aggregate counts served from the precomputed rollup tables (JSON)
+"""
+from datetime import date
+from flask import Blueprint, jsonify, request
+from flask_login import login_required
+from app.models.analytics import OpportunityRollup
+from app.services.analytics import ROLLUPS, AnalyticsRollups
+
+bp = Blueprint('analytics', __name__, url_prefix='/analytics')
+
+OPPORTUNITY_DIMENSIONS = ROLLUPS[OpportunityRollup][0]
+
+
+@bp.route('/')
+@login_required
+def summary():
+    """Headline totals for opportunities, applications and the community."""
+    opportunities = AnalyticsRollups.opportunities(group_by=[])
+    applications = AnalyticsRollups.applications()
+    community = AnalyticsRollups.community()
+
+    return jsonify({
+        'opportunities': opportunities[0] if opportunities else {'total': 0, 'active': 0},
+        'applications': {
+            'total': sum(row['total'] for row in applications),
+            'by_status': applications,
+        },
+        'community': {
+            'posts': sum(row['posts'] for row in community),
+            'likes': sum(row['likes'] for row in community),
+            'comments': sum(row['comments'] for row in community),
+        },
+    })
+
+
+@bp.route('/opportunities')
+@login_required
+def opportunities():
+    """
+    Opportunity counts.
+
+    Query parameters:
+        group_by: Comma-separated dimensions (domain, university, category, day); default domain
+        since / until: Extraction day range (YYYY-MM-DD), inclusive
+        domain: Restrict to one domain
+    """
+    group_by = [name for name in request.args.get('group_by', 'domain').split(',') if name]
+    unknown = [name for name in group_by if name not in OPPORTUNITY_DIMENSIONS]
+    if unknown:
+        return jsonify({'error': f'Unknown dimension: {", ".join(unknown)}',
+                        'dimensions': OPPORTUNITY_DIMENSIONS}), 400
+
+    try:
+        since = date.fromisoformat(request.args['since']) if request.args.get('since') else None
+        until = date.fromisoformat(request.args['until']) if request.args.get('until') else None
+    except ValueError:
+        return jsonify({'error': 'Invalid date, use YYYY-MM-DD'}), 400
+
+    rows = AnalyticsRollups.opportunities(group_by, since=since, until=until,
+                                          domain=request.args.get('domain'))
+    return jsonify({'group_by': group_by, 'rows': rows})
+
+
+@bp.route('/applications')
+@login_required
+def applications():
+    """Application counts per status."""
+    return jsonify({'rows': AnalyticsRollups.applications()})
+
+
+@bp.route('/community')
+@login_required
+def community():
+    """Post, like and comment counts per domain."""
+    return jsonify({'rows': AnalyticsRollups.community()})
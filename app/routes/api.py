@@ -0,0 +1,90 @@
+"""
+API Routes - Versioned JSON API (/api/v1)
+Opportunities, the current user's applications, community posts and the leaderboard,
+with sparse fieldsets (?fields=), id batches (?ids=) and ETag revalidation.
+"""
+import hashlib
+
+from flask import Blueprint, current_app, request
+from flask_login import current_user
+from app.services.api import RESOURCES, dumps
+
+bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+
+def _respond(payload, status: int = 200):
+    """Serialize a payload with a strong ETag; a matching If-None-Match gets 304."""
+    body = dumps(payload)
+    response = current_app.response_class(body, status=status, mimetype='application/json')
+    if status == 200:
+        response.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+        response.headers['Cache-Control'] = 'private, no-cache'  # Revalidate every time
+        response.make_conditional(request)
+    return response
+
+
+def _error(message: str, status: int = 400, **extra):
+    return _respond({'error': message, **extra}, status)
+
+
+@bp.before_request
+def _require_login():
+    """Clients get a JSON ``401`` instead of the login page redirect."""
+    if not current_user.is_authenticated:
+        return _error('Authentication required', 401)
+
+
+@bp.route('/<resource>')
+def list_resource(resource):
+    """
+    List a resource.
+
+    Query parameters:
+        fields: Comma-separated columns (default a compact set; ``id`` is always included)
+        ids: Comma-separated ids to fetch in one request, returned in that order
+        limit: Page size (default ``API_PAGE_SIZE``)
+        before: Next page of opportunities, applications and posts (newest first)
+        offset: Next page of the leaderboard (highest InCoScore first)
+        Resource filters, e.g. domain, category, university, active, status, user_id
+    """
+    spec = RESOURCES.get(resource)
+    if spec is None:
+        return _error(f'Unknown resource {resource}', 404, resources=sorted(RESOURCES))
+
+    try:
+        fields = spec.select_fields(request.args.get('fields'))
+    except ValueError as e:
+        return _error(str(e), fields=list(spec.fields))
+
+    try:
+        limit = min(int(request.args.get('limit', current_app.config['API_PAGE_SIZE'])),
+                    current_app.config['API_MAX_PAGE_SIZE'])
+        if request.args.get('ids'):
+            ids = [int(value) for value in request.args['ids'].split(',') if value.strip()]
+            if len(ids) > current_app.config['API_MAX_BATCH_IDS']:
+                return _error(f'At most {current_app.config["API_MAX_BATCH_IDS"]} ids per request')
+            rows, missing = spec.batch(fields, ids, request.args, user_id=current_user.id)
+            return _respond({'data': rows, 'missing': missing})
+        if limit <= 0:
+            return _error('limit must be positive')
+        rows, paging = spec.page(fields, request.args, limit, user_id=current_user.id)
+    except ValueError as e:
+        return _error(str(e))
+    return _respond({'data': rows, 'next': paging})
+
+
+@bp.route('/<resource>/<int:id>')
+def get_resource(resource, id):
+    """One item of a resource; ``?fields=`` selects its columns."""
+    spec = RESOURCES.get(resource)
+    if spec is None:
+        return _error(f'Unknown resource {resource}', 404, resources=sorted(RESOURCES))
+    try:
+        fields = spec.select_fields(request.args.get('fields'))
+    except ValueError as e:
+        return _error(str(e), fields=list(spec.fields))
+
+    rows, _ = spec.batch(fields, [id], {}, user_id=current_user.id)
+    if not rows:
+        return _error(f'{resource} {id} not found', 404)
+    return _respond({'data': rows[0]})
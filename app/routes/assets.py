@@ -0,0 +1,37 @@
+"""
+Asset Routes
+Serves the fingerprinted build of app/static with far-future immutable caching (no login)
+"""
+import mimetypes
+import os
+from flask import Blueprint, abort, current_app, request, send_from_directory
+from app.services.assets import MANIFEST_NAME
+
+bp = Blueprint('assets', __name__, url_prefix='/assets')
+
+# Content-Encoding -> file suffix, best first
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+@bp.route('/<path:filename>')
+def serve(filename):
+    """Serve a built asset, precompressed in the best encoding the client accepts."""
+    folder = current_app.config['ASSETS_FOLDER']
+    if filename == MANIFEST_NAME or filename.endswith(('.gz', '.br')):
+        abort(404)
+
+    for encoding, suffix in ENCODINGS:
+        if request.accept_encodings.quality(encoding) and os.path.isfile(os.path.join(folder, filename + suffix)):
+            # Mimetype of the original file, not of the .br/.gz variant
+            response = send_from_directory(folder, filename + suffix, max_age=31536000,
+                                           mimetype=mimetypes.guess_type(filename)[0])
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(folder, filename, max_age=31536000)
+
+    response.headers['Cache-Control'] = IMMUTABLE
+    response.vary.add('Accept-Encoding')
+    return response
+
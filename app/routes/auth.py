@@ -1,10 +1,13 @@
 """
 Authentication Routes - User Registration & Login
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, make_response
 from flask_login import login_user, logout_user, login_required, current_user
-from app import db
+from sqlalchemy import or_, select
+from app import db, user_cache
 from app.models.user import User
+from app.services.passwords import HasherBusy, password_hasher
+from app.services.skill_index import skill_index
 
 bp = Blueprint('auth', __name__)
 
@@ -15,6 +18,14 @@ def index():
     return render_template('index.html')
 
 
+def _busy(template: str):
+    """503 with Retry-After when the password hashing pool is saturated."""
+    flash('Too many sign-ins right now, please try again in a few seconds.', 'error')
+    response = make_response(render_template(template), 503)
+    response.headers['Retry-After'] = str(current_app.config['PASSWORD_HASH_RETRY_AFTER'])
+    return response
+
+
 @bp.route('/register', methods=['GET', 'POST'])
 def register():
     """Student registration."""
@@ -30,12 +41,15 @@ def register():
             flash('All fields are required', 'error')
             return redirect(url_for('auth.register'))
         
-        # Check if user exists
-        if User.query.filter_by(username=username).first():
+        # Check if user exists (username and email in one query)
+        taken = db.session.execute(
+            select(User.username, User.email).where(or_(User.username == username, User.email == email)).limit(2)
+        ).all()
+        if any(row.username == username for row in taken):
             flash('Username already exists', 'error')
             return redirect(url_for('auth.register'))
         
-        if User.query.filter_by(email=email).first():
+        if taken:
             flash('Email already registered', 'error')
             return redirect(url_for('auth.register'))
         
@@ -46,7 +60,10 @@ def register():
             full_name=full_name,
             domain=domain
         )
-        user.set_password(password)
+        try:
+            user.set_password(password)
+        except HasherBusy:
+            return _busy('register.html')
         
         try:
             db.session.add(user)
@@ -79,7 +96,13 @@ def login():
         # Check if user exists and password verification
         if user:
             # User exists, now check password
-            if user.check_password(password):
+            try:
+                valid = user.check_password(password)
+            except HasherBusy:
+                return _busy('login.html')
+            if valid:
+                if password_hasher.needs_rehash(user.password_hash):
+                    password_hasher.rehash_later(user.id, user.password_hash, password)
                 login_user(user)
                 flash('Login successful!', 'success')
                 return redirect(url_for('opportunities.dashboard'))
@@ -95,6 +118,7 @@ def login():
 @login_required
 def logout():
     """Logout user."""
+    user_cache.invalidate(current_user.id)
     logout_user()
     flash('Logged out successfully', 'success')
     return redirect(url_for('auth.index'))
@@ -127,6 +151,41 @@ def update_profile():
     # Recalculate InCoScore
     current_user.calculate_incoscore()
     
+    user_id = current_user.id
     db.session.commit()
+    user_cache.invalidate(user_id)
+    skill_index.update_user(current_user)
     flash('Profile updated successfully!', 'success')
     return redirect(url_for('auth.profile'))
+
+
+@bp.route('/profile/resume', methods=['POST'])
+@login_required
+def upload_resume():
+    """Upload a PDF resume; skills and interests are extracted in the background."""
+    from app.services.jobs import job_runner
+    from app.services.resumes import ResumePipeline
+    
+    resume = request.files.get('resume')
+    if not resume or not resume.filename.lower().endswith('.pdf'):
+        flash('Please upload a PDF resume', 'error')
+        return redirect(url_for('auth.profile'))
+    
+    path, content_hash = ResumePipeline.store_upload(resume, current_app.config['RESUME_UPLOAD_FOLDER'])
+    
+    user_id = current_user.id
+    current_user.resume_path = path
+    db.session.commit()
+    user_cache.invalidate(user_id)
+    
+    # Identical content was parsed before: apply the cached result right away
+    extraction = ResumePipeline.cached_result(content_hash)
+    if extraction is not None:
+        ResumePipeline.apply_to_user(user_id, extraction)
+        flash('Resume uploaded and your skills were updated!', 'success')
+    else:
+        job_runner.submit('resume-parse', ResumePipeline.process, user_id, path, content_hash,
+                          created_by=user_id)
+        flash('Resume uploaded! Your skills will be extracted in the background.', 'success')
+    
+    return redirect(url_for('auth.profile'))
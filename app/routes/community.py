@@ -2,20 +2,64 @@
 Community Routes - Module 5
 Academic Social Network with Posts, Comments, Likes, Groups
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from datetime import datetime, timedelta
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
 from app import db
 from app.models.community import Post, Comment, Like, Group
+from app.services.events import event_broker
+from app.services.timeline import summarize, summary_query, timeline_cache, to_summaries
 
 bp = Blueprint('community', __name__, url_prefix='/community')
 
+FEED_WINDOWS = {'day': 1, 'week': 7, 'month': 30}
+
+
+def _feed(domain=None):
+    """
+    Build one page of the post feed from the ``sort`` (new, hot), ``window``
+    (day, week, month) and ``page`` query args.
+    
+    The default feed (newest first, no window) is served from the in-memory
+    timeline cache; other orderings and pages beyond the buffer query the database.
+    
+    Returns:
+        Template context with posts (summaries), sort, window, page and has_next
+    """
+    sort = request.args.get('sort', 'new')
+    window = request.args.get('window')
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = current_app.config['COMMUNITY_PAGE_SIZE']
+    if sort != 'hot':
+        sort = 'new'
+    if window not in FEED_WINDOWS:
+        window = None
+    
+    cached = timeline_cache.page(domain, page, per_page) if sort == 'new' and not window else None
+    if cached is not None:
+        posts, has_next = cached
+    else:
+        stmt = summary_query()
+        if domain:
+            stmt = stmt.where(Post.domain == domain)
+        if window:
+            stmt = stmt.where(Post.created_at >= datetime.utcnow() - timedelta(days=FEED_WINDOWS[window]))
+        if sort == 'hot':
+            stmt = stmt.order_by(Post.hot_score.desc())
+        else:
+            stmt = stmt.order_by(Post.created_at.desc(), Post.id.desc())
+        posts = to_summaries(db.session.execute(stmt.offset((page - 1) * per_page).limit(per_page + 1)))
+        has_next = len(posts) > per_page
+        posts = posts[:per_page]
+    
+    return {'posts': posts, 'sort': sort, 'window': window, 'page': page, 'has_next': has_next}
+
 
 @bp.route('/')
 @login_required
 def index():
     """Community home page with all posts."""
-    posts = Post.query.order_by(Post.created_at.desc()).all()
-    return render_template('community.html', posts=posts)
+    return render_template('community.html', **_feed())
 
 
 @bp.route('/post/create', methods=['GET', 'POST'])
@@ -31,11 +75,15 @@ def create_post():
             user_id=current_user.id,
             title=title,
             content=content,
-            domain=domain
+            domain=domain,
+            likes_count=0,
+            comments_count=0
         )
+        post.refresh_hot_score()
         
         db.session.add(post)
         db.session.commit()
+        timeline_cache.push(summarize(post, current_user.full_name))
         
         flash('Post created successfully!', 'success')
         return redirect(url_for('community.index'))
@@ -66,9 +114,12 @@ def add_comment(id):
         )
         
         post.comments_count += 1
+        post.refresh_hot_score()
         
         db.session.add(comment)
         db.session.commit()
+        timeline_cache.update_counts(post)
+        event_broker.post_counts(post)
         
         flash('Comment added!', 'success')
     
@@ -102,7 +153,10 @@ def like_post(id):
         post.likes_count += 1
         message = 'Post liked!'
     
+    post.refresh_hot_score()
     db.session.commit()
+    timeline_cache.update_counts(post)
+    event_broker.post_counts(post)
     
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return jsonify({'success': True, 'likes': post.likes_count})
@@ -111,6 +165,24 @@ def like_post(id):
     return redirect(url_for('community.view_post', id=id))
 
 
+@bp.route('/post/<int:id>/delete', methods=['POST'])
+@login_required
+def delete_post(id):
+    """Delete a post (author only); posts with heavy engagement are purged in the background."""
+    from app.services.purge import purge_or_schedule
+    
+    post = Post.query.get_or_404(id)
+    if post.user_id != current_user.id:
+        flash('You can only delete your own posts!', 'error')
+        return redirect(url_for('community.view_post', id=id))
+    
+    if purge_or_schedule('post', id, created_by=current_user.id) is None:
+        flash('Post deleted.', 'success')
+    else:
+        flash('Post is being deleted in the background.', 'success')
+    return redirect(url_for('community.index'))
+
+
 @bp.route('/groups')
 @login_required
 def groups():
@@ -123,5 +195,4 @@ def groups():
 @login_required
 def domain_posts(domain):
     """View posts from a specific domain."""
-    posts = Post.query.filter_by(domain=domain).order_by(Post.created_at.desc()).all()
-    return render_template('community.html', posts=posts, domain=domain)
+    return render_template('community.html', domain=domain, **_feed(domain))
@@ -0,0 +1,38 @@
+"""
+Event Routes
+Server-Sent Events stream of new opportunities and live post counts
+"""
+from flask import Blueprint, Response, jsonify, request
+from flask_login import login_required, current_user
+from app.services.events import TOPICS, event_broker
+
+bp = Blueprint('events', __name__, url_prefix='/events')
+
+
+@bp.route('/stream')
+@login_required
+def stream():
+    """
+    Open an event stream.
+
+    Query parameters:
+        topics: Comma-separated subset of ``opportunities``, ``counts`` (default both)
+        domain: Only events of this domain; defaults to the user's domain, empty for all
+    """
+    topics = [topic for topic in request.args.get('topics', ','.join(TOPICS)).split(',') if topic]
+    unknown = [topic for topic in topics if topic not in TOPICS]
+    if unknown or not topics:
+        return jsonify({'error': f'Unknown topic: {", ".join(unknown)}', 'topics': TOPICS}), 400
+
+    domain = request.args.get('domain', current_user.domain) or None
+    subscription = event_broker.subscribe(topics, domain)
+    if subscription is None:
+        response = jsonify({'error': 'Too many open event streams, retry later'})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+
+    # The generator captures everything it needs, so no request context is held open
+    return Response(event_broker.stream(subscription), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',  # Stop nginx from buffering the stream
+    })
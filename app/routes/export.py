@@ -0,0 +1,68 @@
+"""
+Export Routes
+Streaming bulk exports for analysts (NDJSON / CSV)
+
+Exports contain every student's data, so they are open only to the usernames in
+``EXPORT_ANALYSTS`` and to requests bearing ``EXPORT_API_TOKEN``; with neither
+configured, ``flask export`` is the only way to export.
+"""
+import hmac
+from datetime import datetime
+from functools import wraps
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from flask_login import current_user
+from app.services.exporter import DataExporter
+
+bp = Blueprint('export', __name__, url_prefix='/export')
+
+MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def analyst_required(view):
+    """Allow analysts (by username) and ``Authorization: Bearer <EXPORT_API_TOKEN>``; 401/403 otherwise."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = current_app.config.get('EXPORT_API_TOKEN')
+        scheme, _, given = request.headers.get('Authorization', '').partition(' ')
+        if token and scheme.lower() == 'bearer' and hmac.compare_digest(given.encode(), token.encode()):
+            return view(*args, **kwargs)
+        if not current_user.is_authenticated:
+            return jsonify({'error': 'Authentication required'}), 401
+        if current_user.username not in current_app.config['EXPORT_ANALYSTS']:
+            return jsonify({'error': 'Exports are restricted to analysts'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@bp.route('/<dataset>.<fmt>')
+@analyst_required
+def export_dataset(dataset, fmt):
+    """
+    Stream a dataset export.
+
+    Query parameters:
+        since: ISO timestamp; only rows with ``updated_at`` after it are exported
+
+    The ``X-Export-Watermark`` response header is the ``since`` value for the next incremental export.
+    """
+    if dataset not in DataExporter.DATASETS or fmt not in MIMETYPES:
+        return jsonify({'error': f'Unknown export {dataset}.{fmt}'}), 404
+
+    since = None
+    if request.args.get('since'):
+        try:
+            since = datetime.fromisoformat(request.args['since'])
+        except ValueError:
+            return jsonify({'error': 'Invalid since timestamp, use ISO 8601'}), 400
+
+    exporter = DataExporter(dataset, since=since)
+    rows = exporter.iter_ndjson() if fmt == 'ndjson' else exporter.iter_csv()
+
+    response = Response(stream_with_context(rows), mimetype=MIMETYPES[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename={dataset}.{fmt}'
+    if exporter.watermark:
+        response.headers['X-Export-Watermark'] = exporter.watermark.isoformat()
+    return response
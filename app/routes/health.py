@@ -0,0 +1,30 @@
+"""
+Health Routes
+Liveness and readiness probes for load balancers and process supervisors (no login)
+"""
+from flask import Blueprint, jsonify
+from sqlalchemy import inspect, text
+from app import db
+
+bp = Blueprint('health', __name__)
+
+
+@bp.route('/healthz')
+def healthz():
+    """Liveness: the worker is up and serving requests. Never touches the database."""
+    return jsonify({'status': 'ok'})
+
+
+@bp.route('/readyz')
+def readyz():
+    """Readiness: the database is reachable and the schema has been created (``flask init-db``)."""
+    try:
+        db.session.execute(text('SELECT 1'))
+        missing = [table for table in ('users', 'opportunities', 'posts') if not inspect(db.engine).has_table(table)]
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+
+    if missing:
+        return jsonify({'status': 'unavailable', 'error': f'Missing tables: {", ".join(missing)}; run flask init-db'}), 503
+    return jsonify({'status': 'ready'})
@@ -0,0 +1,21 @@
+"""
+Job Routes
+Progress reporting for background jobs
+"""
+from flask import Blueprint, jsonify
+from flask_login import login_required, current_user
+from app.models.job import Job
+
+bp = Blueprint('jobs', __name__, url_prefix='/jobs')
+
+
+@bp.route('/<int:job_id>')
+@login_required
+def job_status(job_id):
+    """Return status and progress of a background job started by the current user."""
+    job = Job.query.get_or_404(job_id)
+
+    if job.created_by != current_user.id:
+        return jsonify({'error': 'Not found'}), 404
+
+    return jsonify(job.to_dict())
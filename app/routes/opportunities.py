@@ -6,6 +6,8 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request,
 from flask_login import login_required, current_user
 from app import db
 from app.models.opportunity import Opportunity, Application
+from app.services.catalog import catalog
+from app.services.ratelimit import rate_limiter
 from app.services.scraper import OpportunityScraper
 from app.services.classifier import DomainClassifier
 from datetime import datetime
@@ -18,11 +20,16 @@ bp = Blueprint('opportunities', __name__, url_prefix='/opportunities')
 @login_required
 def dashboard():
     """Main dashboard showing personalized opportunities."""
-    # Get opportunities matching user's domain
-    opportunities = Opportunity.query.filter_by(
-        domain=current_user.domain,
-        is_active=True
-    ).order_by(Opportunity.extracted_at.desc()).all()
+    snapshot = catalog.snapshot()
+    if snapshot is not None:
+        opportunities = snapshot.list(domain=current_user.domain) if current_user.domain else \
+            [entry for entry in snapshot.list() if entry.domain is None]
+    else:
+        # Get opportunities matching user's domain
+        opportunities = Opportunity.query.filter_by(
+            domain=current_user.domain,
+            is_active=True
+        ).order_by(Opportunity.extracted_at.desc()).all()
     
     return render_template('dashboard.html', opportunities=opportunities)
 
@@ -30,14 +37,25 @@ def dashboard():
 @bp.route('/all')
 @login_required
 def all_opportunities():
-    """View all opportunities."""
-    opportunities = Opportunity.query.filter_by(is_active=True)\
-        .order_by(Opportunity.extracted_at.desc()).all()
+    """View all opportunities; ``?domain=`` and ``?category=`` filter the list."""
+    domain = request.args.get('domain') or None
+    category = request.args.get('category') or None
+    snapshot = catalog.snapshot()
+    if snapshot is not None:
+        opportunities = snapshot.list(domain=domain, category=category)
+    else:
+        query = Opportunity.query.filter_by(is_active=True)
+        if domain:
+            query = query.filter_by(domain=domain)
+        if category:
+            query = query.filter_by(category=category)
+        opportunities = query.order_by(Opportunity.extracted_at.desc()).all()
     return render_template('opportunities.html', opportunities=opportunities)
 
 
 @bp.route('/scrape')
 @login_required
+@rate_limiter.limit('scrape')
 def scrape_opportunities():
     """Trigger web scraping to get new opportunities."""
     scraper = OpportunityScraper()
@@ -46,29 +64,23 @@ def scrape_opportunities():
     # Scrape all universities
     scraped_data = scraper.scrape_all_universities()
     
-    new_count = 0
-    for data in scraped_data:
-        # Check if opportunity already exists
-        existing = Opportunity.query.filter_by(title=data['title']).first()
-        if not existing:
-            # Classify the opportunity
-            domain = classifier.classify_opportunity(data['title'], data['description'])
-            category = classifier.categorize_type(data['title'], data['description'])
-            
-            # Create new opportunity
-            opportunity = Opportunity(
-                title=data['title'],
-                description=data['description'],
-                university=data['university'],
-                url=data['url'],
-                domain=domain,
-                category=category
-            )
-            db.session.add(opportunity)
-            new_count += 1
+    # Insert new opportunities and log edits to known ones
+    from app.services.history import OpportunityHistory
+    new_opportunities, updated = OpportunityHistory.sync_scraped(scraped_data, classifier)
     
     db.session.commit()
-    flash(f'Successfully scraped {new_count} new opportunities!', 'success')
+    
+    # Notify matching students in the background
+    if new_opportunities:
+        from app.services.events import event_broker
+        from app.services.jobs import job_runner
+        from app.services.notifications import NotificationFanout
+        event_broker.publish_opportunities([opp.id for opp in new_opportunities])
+        job_runner.submit('notification-fanout', NotificationFanout.fan_out,
+                          [opp.id for opp in new_opportunities], created_by=current_user.id)
+    
+    flash(f'Successfully scraped {len(new_opportunities)} new opportunities '
+          f'({len(updated)} updated)!', 'success')
     return redirect(url_for('opportunities.all_opportunities'))
 
 
@@ -76,7 +88,10 @@ def scrape_opportunities():
 @login_required
 def view_opportunity(id):
     """View single opportunity details."""
-    opportunity = Opportunity.query.get_or_404(id)
+    snapshot = catalog.snapshot()
+    opportunity = snapshot.get(id) if snapshot is not None else None
+    if opportunity is None:
+        opportunity = Opportunity.query.get_or_404(id)
     
     # Check if user already applied
     application = Application.query.filter_by(
@@ -119,6 +134,86 @@ def apply_opportunity(id):
     return redirect(url_for('opportunities.my_applications'))
 
 
+@bp.route('/auto-apply', methods=['POST'])
+@login_required
+@rate_limiter.limit('auto-apply')
+def auto_apply():
+    """Apply to every matching active opportunity in the background (Module 4)."""
+    from app.services.auto_apply import AutoApplyEngine
+    from app.services.jobs import job_runner
+    
+    job_id = job_runner.submit('auto-apply', AutoApplyEngine.apply_students, [current_user.id],
+                               created_by=current_user.id)
+    
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return jsonify({'success': True, 'job_id': job_id,
+                        'status_url': url_for('jobs.job_status', job_id=job_id)})
+    
+    flash('Auto-apply started! Your applications will appear here shortly.', 'success')
+    return redirect(url_for('opportunities.my_applications'))
+
+
+@bp.route('/notifications')
+@login_required
+def notifications():
+    """Recent digests and pending new-opportunity alerts for the current user."""
+    from app.models.notification import Digest, Notification
+    
+    digests = Digest.query.filter_by(user_id=current_user.id)\
+        .order_by(Digest.created_at.desc()).limit(20).all()
+    pending = Notification.query.filter_by(user_id=current_user.id, digest_id=None)\
+        .order_by(Notification.id.desc()).limit(50).all()
+    
+    return jsonify({
+        'pending': [notification.to_dict() for notification in pending],
+        'digests': [{
+            'id': digest.id,
+            'item_count': digest.item_count,
+            'is_read': digest.is_read,
+            'created_at': digest.created_at.isoformat(),
+            'notifications': [notification.to_dict() for notification in digest.notifications],
+        } for digest in digests],
+    })
+
+
+@bp.route('/changes')
+@login_required
+def changes():
+    """
+    Change log of scraped opportunities, oldest first, for incremental consumers.
+
+    Query parameters:
+        after: Cursor (change id) from the previous response's ``next``
+        since: ISO time to start from when there is no cursor
+        fields: Comma-separated fields; only changes touching one of them
+        limit: Changes per page (default 500)
+    """
+    from app.services.history import OpportunityHistory
+
+    try:
+        after = int(request.args['after']) if request.args.get('after') else None
+        since = datetime.fromisoformat(request.args['since']) if request.args.get('since') else None
+        limit = min(int(request.args.get('limit', 500)), 5000)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor, limit or since timestamp (ISO 8601)'}), 400
+    if limit <= 0:
+        return jsonify({'error': 'limit must be positive'}), 400
+    fields = [name for name in request.args.get('fields', '').split(',') if name]
+
+    items, cursor = OpportunityHistory.changes_since(after=after, since=since, limit=limit, fields=fields)
+    return jsonify({'changes': items, 'next': cursor, 'more': len(items) == limit})
+
+
+@bp.route('/<int:id>/history')
+@login_required
+def opportunity_history(id):
+    """Every logged change of one opportunity (JSON)."""
+    from app.services.history import OpportunityHistory
+
+    items, _ = OpportunityHistory.changes_since(opportunity_id=id, limit=1000)
+    return jsonify({'opportunity_id': id, 'changes': items})
+
+
 @bp.route('/my-applications')
 @login_required
 def my_applications():
@@ -181,6 +276,8 @@ def create_opportunity():
         try:
             db.session.add(opportunity)
             db.session.commit()
+            from app.services.events import event_broker
+            event_broker.publish_opportunities([opportunity.id])
             flash(f'Opportunity "{title}" created successfully! 🎉', 'success')
             return redirect(url_for('opportunities.my_opportunities'))
         except Exception as e:
@@ -191,6 +288,48 @@ def create_opportunity():
     return render_template('create_opportunity.html')
 
 
+@bp.route('/import', methods=['POST'])
+@login_required
+@rate_limiter.limit('import')
+def import_opportunities():
+    """
+    Bulk import opportunities from an uploaded CSV, JSON Lines or JSON file.
+    
+    Open only to the usernames in ``IMPORT_ADMINS``.
+    
+    Returns:
+        JSON with the background job ID; the job result holds the per-row error report.
+    """
+    import os
+    import tempfile
+    from flask import current_app
+    from app.services.importer import OpportunityImporter
+    from app.services.jobs import job_runner
+    
+    if current_user.username not in current_app.config['IMPORT_ADMINS']:
+        return jsonify({'error': 'Imports are restricted to admins'}), 403
+    
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify({'error': 'No file uploaded'}), 400
+    
+    fmt = request.form.get('format') or os.path.splitext(upload.filename)[1].lstrip('.').lower()
+    if fmt not in OpportunityImporter.FORMATS:
+        return jsonify({'error': f'Unsupported format, use one of {", ".join(OpportunityImporter.FORMATS)}'}), 400
+    
+    folder = os.path.join(current_app.instance_path, 'imports')
+    os.makedirs(folder, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=folder, suffix=f'.{fmt}')
+    with os.fdopen(fd, 'wb') as destination:
+        upload.save(destination)
+    
+    importer = OpportunityImporter(created_by=current_user.id)
+    job_id = job_runner.submit('opportunity-import', importer.import_file, path, fmt,
+                               delete_after=True, created_by=current_user.id)
+    return jsonify({'success': True, 'job_id': job_id,
+                    'status_url': url_for('jobs.job_status', job_id=job_id)}), 202
+
+
 @bp.route('/my-opportunities')
 @login_required
 def my_opportunities():
@@ -278,10 +417,13 @@ def delete_opportunity(id: int):
         flash('You can only delete opportunities you created!', 'error')
         return redirect(url_for('opportunities.all_opportunities'))
     
+    from app.services.purge import purge_or_schedule
+    
     try:
-        db.session.delete(opportunity)
-        db.session.commit()
-        flash('Opportunity deleted successfully!', 'success')
+        if purge_or_schedule('opportunity', id, created_by=current_user.id) is None:
+            flash('Opportunity deleted successfully!', 'success')
+        else:
+            flash('Opportunity has many applications and is being deleted in the background.', 'success')
     except Exception as e:
         db.session.rollback()
         flash(f'Failed to delete opportunity: {str(e)}', 'error')
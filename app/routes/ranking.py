@@ -2,10 +2,16 @@
 Ranking Routes - Module 6
 InCoScore Leaderboard and Student Recommendations
 """
+from datetime import datetime
+from typing import Optional
 from flask import Blueprint, render_template, request, jsonify
-from flask_login import login_required
-from app import db
+from flask_login import current_user, login_required
+from app import db, user_cache
+from app.models.opportunity import Opportunity
 from app.models.user import User
+from app.models.leaderboard import LeaderboardSnapshot
+from app.services.leaderboard import LeaderboardHistory
+from app.services.ratelimit import rate_limiter
 from app.services.ranking import InCoScoreEngine
 
 bp = Blueprint('ranking', __name__, url_prefix='/ranking')
@@ -33,9 +39,28 @@ def leaderboard():
 @bp.route('/api/top-students/<domain>')
 @login_required
 def api_top_students(domain):
-    """API endpoint to get top students for a domain."""
-    limit = int(request.args.get('limit', 5))
-    students = InCoScoreEngine.recommend_students_for_opportunity(domain, limit)
+    """
+    API endpoint to get top students for a domain.
+    
+    Query parameters:
+        limit: Number of students (default 5, at most 100)
+        opportunity_id: Match against this opportunity's requirements
+        requirements: Free-text requirements to match
+        skills: Comma-separated required skills
+    """
+    requirements = request.args.get('requirements')
+    try:
+        limit = _int_arg('limit', 5, maximum=100)
+        opportunity_id = _int_arg('opportunity_id')
+    except ValueError:
+        return jsonify({'error': 'limit and opportunity_id must be positive integers'}), 400
+    if opportunity_id is not None:
+        opportunity = Opportunity.query.get_or_404(opportunity_id)
+        requirements = ' '.join(filter(None, [requirements, opportunity.requirements]))
+    skills = [skill for skill in request.args.get('skills', '').split(',') if skill.strip()]
+    
+    students = InCoScoreEngine.recommend_students_for_opportunity(
+        domain, limit, requirements=requirements, skills=skills)
     
     result = []
     for student in students:
@@ -44,14 +69,113 @@ def api_top_students(domain):
             'name': student.full_name,
             'username': student.username,
             'incoscore': student.incoscore,
-            'domain': student.domain
+            'domain': student.domain,
+            'skills': student.skills
         })
     
     return jsonify(result)
 
 
+def _int_arg(name: str, default: Optional[int] = None, maximum: Optional[int] = None) -> Optional[int]:
+    """Positive integer query argument, capped at ``maximum``; raises ValueError otherwise."""
+    if not request.args.get(name):
+        return default
+    value = int(request.args[name])
+    if value <= 0:
+        raise ValueError(f'{name} must be positive')
+    return min(value, maximum) if maximum is not None else value
+
+
+def _history_domain() -> str:
+    """``?domain=`` ('' for the overall leaderboard), defaulting to the current user's domain."""
+    if 'domain' in request.args:
+        return request.args['domain']
+    return current_user.domain or ''
+
+
+@bp.route('/api/snapshots')
+@login_required
+def api_snapshots():
+    """Newest leaderboard snapshots of a domain (query: domain, limit)."""
+    try:
+        limit = _int_arg('limit', 50, maximum=1000)
+    except ValueError:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    return jsonify([snapshot.to_dict() for snapshot in LeaderboardHistory.list(_history_domain(), limit)])
+
+
+@bp.route('/api/rank-changes')
+@login_required
+def api_rank_changes():
+    """
+    Rank changes between two leaderboard snapshots of one domain.
+    
+    Query parameters:
+        domain: Domain ('' for the overall leaderboard; default your domain)
+        to: Snapshot id to compare (default the latest)
+        from: Snapshot id to compare against (default the one before ``to``)
+        since: ISO time; compare against the latest snapshot taken at or before it
+        limit: Risers and fallers to list (default 20)
+    """
+    domain = _history_domain()
+    try:
+        limit = _int_arg('limit', 20, maximum=500)
+        to_id, from_id = _int_arg('to'), _int_arg('from')
+    except ValueError:
+        return jsonify({'error': 'limit, to and from must be positive integers'}), 400
+    if to_id is not None:
+        new = LeaderboardSnapshot.query.get_or_404(to_id)
+    else:
+        new = LeaderboardHistory.at(domain)
+    if new is None:
+        return jsonify({'error': 'No leaderboard snapshots yet'}), 404
+    
+    if from_id is not None:
+        old = LeaderboardSnapshot.query.get_or_404(from_id)
+    elif request.args.get('since'):
+        try:
+            old = LeaderboardHistory.at(new.domain, before=datetime.fromisoformat(request.args['since']))
+        except ValueError:
+            return jsonify({'error': 'Invalid since timestamp, use ISO 8601'}), 400
+    else:
+        old = LeaderboardHistory.previous(new)
+    if old is None:
+        return jsonify({'error': 'No earlier snapshot to compare with'}), 404
+    if old.domain != new.domain:
+        return jsonify({'error': 'Snapshots belong to different domains'}), 400
+    
+    return jsonify(LeaderboardHistory.changes(old, new, limit=limit))
+
+
+@bp.route('/api/rank-history/<int:user_id>')
+@login_required
+def api_rank_history(user_id):
+    """
+    A student's rank and InCoScore in each recent snapshot, newest first.
+    
+    Query parameters:
+        domain: Domain ('' for the overall leaderboard; default your domain)
+        since: ISO time of the oldest snapshot to include
+        limit: Snapshots to include (default 168, a week of hourly snapshots)
+    """
+    try:
+        limit = _int_arg('limit', 168, maximum=5000)
+    except ValueError:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    try:
+        since = datetime.fromisoformat(request.args['since']) if request.args.get('since') else None
+    except ValueError:
+        return jsonify({'error': 'Invalid since timestamp, use ISO 8601'}), 400
+    return jsonify({
+        'user_id': user_id,
+        'domain': _history_domain() or None,
+        'history': LeaderboardHistory.history(user_id, _history_domain(), limit=limit, since=since),
+    })
+
+
 @bp.route('/calculate-score')
 @login_required
+@rate_limiter.limit('rescore')
 def calculate_all_scores():
     """Recalculate InCoScore for all users."""
     users = User.query.all()
@@ -60,5 +184,6 @@ def calculate_all_scores():
         user.incoscore = InCoScoreEngine.calculate_score(user)
     
     db.session.commit()
+    user_cache.clear()
     
     return jsonify({'success': True, 'message': f'Recalculated scores for {len(users)} users'})
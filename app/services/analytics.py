@@ -0,0 +1,252 @@
+"""
+Analytics Rollups
+Maintains precomputed counts of opportunities, applications and community activity.
+ORM writes (scraping, applying, posting, liking) are folded in by an ``after_flush``
+hook in the same transaction; bulk Core writes (seed, import, auto-apply, expiry,
+archival) bypass it and are reconciled by the periodic ``refresh``.
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, case, cast, delete, event, func, inspect, insert, select
+
+from app import db
+from app.models.analytics import ApplicationRollup, CommunityRollup, OpportunityRollup
+from app.models.community import Post
+from app.models.opportunity import Application, Opportunity
+from app.services.bulk import upsert_add
+
+logger = logging.getLogger(__name__)
+
+# model -> (dimension columns, counter columns)
+ROLLUPS = {
+    OpportunityRollup: (['domain', 'university', 'category', 'day'], ['total', 'active']),
+    ApplicationRollup: (['status'], ['total']),
+    CommunityRollup: (['domain'], ['posts', 'likes', 'comments']),
+}
+
+
+def _values(obj, names: List[str]) -> Tuple[Dict, Dict]:
+    """Return ``(committed, current)`` attribute values of a persistent object."""
+    state = inspect(obj)
+    old, new = {}, {}
+    for name in names:
+        added, unchanged, deleted = state.attrs[name].history
+        new[name] = added[0] if added else (unchanged[0] if unchanged else None)
+        old[name] = deleted[0] if deleted else new[name]
+    return old, new
+
+
+def _opportunity_row(values: Dict) -> Tuple[Tuple, List[int]]:
+    day = (values['extracted_at'] or datetime.utcnow()).date()
+    key = (values['domain'] or '', values['university'] or '', values['category'] or '', day)
+    return key, [1, 1 if values['is_active'] else 0]
+
+
+def _application_row(values: Dict) -> Tuple[Tuple, List[int]]:
+    return (values['status'] or '',), [1]
+
+
+def _post_row(values: Dict) -> Tuple[Tuple, List[int]]:
+    return (values['domain'] or '',), [1, values['likes_count'] or 0, values['comments_count'] or 0]
+
+
+# source model -> (rollup model, tracked attributes, row builder)
+# Likes and comments are tracked through the denormalized counters on Post, so
+# deleting a post subtracts its likes/comments once and the cascaded Like and
+# Comment deletes need no handling of their own.
+TRACKED = {
+    Opportunity: (OpportunityRollup, ['domain', 'university', 'category', 'extracted_at', 'is_active'],
+                  _opportunity_row),
+    Application: (ApplicationRollup, ['status'], _application_row),
+    Post: (CommunityRollup, ['domain', 'likes_count', 'comments_count'], _post_row),
+}
+
+
+class AnalyticsRollups:
+    """Incremental maintenance, reconciliation and reads of the rollup tables."""
+
+    @staticmethod
+    def collect_deltas(session) -> Dict:
+        """
+        Compute rollup deltas for the objects a flush inserted, updated or deleted.
+
+        Returns:
+            Mapping of rollup model to ``{dimension key: [counter deltas]}``
+        """
+        deltas = defaultdict(dict)
+
+        def add(model, row, sign):
+            key, counters = row
+            current = deltas[model].get(key, [0] * len(counters))
+            deltas[model][key] = [a + sign * b for a, b in zip(current, counters)]
+
+        for obj in session.new:
+            tracked = TRACKED.get(type(obj))
+            if tracked:
+                model, names, build = tracked
+                add(model, build({name: getattr(obj, name) for name in names}), 1)
+
+        for obj in session.deleted:
+            tracked = TRACKED.get(type(obj))
+            if tracked:
+                model, names, build = tracked
+                add(model, build(_values(obj, names)[0]), -1)
+
+        for obj in session.dirty:
+            tracked = TRACKED.get(type(obj))
+            if tracked and obj not in session.deleted:
+                model, names, build = tracked
+                old, new = _values(obj, names)
+                if old != new:
+                    add(model, build(old), -1)
+                    add(model, build(new), 1)
+
+        return deltas
+
+    @staticmethod
+    def apply_deltas(connection, deltas: Dict) -> int:
+        """
+        Add deltas to the rollup tables with one upsert per rollup table.
+
+        Returns:
+            Number of rollup rows touched
+        """
+        touched = 0
+        for model, changes in deltas.items():
+            dimensions, counters = ROLLUPS[model]
+            rows = [
+                {**dict(zip(dimensions, key)), **dict(zip(counters, values))}
+                for key, values in changes.items() if any(values)
+            ]
+            if rows:
+                connection.execute(upsert_add(model, dimensions, counters), rows)
+                touched += len(rows)
+        return touched
+
+    @staticmethod
+    def _day(column):
+        if db.session.get_bind().dialect.name == 'sqlite':
+            return func.date(column)
+        return cast(column, Date)
+
+    @classmethod
+    def refresh(cls) -> Dict[str, int]:
+        """
+        Rebuild every rollup table from the base tables in one transaction.
+
+        Returns:
+            Number of rollup rows per table
+        """
+        day = cls._day(Opportunity.extracted_at)
+        domain = func.coalesce(Opportunity.domain, '')
+        university = func.coalesce(Opportunity.university, '')
+        category = func.coalesce(Opportunity.category, '')
+        opportunities = select(
+            domain, university, category, day,
+            func.count(), func.sum(case((Opportunity.is_active.is_(True), 1), else_=0)),
+        ).where(Opportunity.extracted_at.is_not(None)).group_by(domain, university, category, day)
+
+        status = func.coalesce(Application.status, '')
+        applications = select(status, func.count()).group_by(status)
+
+        post_domain = func.coalesce(Post.domain, '')
+        community = select(
+            post_domain, func.count(),
+            func.coalesce(func.sum(Post.likes_count), 0), func.coalesce(func.sum(Post.comments_count), 0),
+        ).group_by(post_domain)
+
+        sources = {OpportunityRollup: opportunities, ApplicationRollup: applications, CommunityRollup: community}
+        counts = {}
+        for model, source in sources.items():
+            dimensions, counters = ROLLUPS[model]
+            db.session.execute(delete(model))
+            db.session.execute(insert(model).from_select(dimensions + counters, source))
+            counts[model.__tablename__] = db.session.execute(select(func.count()).select_from(model)).scalar()
+        db.session.commit()
+
+        logger.info(f"Refreshed analytics rollups: {counts}")
+        return counts
+
+    @staticmethod
+    def _dimension(value):
+        if isinstance(value, date):
+            return value.isoformat()
+        return value or None
+
+    @classmethod
+    def opportunities(cls, group_by: List[str], since: Optional[date] = None,
+                      until: Optional[date] = None, domain: Optional[str] = None) -> List[Dict]:
+        """
+        Opportunity totals grouped by any of ``domain``, ``university``, ``category``, ``day``.
+
+        Args:
+            group_by: Dimension names
+            since: First extraction day included
+            until: Last extraction day included
+            domain: Restrict to one domain
+
+        Returns:
+            Rows with the requested dimensions plus ``total`` and ``active``
+        """
+        columns = [getattr(OpportunityRollup, name) for name in group_by]
+        total = func.sum(OpportunityRollup.total)
+        stmt = select(*columns, total.label('total'), func.sum(OpportunityRollup.active).label('active'))
+        if since is not None:
+            stmt = stmt.where(OpportunityRollup.day >= since)
+        if until is not None:
+            stmt = stmt.where(OpportunityRollup.day <= until)
+        if domain is not None:
+            stmt = stmt.where(OpportunityRollup.domain == domain)
+        stmt = stmt.group_by(*columns).having(total > 0)
+        stmt = stmt.order_by(*columns) if 'day' in group_by else stmt.order_by(total.desc(), *columns)
+
+        return [
+            {key: (cls._dimension(value) if key in group_by else int(value or 0)) for key, value in row.items()}
+            for row in db.session.execute(stmt).mappings()
+        ]
+
+    @classmethod
+    def applications(cls) -> List[Dict]:
+        """Application totals per status."""
+        rows = db.session.execute(
+            select(ApplicationRollup.status, ApplicationRollup.total)
+            .where(ApplicationRollup.total > 0)
+            .order_by(ApplicationRollup.total.desc())
+        )
+        return [{'status': cls._dimension(status), 'total': total} for status, total in rows]
+
+    @classmethod
+    def community(cls) -> List[Dict]:
+        """Post, like and comment totals per domain."""
+        rows = db.session.execute(
+            select(CommunityRollup.domain, CommunityRollup.posts, CommunityRollup.likes, CommunityRollup.comments)
+            .where(CommunityRollup.posts > 0)
+            .order_by(CommunityRollup.posts.desc())
+        )
+        return [
+            {'domain': cls._dimension(domain), 'posts': posts, 'likes': likes, 'comments': comments}
+            for domain, posts, likes, comments in rows
+        ]
+
+
+def _load_previous_value(target, value, oldvalue, initiator) -> None:
+    """No-op ``set`` listener; registering it with ``active_history`` is the point."""
+
+
+# Assigning to an expired attribute normally skips loading its committed value, which
+# would leave the flush hook without the old bucket (e.g. ``application.status = ...``
+# right after a commit). Active history loads it on assignment.
+for _source, (_rollup, _names, _build) in TRACKED.items():
+    for _name in _names:
+        event.listen(getattr(_source, _name), 'set', _load_previous_value, active_history=True)
+
+
+@event.listens_for(db.session, 'after_flush')
+def _update_rollups(session, flush_context) -> None:
+    """Fold the flush's changes into the rollups inside the same transaction."""
+    deltas = AnalyticsRollups.collect_deltas(session)
+    if deltas:
+        AnalyticsRollups.apply_deltas(session.connection(), deltas)
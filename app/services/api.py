@@ -0,0 +1,157 @@
+"""
+JSON API Resources
+Column projection, filtering and keyset pagination behind the ``/api/v1`` blueprint.
+
+Every resource declares its public columns. A request's ``fields`` selects a subset,
+and only those columns are read from the database (a Core ``SELECT`` of the listed
+columns, no ORM instances), so a list of ids and titles never loads descriptions.
+Responses are serialized with ``orjson`` when the optional package is installed and
+with the standard library otherwise.
+"""
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from app import db
+from app.models.community import Post
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(payload) -> bytes:
+    """Serialize to compact UTF-8 JSON (datetimes as ISO 8601)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    import json
+
+    return json.dumps(payload, default=_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _boolean(value: str) -> bool:
+    if value.lower() in ('1', 'true', 'yes'):
+        return True
+    if value.lower() in ('0', 'false', 'no'):
+        return False
+    raise ValueError(f'Invalid boolean {value!r}')
+
+
+class Resource:
+    """
+    A model exposed by the API.
+
+    Args:
+        model: SQLAlchemy model
+        fields: Public columns
+        default_fields: Columns returned when the request names none
+        filters: Query parameter -> (column, parser)
+        order: Columns of the listing order; keyset-paged by id when None
+        owner: Column restricting rows to the current user
+    """
+
+    def __init__(self, model, fields: Sequence[str], default_fields: Sequence[str],
+                 filters: Optional[Dict[str, Tuple[str, Callable]]] = None, order: Optional[Sequence] = None,
+                 owner: Optional[str] = None):
+        self.model = model
+        self.fields = tuple(fields)
+        self.default_fields = tuple(default_fields)
+        self.filters = filters or {}
+        self.order = order
+        self.owner = owner
+
+    def select_fields(self, requested: Optional[str]) -> List[str]:
+        """Resolve ``?fields=a,b`` (always including ``id``); raises ValueError for unknown names."""
+        if not requested:
+            return list(self.default_fields)
+        names = [name.strip() for name in requested.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ValueError(f'Unknown field: {", ".join(unknown)}')
+        return ['id'] + [name for name in dict.fromkeys(names) if name != 'id']
+
+    def query(self, fields: List[str], args, user_id: Optional[int] = None):
+        """SELECT of the given columns with the filters present in ``args``."""
+        stmt = select(*[getattr(self.model, name) for name in fields])
+        if self.owner is not None:
+            stmt = stmt.where(getattr(self.model, self.owner) == user_id)
+        for param, (column, parse) in self.filters.items():
+            if args.get(param):
+                stmt = stmt.where(getattr(self.model, column) == parse(args[param]))
+        return stmt
+
+    def rows(self, stmt, fields: List[str]) -> List[Dict]:
+        return [dict(zip(fields, row)) for row in db.session.execute(stmt)]
+
+    def page(self, fields: List[str], args, limit: int, user_id: Optional[int] = None) -> Tuple[List[Dict], Dict]:
+        """
+        One page of the listing.
+
+        Returns:
+            ``(rows, paging)``; ``paging`` holds the parameter for the next page, or
+            None when this was the last one
+        """
+        stmt = self.query(fields, args, user_id)
+        if self.order is None:
+            # Newest first, continued with ?before=<last id> (no OFFSET scan)
+            if args.get('before'):
+                stmt = stmt.where(self.model.id < int(args['before']))
+            rows = self.rows(stmt.order_by(self.model.id.desc()).limit(limit), fields)
+            return rows, {'before': rows[-1]['id'] if len(rows) == limit else None}
+
+        offset = max(int(args.get('offset', 0)), 0)
+        rows = self.rows(stmt.order_by(*self.order).offset(offset).limit(limit), fields)
+        for rank, row in enumerate(rows, offset + 1):
+            row['rank'] = rank
+        return rows, {'offset': offset + limit if len(rows) == limit else None}
+
+    def batch(self, fields: List[str], ids: List[int], args,
+              user_id: Optional[int] = None) -> Tuple[List[Dict], List[int]]:
+        """Rows for a list of ids in the requested order, and the ids not found."""
+        stmt = self.query(fields, args, user_id).where(self.model.id.in_(ids))
+        found = {row['id']: row for row in self.rows(stmt, fields)}
+        return [found[i] for i in ids if i in found], [i for i in ids if i not in found]
+
+
+RESOURCES = {
+    'opportunities': Resource(
+        Opportunity,
+        fields=('id', 'title', 'description', 'university', 'domain', 'category', 'deadline', 'url',
+                'requirements', 'location', 'is_active', 'created_by', 'extracted_at', 'updated_at'),
+        default_fields=('id', 'title', 'university', 'domain', 'category', 'deadline', 'url', 'location'),
+        filters={'domain': ('domain', str), 'category': ('category', str), 'university': ('university', str),
+                 'active': ('is_active', _boolean)},
+    ),
+    'applications': Resource(
+        Application,
+        fields=('id', 'opportunity_id', 'status', 'submitted_at', 'updated_at'),
+        default_fields=('id', 'opportunity_id', 'status', 'submitted_at'),
+        filters={'status': ('status', str), 'opportunity_id': ('opportunity_id', int)},
+        owner='student_id',
+    ),
+    'posts': Resource(
+        Post,
+        fields=('id', 'user_id', 'title', 'content', 'domain', 'likes_count', 'comments_count', 'hot_score',
+                'created_at', 'updated_at'),
+        default_fields=('id', 'user_id', 'title', 'domain', 'likes_count', 'comments_count', 'created_at'),
+        filters={'domain': ('domain', str), 'user_id': ('user_id', int)},
+    ),
+    'leaderboard': Resource(
+        User,
+        fields=('id', 'username', 'full_name', 'domain', 'incoscore', 'hackathons_count', 'internships_count',
+                'research_papers_count', 'coding_score', 'competition_wins'),
+        default_fields=('id', 'username', 'full_name', 'domain', 'incoscore'),
+        filters={'domain': ('domain', str)},
+        order=(User.incoscore.desc(), User.id),
+    ),
+}
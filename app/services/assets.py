@@ -0,0 +1,211 @@
+"""
+Static Asset Pipeline
+Builds content-hashed, minified and precompressed copies of ``app/static`` so they can
+be cached by browsers and proxies forever, and gzips large dynamic HTML/JSON responses.
+
+``flask build-assets`` writes ``<name>.<hash>.<ext>`` plus ``.gz`` (and ``.br`` when the
+optional ``brotli`` package is installed) into ``ASSETS_FOLDER`` together with a
+``manifest.json`` mapping source paths to built files. Templates link assets through
+``asset_url()``, which falls back to the plain static URL until a build exists.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Dict, List, Optional
+
+from flask import request, url_for
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+BUILT_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt')
+COMPRESSIBLE_MIMETYPES = {'text/html', 'application/json'}
+
+
+_CSS_STRING = r'"(?:\\.|[^"\\])*"' r"|'(?:\\.|[^'\\])*'"
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and redundant whitespace from a stylesheet, leaving string literals intact."""
+    # Strings are matched alongside comments so ``"/*"`` inside one is not a comment
+    source = re.sub(rf'({_CSS_STRING})|/\*.*?\*/', lambda m: m.group(1) or ' ', source, flags=re.S)
+    pieces = re.split(rf'({_CSS_STRING})', source)
+    for i in range(0, len(pieces), 2):
+        code = re.sub(r'\s+', ' ', pieces[i])
+        # Space before ':' is kept: in a selector it is a descendant combinator (``.nav :hover``)
+        pieces[i] = re.sub(r':\s+', ':', re.sub(r'\s*([{};,>])\s*', r'\1', code))
+    return ''.join(pieces).replace(';}', '}').strip()
+
+
+def minify_js(source: str) -> str:
+    """
+    Strip indentation, blank lines, whole-line comments and comments opening a line from a script.
+
+    Deliberately conservative: string, template and regex literals are never touched,
+    so files containing template literals are only stripped of trailing whitespace.
+    """
+    if '`' in source:
+        return '\n'.join(line.rstrip() for line in source.splitlines() if line.strip()) + '\n'
+    lines = []
+    in_comment = False
+    for line in source.splitlines():
+        line = line.strip()
+        while in_comment or line.startswith('/*'):
+            end = line.find('*/', 0 if in_comment else 2)
+            if end < 0:
+                in_comment, line = True, ''
+                break
+            # Keep the code after the comment (``/* a */ var x = 1;``)
+            in_comment, line = False, line[end + 2:].lstrip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class AssetPipeline:
+    """Builds hashed, precompressed assets and resolves their URLs."""
+
+    def __init__(self):
+        self.static_folder: Optional[str] = None
+        self.folder: Optional[str] = None
+        self.manifest: Dict[str, str] = {}
+
+    def init_app(self, app) -> None:
+        """Load the build manifest and expose ``asset_url`` to templates."""
+        self.static_folder = app.static_folder
+        self.folder = app.config['ASSETS_FOLDER']
+        self.load_manifest()
+        app.context_processor(lambda: {'asset_url': self.url})
+
+    def load_manifest(self) -> None:
+        path = os.path.join(self.folder, MANIFEST_NAME)
+        try:
+            with open(path) as stream:
+                self.manifest = json.load(stream)
+        except FileNotFoundError:
+            self.manifest = {}
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable asset manifest {path}: {e}")
+            self.manifest = {}
+
+    def url(self, filename: str) -> str:
+        """URL of the built asset for a path under ``app/static``, or the plain static URL."""
+        built = self.manifest.get(filename)
+        if built is None:
+            return url_for('static', filename=filename)
+        return url_for('assets.serve', filename=built)
+
+    def build(self, level: int = 9) -> List[Dict]:
+        """
+        Build every asset under the static folder into ``ASSETS_FOLDER``.
+
+        Args:
+            level: gzip/brotli compression level (build time, so maximum by default)
+
+        Returns:
+            One report per file with its source and built sizes in bytes
+        """
+        brotli = _brotli()
+        if brotli is None:
+            logger.info("brotli not installed; building gzip variants only")
+
+        os.makedirs(self.folder, exist_ok=True)
+        manifest, report, keep = {}, [], {MANIFEST_NAME}
+        for root, dirs, files in os.walk(self.static_folder):
+            dirs[:] = [name for name in dirs if os.path.join(root, name) != os.path.normpath(self.folder)]
+            for name in sorted(files):
+                source_path = os.path.join(root, name)
+                relative = os.path.relpath(source_path, self.static_folder).replace(os.sep, '/')
+                stem, ext = os.path.splitext(relative)
+                if ext not in BUILT_EXTENSIONS:
+                    continue
+
+                with open(source_path, 'rb') as stream:
+                    raw = stream.read()
+                minify = MINIFIERS.get(ext)
+                data = minify(raw.decode('utf-8')).encode('utf-8') if minify else raw
+
+                built = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+                variants = {'': data, '.gz': gzip.compress(data, compresslevel=level, mtime=0)}
+                if brotli is not None:
+                    variants['.br'] = brotli.compress(data, quality=min(level + 2, 11))
+                for suffix, content in variants.items():
+                    target = os.path.join(self.folder, built + suffix)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    with open(target, 'wb') as stream:
+                        stream.write(content)
+                    keep.add(built + suffix)
+
+                manifest[relative] = built
+                report.append({'source': relative, 'built': built, 'raw': len(raw), 'minified': len(data),
+                               **{suffix.lstrip('.'): len(variants[suffix]) for suffix in ('.gz', '.br')
+                                  if suffix in variants}})
+
+        self._remove_stale(keep)
+        with open(os.path.join(self.folder, MANIFEST_NAME), 'w') as stream:
+            json.dump(manifest, stream, indent=2, sort_keys=True)
+        self.manifest = manifest
+        logger.info(f"Built {len(manifest)} assets into {self.folder}")
+        return report
+
+    def _remove_stale(self, keep) -> None:
+        """Delete files of earlier builds that the new manifest no longer references."""
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                relative = os.path.relpath(os.path.join(root, name), self.folder).replace(os.sep, '/')
+                if relative not in keep:
+                    os.remove(os.path.join(root, name))
+
+
+class ResponseCompressor:
+    """gzip for large HTML and JSON responses the client accepts compressed."""
+
+    def __init__(self):
+        self.min_size = 1024
+        self.level = 6
+
+    def init_app(self, app) -> None:
+        """Read thresholds from the config and register the ``after_request`` hook."""
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', self.min_size)
+        self.level = app.config.get('COMPRESS_LEVEL', self.level)
+        app.after_request(self.compress)
+
+    def compress(self, response):
+        # Streamed exports and send_file responses are left alone: compressing them
+        # would buffer the whole body in memory
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if not request.accept_encodings.quality('gzip'):
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=self.level))
+        response.headers['Content-Encoding'] = 'gzip'
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)  # Byte-for-byte different from the identity body
+        return response
+
+
+asset_pipeline = AssetPipeline()
+response_compressor = ResponseCompressor()
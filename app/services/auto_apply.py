@@ -0,0 +1,95 @@
+"""
+Module 4: Auto-Application System (bulk)
+Applies students to every matching active opportunity in set-based, idempotent batches.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import and_, literal, or_, select
+
+from app import db
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+from app.services.bulk import chunked, insert_ignore
+
+logger = logging.getLogger(__name__)
+
+
+class AutoApplyEngine:
+    """Bulk auto-apply for a student or a cohort of students."""
+
+    @staticmethod
+    def matching_pairs(student_ids: List[int], now: Optional[datetime] = None):
+        """
+        Build a SELECT of ``(student_id, opportunity_id, status, submitted_at)`` for every
+        active, open opportunity in each student's domain.
+
+        Args:
+            student_ids: Students to match
+            now: Reference time for deadline checks
+
+        Returns:
+            SQLAlchemy select statement
+        """
+        now = now or datetime.utcnow()
+        return select(
+            User.id,
+            Opportunity.id,
+            literal('submitted'),
+            literal(now),
+        ).join(
+            Opportunity, and_(Opportunity.domain == User.domain, Opportunity.is_active.is_(True))
+        ).where(
+            User.id.in_(student_ids),
+            or_(Opportunity.deadline.is_(None), Opportunity.deadline >= Opportunity.open_deadline_from(now)),
+        )
+
+    @staticmethod
+    def apply_students(student_ids: List[int], batch_size: int = 500,
+                       progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """
+        Apply students to all matching opportunities.
+
+        Each batch is a single ``INSERT ... SELECT`` that relies on the unique
+        ``(student_id, opportunity_id)`` constraint to skip existing applications,
+        so re-running is safe.
+
+        Args:
+            student_ids: Students to apply on behalf of
+            batch_size: Students per INSERT statement
+            progress: Optional callback ``(students_done, students_total)``
+
+        Returns:
+            Number of students processed and applications created
+        """
+        total = len(student_ids)
+        done = created = 0
+        columns = ['student_id', 'opportunity_id', 'status', 'submitted_at']
+
+        for batch in chunked(student_ids, batch_size):
+            stmt = insert_ignore(Application).from_select(columns, AutoApplyEngine.matching_pairs(batch))
+            created += db.session.execute(stmt).rowcount
+            db.session.commit()
+            done += len(batch)
+            if progress:
+                progress(done, total)
+
+        logger.info(f"Auto-apply created {created} applications for {done} students")
+        return {'students': done, 'applications_created': created}
+
+    @staticmethod
+    def cohort(domain: Optional[str] = None) -> List[int]:
+        """
+        Select the student IDs of a cohort.
+
+        Args:
+            domain: Restrict to students in this domain (all students if None)
+
+        Returns:
+            List of student IDs
+        """
+        query = select(User.id)
+        if domain:
+            query = query.where(User.domain == domain)
+        return db.session.execute(query.order_by(User.id)).scalars().all()
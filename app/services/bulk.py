@@ -0,0 +1,104 @@
+"""
+Bulk Database Helpers
+Shared utilities for chunked, set-based writes used by seeding, import and background jobs.
+
+The conflict-handling statements exist for SQLite, PostgreSQL and MySQL/MariaDB only;
+``create_app`` refuses any other ``DATABASE_URL`` with ``UnsupportedDatabase``.
+"""
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+from sqlalchemy import insert
+
+from app import db
+
+T = TypeVar('T')
+
+SUPPORTED_DIALECTS = ('sqlite', 'postgresql', 'mysql', 'mariadb')
+
+
+class UnsupportedDatabase(RuntimeError):
+    """The database has no INSERT conflict clause the bulk helpers can build."""
+
+
+def check_dialect(dialect: str) -> None:
+    """Raise ``UnsupportedDatabase`` unless ``dialect`` is one of ``SUPPORTED_DIALECTS``."""
+    if dialect not in SUPPORTED_DIALECTS:
+        raise UnsupportedDatabase(f'Database {dialect!r} is not supported; use one of '
+                                  f'{", ".join(SUPPORTED_DIALECTS)} in DATABASE_URL')
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        iterable: Any iterable (consumed lazily)
+        size: Maximum number of items per chunk
+
+    Returns:
+        Iterator over chunks
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def insert_ignore(model):
+    """
+    Build an INSERT that silently skips rows violating a unique constraint.
+
+    Args:
+        model: Mapped model class to insert into
+
+    Returns:
+        Dialect-specific insert statement (``ON CONFLICT DO NOTHING`` / ``INSERT IGNORE``)
+
+    Raises:
+        UnsupportedDatabase: On databases other than ``SUPPORTED_DIALECTS``
+    """
+    dialect = db.session.get_bind().dialect.name
+    check_dialect(dialect)
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(model).on_conflict_do_nothing()
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(model).on_conflict_do_nothing()
+    return insert(model).prefix_with('IGNORE')  # MySQL / MariaDB
+
+
+def upsert_add(model, index_elements: List[str], counters: List[str]):
+    """
+    Build an INSERT that adds its counter values to an existing row on conflict.
+
+    Args:
+        model: Mapped model class to insert into
+        index_elements: Columns of the unique constraint identifying a row
+        counters: Integer columns incremented by the inserted values
+
+    Returns:
+        Dialect-specific upsert (``ON CONFLICT DO UPDATE`` / ``ON DUPLICATE KEY UPDATE``)
+
+    Raises:
+        UnsupportedDatabase: On databases other than ``SUPPORTED_DIALECTS``
+    """
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+    check_dialect(dialect)
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={name: table.c[name] + stmt.excluded[name] for name in counters},
+        )
+    from sqlalchemy.dialects.mysql import insert as mysql_insert  # MySQL / MariaDB
+    stmt = mysql_insert(table)
+    return stmt.on_duplicate_key_update({name: table.c[name] + stmt.inserted[name] for name in counters})
@@ -0,0 +1,405 @@
+"""
+Opportunity Catalog Snapshot
+Immutable, memory-mapped snapshot of the active opportunities for the read-heavy
+views (dashboard, all opportunities, opportunity detail).
+
+The snapshot is one file of column arrays: ids, timestamps and domain/category codes
+as fixed-width arrays, text fields as offset arrays into UTF-8 blobs, and per-domain
+and per-category arrays of row positions. Every worker maps the same file read-only,
+so the operating system keeps a single copy in the page cache however many workers
+there are, and listing or filtering touches neither the database nor the ORM. Only
+the rows a page renders are decoded into ``CatalogEntry`` records.
+
+The file is rebuilt only by the scheduler process (and on demand with
+``flask build-catalog``): every ``CATALOG_REFRESH_SECONDS``, and within
+``CATALOG_STALE_CHECK_SECONDS`` after a web worker commits an opportunity change.
+Web workers just touch a ``.stale`` marker next to the snapshot; while it exists, views
+read from the database, so a change is never hidden by an outdated snapshot. The file is
+replaced atomically; workers notice the new file within ``CATALOG_CHECK_SECONDS``. A
+snapshot older than ``CATALOG_MAX_AGE_SECONDS`` is ignored as well.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event, select
+
+from app import db
+from app.models.opportunity import Opportunity
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'IVYCAT01'
+TEXT_FIELDS = ('title', 'description', 'university', 'url', 'requirements', 'location')
+TIME_FIELDS = ('deadline', 'extracted_at')
+EPOCH = datetime(1970, 1, 1)
+NO_TIME = np.iinfo(np.int64).min
+
+
+class CatalogEntry:
+    """Read-only opportunity record decoded from a snapshot."""
+    __slots__ = ('id', 'title', 'description', 'university', 'domain', 'category', 'url',
+                 'requirements', 'location', 'deadline', 'extracted_at')
+
+    is_active = True  # Only active opportunities are snapshotted
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        return f'<CatalogEntry {self.title}>'
+
+    @classmethod
+    def size_of(cls, entry: 'CatalogEntry') -> int:
+        """Bytes held by a decoded record and its field values."""
+        return sys.getsizeof(entry) + sum(sys.getsizeof(getattr(entry, name)) for name in cls.__slots__)
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return NO_TIME
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    if value == NO_TIME:
+        return None
+    return EPOCH + timedelta(microseconds=int(value))
+
+
+def _codes(values: List[Optional[str]]) -> Tuple[np.ndarray, List[Optional[str]]]:
+    """Dictionary-encode values; code 0 is ``None``."""
+    names: List[Optional[str]] = [None]
+    lookup = {None: 0}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(names)
+            names.append(value)
+        codes[i] = code
+    return codes, names
+
+
+def _postings(codes: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row positions grouped by code (ascending within each code) and each code's start."""
+    positions = np.argsort(codes, kind='stable').astype(np.int32)
+    starts = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=size), out=starts[1:])
+    return positions, starts
+
+
+def write_snapshot(path: str) -> Dict:
+    """
+    Write a snapshot of the active opportunities, newest first, and atomically move it
+    into place.
+
+    Returns:
+        Build statistics (rows, file size, seconds)
+    """
+    started = time.perf_counter()
+    columns = {name: [] for name in ('id', 'domain', 'category') + TEXT_FIELDS + TIME_FIELDS}
+    stmt = (select(*(getattr(Opportunity, name) for name in columns))
+            .where(Opportunity.is_active.is_(True))
+            .order_by(Opportunity.extracted_at.desc(), Opportunity.id.desc()))
+    for row in db.session.execute(stmt, execution_options={'yield_per': 5000}):
+        for name, value in zip(columns, row):
+            columns[name].append(value)
+    count = len(columns['id'])
+
+    sections: Dict[str, np.ndarray] = {}
+    ids = np.array(columns['id'], dtype=np.int64)
+    sections['ids'] = ids
+    sections['id_order'] = np.argsort(ids, kind='stable').astype(np.int32)
+    sections['sorted_ids'] = ids[sections['id_order']]
+    for name in TIME_FIELDS:
+        sections[name] = np.array([_to_micros(value) for value in columns[name]], dtype=np.int64)
+
+    dictionaries = {}
+    for name in ('domain', 'category'):
+        codes, names = _codes(columns[name])
+        dictionaries[name] = names
+        sections[f'{name}_codes'] = codes
+        sections[f'{name}_positions'], sections[f'{name}_starts'] = _postings(codes, len(names))
+
+    for name in TEXT_FIELDS:
+        encoded = [(value or '').encode('utf-8') for value in columns[name]]
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        sections[f'{name}_offsets'] = offsets
+        sections[f'{name}_text'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        columns[name] = None  # Release as we go
+
+    layout, offset = {}, 0
+    for name, array in sections.items():
+        layout[name] = [offset, array.dtype.str, len(array)]
+        offset += (array.nbytes + 7) // 8 * 8  # Keep every section 8-byte aligned
+    header = json.dumps({
+        'count': count, 'built_at': datetime.utcnow().isoformat(),
+        'sections': layout, 'domains': dictionaries['domain'], 'categories': dictionaries['category'],
+    }).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 8 + len(header)) % 8)
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as stream:
+            stream.write(MAGIC + struct.pack('<Q', len(header)) + header)
+            for name, array in sections.items():
+                stream.write(array.tobytes())
+                stream.write(b'\0' * (-array.nbytes % 8))
+        os.chmod(temporary, 0o644)  # mkstemp creates 0600 files
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+    stats = {'rows': count, 'bytes': os.path.getsize(path), 'seconds': round(time.perf_counter() - started, 3)}
+    logger.info(f"Wrote catalog snapshot {path}: {stats}")
+    return stats
+
+
+class CatalogSnapshot:
+    """Read-only view over a memory-mapped snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as stream:
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a catalog snapshot')
+        header_length = struct.unpack_from('<Q', self._map, len(MAGIC))[0]
+        base = len(MAGIC) + 8 + header_length
+        header = json.loads(self._map[len(MAGIC) + 8:base])
+
+        self.path = path
+        self.count: int = header['count']
+        self.built_at = datetime.fromisoformat(header['built_at'])
+        self.domains: List[Optional[str]] = header['domains']
+        self.categories: List[Optional[str]] = header['categories']
+        self._domain_codes = {name: code for code, name in enumerate(self.domains)}
+        self._category_codes = {name: code for code, name in enumerate(self.categories)}
+        self._arrays = {
+            name: np.frombuffer(self._map, dtype=np.dtype(dtype), count=length, offset=base + offset)
+            for name, (offset, dtype, length) in header['sections'].items()
+        }
+        self._text_base = {field: base + header['sections'][f'{field}_text'][0] for field in TEXT_FIELDS}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def entries(self, positions) -> List[CatalogEntry]:
+        """Decode the records at the given row positions with one gather per column."""
+        positions = np.asarray(positions, dtype=np.int64)
+        arrays = self._arrays
+        columns = {
+            'id': arrays['ids'][positions].tolist(),
+            'domain': [self.domains[code] for code in arrays['domain_codes'][positions].tolist()],
+            'category': [self.categories[code] for code in arrays['category_codes'][positions].tolist()],
+        }
+        for field in TIME_FIELDS:
+            columns[field] = [_from_micros(value) for value in arrays[field][positions].tolist()]
+        for field in TEXT_FIELDS:
+            offsets = arrays[f'{field}_offsets']
+            base = self._text_base[field]
+            data = self._map
+            values = [data[base + start:base + end].decode('utf-8')
+                      for start, end in zip(offsets[positions].tolist(), offsets[positions + 1].tolist())]
+            columns[field] = values if field in ('title', 'description') else [value or None for value in values]
+        return [CatalogEntry(*row) for row in zip(*(columns[name] for name in CatalogEntry.__slots__))]
+
+    def entry(self, position: int) -> CatalogEntry:
+        """Decode the record at a row position."""
+        return self.entries([position])[0]
+
+    def _postings(self, field: str, codes: Dict, value: Optional[str]) -> np.ndarray:
+        code = codes.get(value)
+        if code is None:
+            return np.empty(0, dtype=np.int32)
+        starts = self._arrays[f'{field}_starts']
+        return self._arrays[f'{field}_positions'][starts[code]:starts[code + 1]]
+
+    def positions(self, domain: Optional[str] = None, category: Optional[str] = None) -> np.ndarray:
+        """Row positions (newest first) matching the filters, from the index arrays."""
+        result = None
+        if domain is not None:
+            result = self._postings('domain', self._domain_codes, domain)
+        if category is not None:
+            matches = self._postings('category', self._category_codes, category)
+            result = matches if result is None else np.intersect1d(result, matches, assume_unique=True)
+        return np.arange(self.count, dtype=np.int32) if result is None else result
+
+    def list(self, domain: Optional[str] = None, category: Optional[str] = None,
+             offset: int = 0, limit: Optional[int] = None) -> List[CatalogEntry]:
+        """Decode the matching records, newest first."""
+        positions = self.positions(domain, category)
+        end = len(positions) if limit is None else offset + limit
+        return self.entries(positions[offset:end])
+
+    def get(self, opportunity_id: int) -> Optional[CatalogEntry]:
+        """Record of an active opportunity by ID (binary search), or None."""
+        sorted_ids = self._arrays['sorted_ids']
+        index = int(np.searchsorted(sorted_ids, opportunity_id))
+        if index < self.count and sorted_ids[index] == opportunity_id:
+            return self.entry(int(self._arrays['id_order'][index]))
+        return None
+
+    def stats(self) -> Dict:
+        """Sizes of the snapshot, per record and per section group."""
+        text = sum(self._arrays[f'{field}_text'].nbytes + self._arrays[f'{field}_offsets'].nbytes
+                   for field in TEXT_FIELDS)
+        indexes = sum(self._arrays[name].nbytes for name in self._arrays
+                      if name.endswith(('_positions', '_starts')) or name in ('id_order', 'sorted_ids'))
+        size = len(self._map)
+        sample = self.entries(np.arange(min(self.count, 100)))
+        return {
+            'rows': self.count,
+            'built_at': self.built_at.isoformat(),
+            'bytes': size,
+            'bytes_per_record': round(size / self.count, 1) if self.count else 0,
+            'text_bytes': text,
+            'index_bytes': indexes,
+            'domains': len(self.domains) - 1,
+            'categories': len(self.categories) - 1,
+            'decoded_bytes_per_record': round(sum(map(CatalogEntry.size_of, sample)) / len(sample), 1)
+            if sample else 0,
+        }
+
+
+class OpportunityCatalog:
+    """Per-process handle on the current snapshot file."""
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.enabled = True
+        self.check_interval = 5.0
+        self.max_age = 600.0
+        self.refresh_interval = 60.0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._file_id = None
+        self._stale = False
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()  # One rebuild at a time in this process
+
+    def init_app(self, app) -> None:
+        """Read the snapshot location and freshness limits from the config."""
+        self.path = app.config['CATALOG_SNAPSHOT_PATH']
+        self.enabled = app.config.get('CATALOG_ENABLED', self.enabled)
+        self.check_interval = app.config.get('CATALOG_CHECK_SECONDS', self.check_interval)
+        self.max_age = app.config.get('CATALOG_MAX_AGE_SECONDS', self.max_age)
+        self.refresh_interval = app.config.get('CATALOG_REFRESH_SECONDS', self.refresh_interval)
+
+    @property
+    def stale_path(self) -> str:
+        return f'{self.path}.stale'
+
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        """
+        The current snapshot, or None when disabled, not built yet or too old, in which
+        case callers read from the database.
+        """
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval:
+            with self._lock:
+                if now - self._checked >= self.check_interval:
+                    self._reload()
+                    self._checked = now
+        snapshot = self._snapshot
+        if snapshot is None or self._stale or (datetime.utcnow() - snapshot.built_at).total_seconds() > self.max_age:
+            return None
+        return snapshot
+
+    def _reload(self) -> None:
+        self._stale = os.path.exists(self.stale_path)
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._snapshot, self._file_id = None, None
+            return
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        if file_id == self._file_id:
+            return
+        try:
+            # The previous mapping is unmapped once no request holds a view into it
+            self._snapshot = CatalogSnapshot(self.path)
+            self._file_id = file_id
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load catalog snapshot {self.path}: {e}")
+
+    def rebuild(self) -> Dict:
+        """Write a fresh snapshot and switch this process to it."""
+        with self._build_lock:
+            # Cleared before reading, so writes committed during the build mark it stale again
+            self._clear_stale()
+            try:
+                stats = write_snapshot(self.path)
+            except BaseException:
+                self.mark_stale()
+                raise
+        with self._lock:
+            self._reload()
+            self._checked = time.monotonic()
+        return stats
+
+    def refresh(self) -> Optional[Dict]:
+        """Scheduler job: rebuild when marked stale or older than ``refresh_interval``."""
+        try:
+            age = time.time() - os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            age = None
+        if age is not None and age < self.refresh_interval and not os.path.exists(self.stale_path):
+            return None
+        return self.rebuild()
+
+    def mark_stale(self) -> None:
+        """Note committed opportunity changes: views read the database until the scheduler rebuilds."""
+        if not self.enabled or self.path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.stale_path, 'a'):
+                pass
+        except OSError as e:
+            logger.warning(f"Could not mark catalog snapshot stale: {e}")
+            return
+        self._stale = True
+
+    def _clear_stale(self) -> None:
+        try:
+            os.unlink(self.stale_path)
+        except FileNotFoundError:
+            pass
+
+
+catalog = OpportunityCatalog()
+
+
+@event.listens_for(db.session, 'after_flush')
+def _note_opportunity_writes(session, flush_context) -> None:
+    if any(isinstance(obj, Opportunity) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info['catalog_stale'] = True
+
+
+@event.listens_for(db.session, 'after_commit')
+def _rebuild_after_commit(session) -> None:
+    """Mark the snapshot stale once ORM changes to opportunities are committed."""
+    if session.info.pop('catalog_stale', False):
+        catalog.mark_stale()
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _forget_rolled_back(session) -> None:
+    session.info.pop('catalog_stale', None)
@@ -2,12 +2,10 @@
 Module 2: Domain Classification System
 Classifies opportunities into relevant domains using keyword matching and NLP techniques.
 """
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
 import pickle
 import os
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class DomainClassifier:
@@ -39,10 +37,35 @@ class DomainClassifier:
         'Mathematics': ['mathematics', 'calculus', 'statistics', 'algebra'],
     }
     
+    # Keywords for opportunity type, checked in order (first match wins)
+    CATEGORY_KEYWORDS = [
+        ('Workshop', ['workshop', 'seminar', 'training']),
+        ('Hackathon', ['hackathon', 'hack', 'coding competition']),
+        ('Research', ['research', 'internship', 'lab']),
+        ('Scholarship', ['scholarship', 'grant', 'funding']),
+        ('Conference', ['conference', 'symposium', 'summit']),
+    ]
+    
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=100)
-        self.classifier = MultinomialNB()
+        self._vectorizer = None
+        self._classifier = None
         self.is_trained = False
+
+    # scikit-learn takes longer to import than the rest of the app to start, and
+    # classification is keyword based, so the models are only created when used.
+    @property
+    def vectorizer(self):
+        if self._vectorizer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self._vectorizer = TfidfVectorizer(max_features=100)
+        return self._vectorizer
+
+    @property
+    def classifier(self):
+        if self._classifier is None:
+            from sklearn.naive_bayes import MultinomialNB
+            self._classifier = MultinomialNB()
+        return self._classifier
     
     def classify_by_keywords(self, text: str) -> str:
         """
@@ -92,15 +115,46 @@ class DomainClassifier:
         """
         text = f"{title} {description}".lower()
         
-        if any(word in text for word in ['workshop', 'seminar', 'training']):
-            return 'Workshop'
-        elif any(word in text for word in ['hackathon', 'hack', 'coding competition']):
-            return 'Hackathon'
-        elif any(word in text for word in ['research', 'internship', 'lab']):
-            return 'Research'
-        elif any(word in text for word in ['scholarship', 'grant', 'funding']):
-            return 'Scholarship'
-        elif any(word in text for word in ['conference', 'symposium', 'summit']):
-            return 'Conference'
-        else:
-            return 'Other'
+        for category, keywords in self.CATEGORY_KEYWORDS:
+            if any(word in text for word in keywords):
+                return category
+        return 'Other'
+    
+    def classify_batch(self, titles: List[str], descriptions: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Classify domain and category for many opportunities in one pass.
+        
+        Produces exactly the results of ``classify_opportunity`` and
+        ``categorize_type`` but lower-cases each text once and matches keyword
+        tuples with C-level ``map`` instead of per-call list construction.
+        
+        Args:
+            titles: Opportunity titles
+            descriptions: Opportunity descriptions (same length as titles)
+            
+        Returns:
+            Tuple of (domains, categories), one entry per opportunity
+        """
+        domain_keywords = [(domain, tuple(keywords)) for domain, keywords in self.DOMAIN_KEYWORDS.items()]
+        category_keywords = [(category, tuple(keywords)) for category, keywords in self.CATEGORY_KEYWORDS]
+        domains: List[str] = []
+        categories: List[str] = []
+        
+        for title, description in zip(titles, descriptions):
+            contains = f"{title or ''} {description or ''}".lower().__contains__
+            
+            best_domain, best_score = 'Other', 0
+            for domain, keywords in domain_keywords:
+                score = sum(map(contains, keywords))
+                if score > best_score:
+                    best_domain, best_score = domain, score
+            domains.append(best_domain)
+            
+            for category, keywords in category_keywords:
+                if any(map(contains, keywords)):
+                    categories.append(category)
+                    break
+            else:
+                categories.append('Other')
+        
+        return domains, categories
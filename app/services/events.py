@@ -0,0 +1,233 @@
+"""
+Live Events
+Publish/subscribe of new opportunities and post like/comment counts, streamed to
+browsers as Server-Sent Events by the ``events`` blueprint.
+
+Every worker process keeps its own subscriber registry. Without ``EVENTS_REDIS_URL``
+events only reach subscribers of the process that published them, which is enough
+for a single worker or a development server. With it, events are published to a
+Redis channel and every process relays them to its local subscribers (needs the
+optional ``redis`` package). Count updates are debounced: a burst of likes on one
+post becomes a single event per ``EVENTS_COUNT_DEBOUNCE_SECONDS``.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from app import db
+from app.models.opportunity import Opportunity
+
+logger = logging.getLogger(__name__)
+
+TOPICS = ('opportunities', 'counts')
+
+
+class Subscription:
+    """One connected stream: a bounded queue of events for its topics and domain."""
+    __slots__ = ('topics', 'domain', '_queue', '_ready')
+
+    def __init__(self, topics: Iterable[str], domain: Optional[str], max_pending: int = 100):
+        self.topics = frozenset(topics)
+        self.domain = domain  # None = every domain
+        self._queue: Deque[Dict] = deque(maxlen=max_pending)  # Slow readers drop the oldest events
+        self._ready = threading.Event()
+
+    def put(self, event: Dict) -> None:
+        self._queue.append(event)
+        self._ready.set()
+
+    def get(self, timeout: float) -> List[Dict]:
+        """Wait up to ``timeout`` seconds and return every queued event (possibly none)."""
+        self._ready.wait(timeout)
+        self._ready.clear()
+        events = []
+        while self._queue:
+            events.append(self._queue.popleft())
+        return events
+
+
+class _RedisRelay:
+    """Shares events between processes through a Redis pub/sub channel."""
+
+    def __init__(self, url: str, channel: str, deliver):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._channel = channel
+        self._deliver = deliver
+        self._pid = None
+
+    def publish(self, event: Dict) -> None:
+        self._client.publish(self._channel, json.dumps(event))
+
+    def ensure_listening(self) -> None:
+        """Start the listener thread in this process (threads do not survive a fork)."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        threading.Thread(target=self._listen, name='events-relay', daemon=True).start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                for message in pubsub.listen():
+                    self._deliver(json.loads(message['data']))
+            except Exception as e:
+                logger.warning(f"Event relay disconnected, retrying: {e}")
+                time.sleep(1)
+
+
+class EventBroker:
+    """Thread-safe in-process pub/sub with optional cross-process relay."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Tuple[str, Optional[str]], Set[Subscription]] = {}
+        self._count = 0
+        self._pending_counts: Dict[int, Tuple[Optional[str], int, int]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._relay: Optional[_RedisRelay] = None
+        self.debounce = 1.0
+        self.heartbeat = 15.0
+        self.max_stream = 300.0
+        self.max_subscribers = 1000
+
+    def init_app(self, app) -> None:
+        """Read limits from the config and connect the Redis relay if configured."""
+        self.debounce = app.config.get('EVENTS_COUNT_DEBOUNCE_SECONDS', self.debounce)
+        self.heartbeat = app.config.get('EVENTS_HEARTBEAT_SECONDS', self.heartbeat)
+        self.max_stream = app.config.get('EVENTS_MAX_STREAM_SECONDS', self.max_stream)
+        self.max_subscribers = app.config.get('EVENTS_MAX_SUBSCRIBERS', self.max_subscribers)
+        url = app.config.get('EVENTS_REDIS_URL')
+        if url:
+            try:
+                self._relay = _RedisRelay(url, app.config.get('EVENTS_REDIS_CHANNEL', 'ivy-events'),
+                                          self._deliver)
+            except ImportError:
+                logger.warning("EVENTS_REDIS_URL is set but redis is not installed; "
+                               "events stay within each process")
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def subscribe(self, topics: Iterable[str], domain: Optional[str] = None) -> Optional[Subscription]:
+        """
+        Register a stream.
+
+        Returns:
+            The subscription, or None when this process already serves ``max_subscribers``
+        """
+        subscription = Subscription(topics, domain)
+        with self._lock:
+            if self._count >= self.max_subscribers:
+                return None
+            for topic in subscription.topics:
+                self._subscribers.setdefault((topic, domain), set()).add(subscription)
+            self._count += 1
+        if self._relay is not None:
+            self._relay.ensure_listening()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for topic in subscription.topics:
+                key = (topic, subscription.domain)
+                subscribers = self._subscribers.get(key)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[key]
+            self._count -= 1
+
+    def publish(self, topic: str, domain: Optional[str], data) -> None:
+        """Send an event to the subscribers of ``topic`` for ``domain`` and for all domains."""
+        event = {'topic': topic, 'domain': domain, 'data': data}
+        if self._relay is not None:
+            try:
+                self._relay.publish(event)
+                return
+            except Exception as e:
+                logger.warning(f"Event relay publish failed, delivering locally: {e}")
+        self._deliver(event)
+
+    def _deliver(self, event: Dict) -> None:
+        with self._lock:
+            targets = set(self._subscribers.get((event['topic'], None), ()))
+            if event['domain'] is not None:
+                targets.update(self._subscribers.get((event['topic'], event['domain']), ()))
+        for subscription in targets:
+            subscription.put(event)
+
+    def post_counts(self, post) -> None:
+        """Queue a post's current like/comment counts; sent after the debounce interval."""
+        with self._lock:
+            self._pending_counts[post.id] = (post.domain, post.likes_count or 0, post.comments_count or 0)
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self._flush_counts)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_counts(self) -> None:
+        with self._lock:
+            pending, self._pending_counts = self._pending_counts, {}
+            self._timer = None
+
+        by_domain: Dict[Optional[str], List[Dict]] = {}
+        for post_id, (domain, likes, comments) in pending.items():
+            by_domain.setdefault(domain, []).append({'id': post_id, 'likes': likes, 'comments': comments})
+        for domain, posts in by_domain.items():
+            self.publish('counts', domain, posts)
+
+    def publish_opportunities(self, opportunity_ids: List[int], sample: int = 5) -> None:
+        """
+        Announce newly ingested opportunities: one event per domain with the count and
+        the newest few, so a bulk import costs as many events as it has domains.
+        """
+        from app.services.notifications import NotificationFanout
+
+        if not opportunity_ids:
+            return
+        groups = NotificationFanout.group_by_domain(opportunity_ids)
+        newest = db.session.execute(
+            select(Opportunity.id, Opportunity.title, Opportunity.university, Opportunity.category,
+                   Opportunity.domain)
+            .where(Opportunity.id.in_(sorted(opportunity_ids)[-sample * max(len(groups), 1):]))
+            .order_by(Opportunity.id.desc())
+        ).all()
+
+        for domain, (count, _) in groups.items():
+            items = [{'id': row.id, 'title': row.title, 'university': row.university, 'category': row.category}
+                     for row in newest if row.domain == domain][:sample]
+            self.publish('opportunities', domain, {'domain': domain, 'count': count, 'newest': items})
+
+    def stream(self, subscription: Subscription) -> Iterator[str]:
+        """
+        Server-Sent Events for a subscription.
+
+        Sends a comment line every ``heartbeat`` seconds so proxies keep the connection
+        open and a closed client is noticed, and ends after ``max_stream`` seconds;
+        EventSource reconnects on its own, which rebalances streams across workers.
+        """
+        deadline = time.monotonic() + self.max_stream
+        try:
+            yield 'retry: 3000\n\n'
+            while time.monotonic() < deadline:
+                events = subscription.get(timeout=min(self.heartbeat, max(deadline - time.monotonic(), 0)))
+                if not events:
+                    yield ': ping\n\n'
+                for event in events:
+                    yield f"event: {event['topic']}\ndata: {json.dumps(event['data'])}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+
+event_broker = EventBroker()
@@ -0,0 +1,146 @@
+"""
+Bulk Data Export
+Streams opportunities, applications and the InCoScore leaderboard as NDJSON, CSV or
+Parquet using server-side cursors, so memory stays flat regardless of row count.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, func, select
+
+from app import db
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+
+
+class DataExporter:
+    """Incremental, chunked exports keyed on ``updated_at`` watermarks."""
+
+    DATASETS = ('opportunities', 'applications', 'leaderboard')
+    FORMATS = ('ndjson', 'csv', 'parquet')
+
+    OPPORTUNITY_COLUMNS = [
+        'id', 'title', 'description', 'university', 'domain', 'category', 'deadline', 'url',
+        'requirements', 'location', 'is_active', 'created_by', 'extracted_at', 'updated_at',
+    ]
+    APPLICATION_COLUMNS = ['id', 'student_id', 'opportunity_id', 'status', 'submitted_at', 'updated_at']
+    LEADERBOARD_COLUMNS = [
+        'id', 'username', 'full_name', 'domain', 'incoscore', 'hackathons_count', 'internships_count',
+        'research_papers_count', 'coding_score', 'competition_wins', 'updated_at',
+    ]
+
+    def __init__(self, dataset: str, since: Optional[datetime] = None, chunk_size: int = 1000):
+        if dataset not in self.DATASETS:
+            raise ValueError(f'Unknown dataset: {dataset}')
+        self.dataset = dataset
+        self.since = since
+        self.chunk_size = chunk_size
+        self.model = {'opportunities': Opportunity, 'applications': Application, 'leaderboard': User}[dataset]
+        # Upper bound fixed up front so an export is a consistent slice and the
+        # next incremental export can start exactly where this one ended
+        self.watermark: Optional[datetime] = db.session.execute(
+            select(func.max(self.model.updated_at))
+        ).scalar()
+
+    def _statement(self):
+        model = self.model
+        if self.dataset == 'leaderboard':
+            ranked = select(
+                *[getattr(User, c) for c in self.LEADERBOARD_COLUMNS],
+                func.rank().over(order_by=User.incoscore.desc()).label('rank'),
+                func.rank().over(partition_by=User.domain, order_by=User.incoscore.desc()).label('domain_rank'),
+            ).subquery()
+            stmt = select(ranked).order_by(ranked.c.rank, ranked.c.id)
+            updated_at = ranked.c.updated_at
+        else:
+            names = self.OPPORTUNITY_COLUMNS if self.dataset == 'opportunities' else self.APPLICATION_COLUMNS
+            stmt = select(*[getattr(model, c) for c in names]).order_by(model.id)
+            updated_at = model.updated_at
+
+        if self.since is not None:
+            stmt = stmt.where(updated_at > self.since)
+        if self.watermark is not None:
+            stmt = stmt.where(updated_at <= self.watermark)
+        return stmt
+
+    @property
+    def columns(self) -> List[str]:
+        if self.dataset == 'leaderboard':
+            return self.LEADERBOARD_COLUMNS + ['rank', 'domain_rank']
+        return self.OPPORTUNITY_COLUMNS if self.dataset == 'opportunities' else self.APPLICATION_COLUMNS
+
+    def iter_chunks(self) -> Iterator[List[Dict]]:
+        """Yield lists of row dicts, ``chunk_size`` rows at a time, from a streaming cursor."""
+        result = db.session.execute(
+            self._statement(),
+            execution_options={'yield_per': self.chunk_size, 'stream_results': True},
+        )
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+    @staticmethod
+    def _serialize(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """Yield newline-delimited JSON, one chunk of lines per iteration."""
+        for chunk in self.iter_chunks():
+            yield ''.join(
+                json.dumps({key: self._serialize(value) for key, value in row.items()}) + '\n'
+                for row in chunk
+            )
+
+    def iter_csv(self) -> Iterator[str]:
+        """Yield CSV text: the header first, then one block per chunk."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.columns)
+        writer.writeheader()
+        yield buffer.getvalue()
+
+        for chunk in self.iter_chunks():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows({key: self._serialize(value) for key, value in row.items()} for row in chunk)
+            yield buffer.getvalue()
+
+    def _arrow_schema(self):
+        import pyarrow as pa
+
+        types = {Integer: pa.int64(), Float: pa.float64(), Boolean: pa.bool_(), DateTime: pa.timestamp('us')}
+        fields = []
+        for name in self.columns:
+            column = getattr(self.model, name, None)
+            arrow_type = pa.int64() if column is None else pa.string()
+            if column is not None:
+                for sql_type, candidate in types.items():
+                    if isinstance(column.type, sql_type):
+                        arrow_type = candidate
+                        break
+            fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+    def write_parquet(self, path: str) -> int:
+        """
+        Write the export to a Parquet file, one row group per chunk.
+
+        Requires the optional ``pyarrow`` package.
+
+        Returns:
+            Number of rows written
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError('Parquet export requires pyarrow (pip install pyarrow)')
+
+        schema = self._arrow_schema()
+        rows = 0
+        with pq.ParquetWriter(path, schema, compression='snappy') as writer:
+            for chunk in self.iter_chunks():
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                rows += len(chunk)
+        return rows
@@ -0,0 +1,206 @@
+"""
+Opportunity Change History
+Re-scraped opportunities are diffed field by field and only the changed fields are
+appended to ``opportunity_changes``.
+
+Scraped records are matched to existing scraped opportunities (``created_by`` unset)
+by title and university, or by URL and university for edited titles; student-created
+opportunities are never matched or rewritten. ``Opportunity.content_hash`` covers the scraped source fields, so unchanged
+records are recognised from the hash alone: the matching query loads
+``(id, title, university, url, content_hash)`` only, and full rows are read (and re-classified)
+just for records whose content actually changed. Consumers read the log
+incrementally with ``changes_since``, using the change id as a cursor.
+"""
+import hashlib
+import json
+import logging
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+
+from app import db
+from app.models.opportunity import Opportunity, OpportunityChange
+from app.services.bulk import chunked
+
+logger = logging.getLogger(__name__)
+
+SOURCE_FIELDS = ('title', 'description', 'university', 'url')  # Scraped, hashed
+DERIVED_FIELDS = ('domain', 'category')  # Re-classified when the text changes
+TRACKED_FIELDS = SOURCE_FIELDS + DERIVED_FIELDS + ('deadline', 'location', 'requirements')
+
+
+def content_hash(values: Dict) -> str:
+    """SHA-1 of the scraped source fields of a record or opportunity."""
+    canonical = json.dumps([values.get(name) or '' for name in SOURCE_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_delta(delta: Dict[str, Tuple]) -> bytes:
+    return zlib.compress(json.dumps({name: [_json_value(old), _json_value(new)] for name, (old, new)
+                                     in delta.items()}, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def decode_delta(data: bytes) -> Dict[str, Dict]:
+    return {name: {'old': old, 'new': new} for name, (old, new) in json.loads(zlib.decompress(data)).items()}
+
+
+class OpportunityHistory:
+    """Diffs scraped records against the catalog and reads the change log."""
+
+    @staticmethod
+    def record(opportunity: Opportunity, delta: Dict[str, Tuple], kind: str = 'updated',
+               now: Optional[datetime] = None) -> Optional[OpportunityChange]:
+        """Append a change of ``opportunity`` (added to the session, not committed)."""
+        if not delta:
+            return None
+        change = OpportunityChange(
+            opportunity_id=opportunity.id, kind=kind, fields=','.join(delta),
+            content_hash=opportunity.content_hash, delta=encode_delta(delta), changed_at=now or datetime.utcnow(),
+        )
+        db.session.add(change)
+        return change
+
+    @staticmethod
+    def _match(records: List[Dict]) -> Dict[int, Tuple]:
+        """Map record index -> (id, content_hash) of the existing scraped opportunity."""
+        from app.services.scraper import OpportunityScraper
+
+        scraped = Opportunity.created_by.is_(None)
+        by_title, by_url = {}, {}
+        for chunk in chunked(sorted({record['title'] for record in records}), 500):
+            for row in db.session.execute(select(Opportunity.id, Opportunity.title, Opportunity.university,
+                                                 Opportunity.content_hash)
+                                          .where(Opportunity.title.in_(chunk), scraped)):
+                by_title.setdefault((row.title, row.university), (row.id, row.content_hash))
+
+        # An edited title keeps its event page; listing pages (the fallback URL) and URLs
+        # shared by several records identify nothing
+        url_counts = Counter(record.get('url') for record in records)
+        shared = set(OpportunityScraper.IVY_LEAGUE_URLS.values())
+        unmatched = {record['url'] for record in records
+                     if (record['title'], record.get('university')) not in by_title
+                     and record.get('url') and url_counts[record['url']] == 1 and record['url'] not in shared}
+        for chunk in chunked(sorted(unmatched), 500):
+            for row in db.session.execute(select(Opportunity.id, Opportunity.url, Opportunity.university,
+                                                 Opportunity.content_hash)
+                                          .where(Opportunity.url.in_(chunk), scraped)):
+                by_url.setdefault((row.url, row.university), (row.id, row.content_hash))
+
+        matches = {}
+        for index, record in enumerate(records):
+            found = (by_title.get((record['title'], record.get('university')))
+                     or by_url.get((record.get('url'), record.get('university'))))
+            if found is not None:
+                matches[index] = found
+        return matches
+
+    @staticmethod
+    def sync_scraped(records: List[Dict], classifier) -> Tuple[List[Opportunity], List[Opportunity]]:
+        """
+        Insert new scraped records and apply edits to known ones, logging every change.
+
+        Args:
+            records: Scraper output (title, description, university, url)
+            classifier: DomainClassifier for new and re-worded opportunities
+
+        Returns:
+            ``(created, updated)`` opportunities, added to the session but not committed
+        """
+        now = datetime.utcnow()
+        matches = OpportunityHistory._match(records)
+        created, updated, seen = [], [], set()
+        changed = {}
+        for index, record in enumerate(records):
+            digest = content_hash(record)
+            match = matches.get(index)
+            if match is None:
+                key = (record['title'], record.get('university'))
+                if key in seen:
+                    continue  # Listed twice in one scrape
+                seen.add(key)
+                opportunity = Opportunity(
+                    title=record['title'], description=record['description'], university=record['university'],
+                    url=record['url'], content_hash=digest,
+                    domain=classifier.classify_opportunity(record['title'], record['description']),
+                    category=classifier.categorize_type(record['title'], record['description']),
+                )
+                db.session.add(opportunity)
+                created.append(opportunity)
+            elif match[1] != digest and match[0] not in changed:
+                changed[match[0]] = (record, digest)
+
+        if changed:
+            for opportunity in Opportunity.query.filter(Opportunity.id.in_(list(changed))):
+                record, digest = changed[opportunity.id]
+                delta = {name: (getattr(opportunity, name), record[name]) for name in SOURCE_FIELDS
+                         if record.get(name) is not None and getattr(opportunity, name) != record[name]}
+                if 'title' in delta or 'description' in delta:
+                    text = (record['title'], record['description'])
+                    for name, value in (('domain', classifier.classify_opportunity(*text)),
+                                        ('category', classifier.categorize_type(*text))):
+                        if getattr(opportunity, name) != value:
+                            delta[name] = (getattr(opportunity, name), value)
+                for name, (_, new) in delta.items():
+                    setattr(opportunity, name, new)
+                opportunity.content_hash = digest  # Also backfills rows scraped before hashing
+                if OpportunityHistory.record(opportunity, delta, now=now) is not None:
+                    updated.append(opportunity)
+
+        db.session.flush()  # Assign ids to the new opportunities
+        for opportunity in created:
+            OpportunityHistory.record(opportunity, {name: (None, getattr(opportunity, name))
+                                                    for name in SOURCE_FIELDS + DERIVED_FIELDS
+                                                    if getattr(opportunity, name) is not None},
+                                      kind='created', now=now)
+        if updated:
+            logger.info(f"Scrape changed {len(updated)} known opportunities")
+        return created, updated
+
+    @staticmethod
+    def changes_since(after: Optional[int] = None, since: Optional[datetime] = None, limit: int = 500,
+                      fields: Optional[Iterable[str]] = None,
+                      opportunity_id: Optional[int] = None) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Changes in log order, starting after change id ``after`` (or at time ``since``).
+
+        Args:
+            after: Cursor returned by the previous call
+            since: Start at the first change at or after this time (when no cursor)
+            limit: Maximum number of changes
+            fields: Only changes touching one of these fields
+            opportunity_id: Only changes of this opportunity
+
+        Returns:
+            ``(changes, cursor)``; pass the cursor as ``after`` to continue
+        """
+        query = select(OpportunityChange)
+        if after is not None:
+            query = query.where(OpportunityChange.id > after)
+        elif since is not None:
+            query = query.where(OpportunityChange.changed_at >= since)
+        if opportunity_id is not None:
+            query = query.where(OpportunityChange.opportunity_id == opportunity_id)
+        fields = [name for name in (fields or ()) if name in TRACKED_FIELDS]
+        if fields:
+            # Field names are unique within the comma-separated list
+            query = query.where(or_(*[(',' + OpportunityChange.fields + ',').contains(f',{name},')
+                                      for name in fields]))
+
+        rows = db.session.execute(query.order_by(OpportunityChange.id).limit(limit)).scalars().all()
+        changes = [{
+            'id': change.id,
+            'opportunity_id': change.opportunity_id,
+            'kind': change.kind,
+            'changed_at': change.changed_at.isoformat(),
+            'fields': change.fields.split(','),
+            'content_hash': change.content_hash,
+            'changes': decode_delta(change.delta),
+        } for change in rows]
+        return changes, rows[-1].id if rows else after
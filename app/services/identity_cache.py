@@ -0,0 +1,57 @@
+"""
+Identity Cache
+Per-process, short-TTL cache of the slim user projection used as the Flask-Login session principal.
+Each worker keeps its own copy, so cross-worker staleness is bounded by the TTL.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class IdentityCache:
+    """Thread-safe LRU cache with a fixed time-to-live per entry."""
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Read TTL and size limits from the application config."""
+        self.ttl = app.config.get('USER_CACHE_TTL_SECONDS', self.ttl)
+        self.max_size = app.config.get('USER_CACHE_MAX_SIZE', self.max_size)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,230 @@
+"""
+Bulk Opportunity Import
+Streams CSV / JSON Lines / JSON files of opportunities in chunks, validates them,
+classifies missing domain/category in batch, dedupes and bulk-inserts.
+"""
+import csv
+import io
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+
+from app import db
+from app.models.opportunity import Opportunity
+from app.services.bulk import chunked
+from app.services.classifier import DomainClassifier
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidRecordError(ValueError):
+    """Raised for a row that fails validation."""
+
+
+class OpportunityImporter:
+    """Chunked importer with a per-row error report."""
+
+    FORMATS = ('csv', 'jsonl', 'json')
+    FIELDS = ['title', 'description', 'university', 'domain', 'category', 'deadline',
+              'url', 'requirements', 'location', 'is_active']
+    MAX_LENGTHS = {'title': 255, 'university': 100, 'domain': 50, 'category': 50, 'url': 500, 'location': 100}
+    CATEGORIES = [category for category, _ in DomainClassifier.CATEGORY_KEYWORDS] + ['Other']
+    MAX_REPORTED_ERRORS = 1000
+
+    def __init__(self, chunk_size: int = 5000, created_by: Optional[int] = None):
+        self.chunk_size = chunk_size
+        self.created_by = created_by
+        self.classifier = DomainClassifier()
+
+    @staticmethod
+    def read_records(stream: IO[bytes], fmt: str) -> Iterator[Tuple[int, Dict]]:
+        """
+        Yield ``(row_number, record)`` pairs from a binary stream.
+
+        CSV and JSON Lines are read incrementally; a JSON array has to be parsed whole.
+        """
+        if fmt not in OpportunityImporter.FORMATS:
+            raise ValueError(f'Unsupported format: {fmt}')
+
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        try:
+            if fmt == 'csv':
+                for number, record in enumerate(csv.DictReader(text), 1):
+                    yield number, record
+            elif fmt == 'jsonl':
+                for number, line in enumerate(text, 1):
+                    if line.strip():
+                        try:
+                            yield number, json.loads(line)
+                        except json.JSONDecodeError as e:
+                            yield number, {'__error__': f'Invalid JSON: {e.msg}'}
+            else:
+                records = json.load(text)
+                if not isinstance(records, list):
+                    raise ValueError('JSON import must be an array of objects')
+                for number, record in enumerate(records, 1):
+                    yield number, record
+        finally:
+            text.detach()  # Leave the caller's stream open
+
+    @staticmethod
+    def _parse_deadline(value) -> Optional[datetime]:
+        if value in (None, ''):
+            return None
+        try:
+            return datetime.fromisoformat(str(value).strip())
+        except ValueError:
+            raise InvalidRecordError('Invalid deadline, use YYYY-MM-DD or ISO 8601')
+
+    @staticmethod
+    def _parse_bool(value) -> bool:
+        if value in (None, ''):
+            return True
+        if isinstance(value, bool):
+            return value
+        if str(value).strip().lower() in ('1', 'true', 'yes', 'y'):
+            return True
+        if str(value).strip().lower() in ('0', 'false', 'no', 'n'):
+            return False
+        raise InvalidRecordError('Invalid is_active, use true/false')
+
+    def validate(self, record: Dict) -> Dict:
+        """
+        Normalize one record into insertable column values.
+
+        Raises:
+            InvalidRecordError: If the record is invalid
+        """
+        if not isinstance(record, dict):
+            raise InvalidRecordError('Record must be an object')
+        if '__error__' in record:
+            raise InvalidRecordError(record['__error__'])
+
+        row = {field: record.get(field) for field in self.FIELDS}
+        for field in ('title', 'description', 'university', 'domain', 'category', 'url', 'requirements', 'location'):
+            value = row[field]
+            row[field] = str(value).strip() if value not in (None, '') else None
+
+        if not row['title'] or not row['description']:
+            raise InvalidRecordError('Title and description are required')
+        for field, limit in self.MAX_LENGTHS.items():
+            if row[field] and len(row[field]) > limit:
+                raise InvalidRecordError(f'{field} longer than {limit} characters')
+        if row['domain'] and row['domain'] not in DomainClassifier.DOMAINS:
+            raise InvalidRecordError(f'Unknown domain: {row["domain"]}')
+        if row['category'] and row['category'] not in self.CATEGORIES:
+            raise InvalidRecordError(f'Unknown category: {row["category"]}')
+
+        row['deadline'] = self._parse_deadline(row['deadline'])
+        row['is_active'] = self._parse_bool(row['is_active'])
+        row['created_by'] = self.created_by
+        return row
+
+    def _classify_missing(self, rows: List[Dict]) -> None:
+        missing = [row for row in rows if not row['domain'] or not row['category']]
+        if not missing:
+            return
+        domains, categories = self.classifier.classify_batch(
+            [row['title'] for row in missing], [row['description'] for row in missing])
+        for row, domain, category in zip(missing, domains, categories):
+            row['domain'] = row['domain'] or domain
+            row['category'] = row['category'] or category
+
+    def import_records(self, records: Iterator[Tuple[int, Dict]],
+                       progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Import records chunk by chunk.
+
+        Duplicates (same title as an existing opportunity or an earlier row) are
+        skipped, matching the scraper's dedupe rule.
+
+        Args:
+            records: ``(row_number, record)`` pairs, e.g. from ``read_records``
+            progress: Optional callback ``(rows_read, rows_inserted)``
+
+        Returns:
+            Report with row counts, inserted IDs count and per-row errors
+        """
+        report = {'rows': 0, 'inserted': 0, 'duplicates': 0, 'error_count': 0, 'errors': []}
+        seen_titles = set()
+        inserted_ids: List[int] = []
+        # Core table insert: skips the ORM bulk-persistence layer, which dominates at this volume
+        table = Opportunity.__table__
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+
+        for chunk in chunked(records, self.chunk_size):
+            valid = []
+            for number, record in chunk:
+                try:
+                    valid.append(self.validate(record))
+                except InvalidRecordError as e:
+                    report['error_count'] += 1
+                    if len(report['errors']) < self.MAX_REPORTED_ERRORS:
+                        report['errors'].append({'row': number, 'error': str(e)})
+            report['rows'] += len(chunk)
+
+            titles = {row['title'] for row in valid}
+            existing = set(db.session.execute(
+                select(Opportunity.title).where(Opportunity.title.in_(titles))
+            ).scalars()) if titles else set()
+
+            fresh = []
+            for row in valid:
+                if row['title'] in existing or row['title'] in seen_titles:
+                    report['duplicates'] += 1
+                    continue
+                seen_titles.add(row['title'])
+                fresh.append(row)
+
+            self._classify_missing(fresh)
+            if fresh:
+                inserted_ids.extend(db.session.execute(stmt, fresh).scalars().all())
+                db.session.commit()
+            report['inserted'] = len(inserted_ids)
+            if progress:
+                progress(report['rows'], report['inserted'])
+
+        report['inserted_ids'] = inserted_ids
+        logger.info(f"Imported {report['inserted']} of {report['rows']} opportunities "
+                    f"({report['duplicates']} duplicates, {report['error_count']} errors)")
+        return report
+
+    def import_file(self, path: str, fmt: str, delete_after: bool = False,
+                    progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Import a file from disk and fan out notifications for the new opportunities.
+
+        Args:
+            path: File to import
+            fmt: One of ``FORMATS``
+            delete_after: Remove the file when done (used for uploads)
+            progress: Optional callback ``(bytes_read, file_size)``
+
+        Returns:
+            Import report
+        """
+        from app.services.catalog import catalog
+        from app.services.events import event_broker
+        from app.services.notifications import NotificationFanout
+
+        size = os.path.getsize(path)
+        try:
+            with open(path, 'rb') as stream:
+                report = self.import_records(
+                    self.read_records(stream, fmt),
+                    progress=(lambda rows, inserted: progress(stream.tell(), size)) if progress else None,
+                )
+        finally:
+            if delete_after:
+                os.remove(path)
+
+        inserted_ids = report.pop('inserted_ids')
+        if inserted_ids:
+            catalog.mark_stale()
+            event_broker.publish_opportunities(inserted_ids)
+            report['notifications'] = NotificationFanout.fan_out(inserted_ids)['notifications']
+        return report
@@ -0,0 +1,91 @@
+"""
+Background Jobs
+Runs long operations off the request path in a bounded thread pool and records
+their progress in the ``jobs`` table so any worker can report it.
+"""
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from flask import Flask
+from sqlalchemy import update
+
+from app import db
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """Thread-pool executor for background jobs with persisted progress."""
+
+    def __init__(self):
+        self.app: Optional[Flask] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def init_app(self, app: Flask) -> None:
+        """Bind the runner to an application (threads start lazily on first submit)."""
+        self.app = app
+        self.executor = ThreadPoolExecutor(max_workers=app.config.get('JOB_WORKERS', 2),
+                                           thread_name_prefix='job')
+
+    def submit(self, name: str, func: Callable, *args, created_by: Optional[int] = None, **kwargs) -> int:
+        """
+        Queue ``func`` to run in the background.
+
+        The callable receives a ``progress(done, total)`` keyword argument and
+        should return a JSON-serializable result.
+
+        Args:
+            name: Job name shown in status responses
+            func: Callable to execute inside an application context
+            created_by: ID of the user who started the job (optional)
+
+        Returns:
+            ID of the created job record
+        """
+        job = Job(name=name, status='queued', created_by=created_by)
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+        self.executor.submit(self._run, job_id, func, args, kwargs)
+        return job_id
+
+    def run_now(self, name: str, func: Callable, *args, created_by: Optional[int] = None, **kwargs):
+        """Run a job synchronously in the current context, still recording its progress."""
+        job = Job(name=name, status='queued', created_by=created_by)
+        db.session.add(job)
+        db.session.commit()
+        return self._execute(job.id, func, args, kwargs)
+
+    def _update(self, job_id: int, **values) -> None:
+        db.session.execute(update(Job).where(Job.id == job_id).values(**values))
+        db.session.commit()
+
+    def _run(self, job_id: int, func: Callable, args: tuple, kwargs: dict) -> None:
+        with self.app.app_context():
+            try:
+                self._execute(job_id, func, args, kwargs)
+            except Exception:
+                pass  # Already recorded on the job
+
+    def _execute(self, job_id: int, func: Callable, args: tuple, kwargs: dict):
+        self._update(job_id, status='running')
+
+        def progress(done: int, total: int) -> None:
+            self._update(job_id, progress=done, total=total)
+
+        try:
+            result = func(*args, progress=progress, **kwargs)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Job {job_id} failed: {str(e)}")
+            self._update(job_id, status='failed', error=str(e))
+            raise
+
+        self._update(job_id, status='finished', result=json.dumps(result))
+        return result
+
+
+job_runner = JobRunner()
@@ -0,0 +1,308 @@
+"""
+Leaderboard History
+Periodic snapshots of the InCoScore standings, overall and per domain, and the
+rank changes between them.
+
+A snapshot stores three columns for every ranked student, ordered by user id:
+the user id (delta-encoded, so dense ids cost almost nothing), the competition rank
+(ties share a rank) and the score in hundredths. Columns are split into blocks of
+``BLOCK_SIZE`` users; each block is byte-shuffled and zlib-compressed on its own and
+the header records the first user id and byte offset of every block. Comparing two
+snapshots decodes both in full with numpy, while one student's history reads a single
+block of each snapshot straight out of the database (``substr`` on the blob).
+"""
+import logging
+import struct
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, select
+
+from app import db
+from app.models.leaderboard import LeaderboardSnapshot
+from app.models.user import User
+from app.services.bulk import chunked
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'LBS1'
+HEADER = struct.Struct('<4sIII')  # magic, users, block size, blocks
+BLOCK_SIZE = 65536
+PREFIX_BYTES = 4096  # Enough header for 250 blocks (16M users) in one read
+COLUMNS = (('id_deltas', np.dtype('<u4')), ('ranks', np.dtype('<u4')), ('scores', np.dtype('<i8')))
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    """Group the n-th byte of every value together; the zero high bytes then compress away."""
+    return array.view(np.uint8).reshape(-1, array.itemsize).T.tobytes()
+
+
+def _unshuffle(data: bytes, dtype: np.dtype, count: int) -> np.ndarray:
+    planes = np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, count)
+    return planes.T.copy().view(dtype).reshape(count)
+
+
+def competition_ranks(scores: np.ndarray) -> np.ndarray:
+    """Rank 1 for the highest score; equal scores share the better rank (1, 2, 2, 4)."""
+    if not len(scores):
+        return np.empty(0, dtype=np.uint32)
+    order = np.argsort(-scores, kind='stable')
+    negated = -scores[order]  # Ascending, so searchsorted finds the first of each tie
+    ranks = np.empty(len(scores), dtype=np.uint32)
+    ranks[order] = np.searchsorted(negated, negated, side='left') + 1
+    return ranks
+
+
+def encode(user_ids: np.ndarray, ranks: np.ndarray, scores: np.ndarray, level: int = 6) -> bytes:
+    """
+    Pack id-sorted columns into the snapshot format.
+
+    Args:
+        user_ids: Strictly increasing user ids
+        ranks: Rank of each user
+        scores: Score of each user in hundredths
+    """
+    count = len(user_ids)
+    blocks, first_ids, offsets = [], [], [0]
+    for start in range(0, count, BLOCK_SIZE):
+        ids = user_ids[start:start + BLOCK_SIZE].astype(np.int64)
+        deltas = np.diff(ids, prepend=ids[0]).astype(np.uint32)
+        payload = b''.join((_shuffle(deltas), _shuffle(ranks[start:start + BLOCK_SIZE].astype(np.uint32)),
+                            _shuffle(scores[start:start + BLOCK_SIZE].astype(np.int64))))
+        blocks.append(zlib.compress(payload, level))
+        first_ids.append(ids[0])
+        offsets.append(offsets[-1] + len(blocks[-1]))
+    return b''.join([HEADER.pack(MAGIC, count, BLOCK_SIZE, len(blocks)),
+                     np.array(first_ids, dtype='<i8').tobytes(), np.array(offsets, dtype='<i8').tobytes()]
+                    + blocks)
+
+
+def _read_header(data: bytes) -> Tuple[int, int, np.ndarray, np.ndarray, int]:
+    """Return ``(users, block size, first ids, block offsets, payload start)``."""
+    magic, count, block_size, blocks = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Not a leaderboard snapshot')
+    first_ids = np.frombuffer(data, dtype='<i8', count=blocks, offset=HEADER.size)
+    offsets = np.frombuffer(data, dtype='<i8', count=blocks + 1, offset=HEADER.size + 8 * blocks)
+    return count, block_size, first_ids, offsets, HEADER.size + 8 * (2 * blocks + 1)
+
+
+def _header_size(data: bytes) -> int:
+    return HEADER.size + 8 * (2 * HEADER.unpack_from(data)[3] + 1)
+
+
+def _decode_block(block: bytes, first_id: int, count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    payload = zlib.decompress(block)
+    columns, offset = [], 0
+    for _, dtype in COLUMNS:
+        size = dtype.itemsize * count
+        columns.append(_unshuffle(payload[offset:offset + size], dtype, count))
+        offset += size
+    user_ids = first_id + np.cumsum(columns[0], dtype=np.int64)
+    return user_ids, columns[1], columns[2]
+
+
+def decode(data: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unpack a snapshot into ``(user_ids, ranks, scores in hundredths)``, ordered by user id."""
+    count, block_size, first_ids, offsets, start = _read_header(data)
+    parts = [_decode_block(data[start + offsets[i]:start + offsets[i + 1]], int(first_ids[i]),
+                           min(block_size, count - i * block_size)) for i in range(len(first_ids))]
+    if not parts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.int64)
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+class LeaderboardHistory:
+    """Takes, prunes and compares leaderboard snapshots."""
+
+    @staticmethod
+    def snapshot(now: Optional[datetime] = None) -> Dict:
+        """
+        Record the current standings overall and for every domain.
+
+        Returns:
+            Snapshot statistics (users, snapshots written, bytes, seconds)
+        """
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        ids, scores, codes, domains = [], [], [], {}
+        stmt = select(User.id, User.domain, User.incoscore).order_by(User.id)
+        for user_id, domain, score in db.session.execute(stmt, execution_options={'yield_per': 10000}):
+            ids.append(user_id)
+            scores.append(score or 0.0)
+            codes.append(domains.setdefault(domain or '', len(domains)))
+
+        user_ids = np.array(ids, dtype=np.int64)
+        cents = np.rint(np.array(scores, dtype=np.float64) * 100).astype(np.int64)
+        codes = np.array(codes, dtype=np.int32)
+        del ids, scores
+
+        rankings = [('', np.ones(len(user_ids), dtype=bool))]
+        rankings += [(domain, codes == code) for domain, code in domains.items() if domain]
+        size = 0
+        for domain, members in rankings:
+            data = encode(user_ids[members], competition_ranks(cents[members]), cents[members])
+            db.session.add(LeaderboardSnapshot(taken_at=now, domain=domain, users=int(members.sum()),
+                                               size=len(data), data=data))
+            size += len(data)
+        db.session.commit()
+
+        stats = {'users': len(user_ids), 'snapshots': len(rankings), 'bytes': size,
+                 'seconds': round(time.perf_counter() - started, 3)}
+        logger.info(f"Took leaderboard snapshot: {stats}")
+        return stats
+
+    @staticmethod
+    def prune(keep_hourly_days: int = 7, retention_days: int = 365, now: Optional[datetime] = None) -> int:
+        """
+        Thin out old snapshots: older than ``keep_hourly_days`` only the first of each
+        day is kept, and everything older than ``retention_days`` is deleted.
+
+        Returns:
+            Number of snapshots deleted
+        """
+        now = now or datetime.utcnow()
+        expired = db.session.execute(
+            delete(LeaderboardSnapshot).where(LeaderboardSnapshot.taken_at < now - timedelta(days=retention_days))
+        ).rowcount
+
+        seen, surplus = set(), []
+        old = db.session.execute(
+            select(LeaderboardSnapshot.id, LeaderboardSnapshot.domain, LeaderboardSnapshot.taken_at)
+            .where(LeaderboardSnapshot.taken_at < now - timedelta(days=keep_hourly_days))
+            .order_by(LeaderboardSnapshot.taken_at)
+        )
+        for snapshot_id, domain, taken_at in old:
+            key = (domain, taken_at.date())
+            if key in seen:
+                surplus.append(snapshot_id)
+            seen.add(key)
+        for chunk in chunked(surplus, 500):
+            db.session.execute(delete(LeaderboardSnapshot).where(LeaderboardSnapshot.id.in_(chunk)))
+        db.session.commit()
+        return expired + len(surplus)
+
+    @staticmethod
+    def run(keep_hourly_days: int = 7, retention_days: int = 365) -> Dict:
+        """Scheduler entry point: take a snapshot, then prune old ones."""
+        stats = LeaderboardHistory.snapshot()
+        stats['pruned'] = LeaderboardHistory.prune(keep_hourly_days, retention_days)
+        return stats
+
+    @staticmethod
+    def list(domain: str = '', limit: int = 50) -> List[LeaderboardSnapshot]:
+        """Newest snapshots of a domain ('' for the overall leaderboard)."""
+        return LeaderboardSnapshot.query.filter_by(domain=domain)\
+                                        .order_by(LeaderboardSnapshot.taken_at.desc())\
+                                        .limit(limit)\
+                                        .all()
+
+    @staticmethod
+    def at(domain: str, before: Optional[datetime] = None) -> Optional[LeaderboardSnapshot]:
+        """Latest snapshot of a domain, optionally the latest taken at or before ``before``."""
+        query = LeaderboardSnapshot.query.filter_by(domain=domain)
+        if before is not None:
+            query = query.filter(LeaderboardSnapshot.taken_at <= before)
+        return query.order_by(LeaderboardSnapshot.taken_at.desc()).first()
+
+    @staticmethod
+    def previous(snapshot: LeaderboardSnapshot) -> Optional[LeaderboardSnapshot]:
+        return LeaderboardSnapshot.query.filter(LeaderboardSnapshot.domain == snapshot.domain,
+                                                LeaderboardSnapshot.taken_at < snapshot.taken_at)\
+                                        .order_by(LeaderboardSnapshot.taken_at.desc())\
+                                        .first()
+
+    @staticmethod
+    def changes(old: LeaderboardSnapshot, new: LeaderboardSnapshot, limit: int = 20) -> Dict:
+        """
+        Rank changes between two snapshots of the same domain.
+
+        Returns:
+            Counts of students who moved, entered and left, and the ``limit`` biggest
+            risers and fallers (a positive ``change`` means places gained)
+        """
+        old_ids, old_ranks, _ = decode(old.data)
+        new_ids, new_ranks, new_scores = decode(new.data)
+        common, old_index, new_index = np.intersect1d(old_ids, new_ids, assume_unique=True, return_indices=True)
+        change = old_ranks[old_index].astype(np.int64) - new_ranks[new_index].astype(np.int64)
+
+        def top(order_key: np.ndarray, wanted: np.ndarray) -> List[int]:
+            if limit <= 0:
+                return []
+            candidates = np.flatnonzero(wanted)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(order_key[candidates], limit - 1)[:limit]]
+            # Biggest move first, better current rank first among equal moves
+            return candidates[np.lexsort((new_ranks[new_index[candidates]], order_key[candidates]))].tolist()
+
+        risers, fallers = top(-change, change > 0), top(change, change < 0)
+        users = {row.id: row for row in db.session.execute(
+            select(User.id, User.username, User.full_name)
+            .where(User.id.in_([int(common[i]) for i in risers + fallers]))
+        )}
+
+        def describe(i: int) -> Dict:
+            user = users.get(int(common[i]))
+            return {
+                'user_id': int(common[i]),
+                'username': user.username if user else None,
+                'name': user.full_name if user else None,
+                'old_rank': int(old_ranks[old_index[i]]),
+                'new_rank': int(new_ranks[new_index[i]]),
+                'change': int(change[i]),
+                'incoscore': int(new_scores[new_index[i]]) / 100,
+            }
+
+        return {
+            'domain': new.domain or None,
+            'from': old.to_dict(),
+            'to': new.to_dict(),
+            'moved': int(np.count_nonzero(change)),
+            'entered': len(new_ids) - len(common),
+            'left': len(old_ids) - len(common),
+            'risers': [describe(i) for i in risers],
+            'fallers': [describe(i) for i in fallers],
+        }
+
+    @staticmethod
+    def history(user_id: int, domain: str = '', limit: int = 168,
+                since: Optional[datetime] = None) -> List[Dict]:
+        """
+        A student's rank and score in each of the newest ``limit`` snapshots of a domain.
+
+        Reads the header and the one block that can hold ``user_id`` from every
+        snapshot instead of the whole blob.
+        """
+        query = select(LeaderboardSnapshot.id, LeaderboardSnapshot.taken_at,
+                       func.substr(LeaderboardSnapshot.data, 1, PREFIX_BYTES))\
+            .where(LeaderboardSnapshot.domain == domain)
+        if since is not None:
+            query = query.where(LeaderboardSnapshot.taken_at >= since)
+        rows = db.session.execute(query.order_by(LeaderboardSnapshot.taken_at.desc()).limit(limit)).all()
+
+        def read(snapshot_id: int, start: int, length: int) -> bytes:
+            return db.session.execute(
+                select(func.substr(LeaderboardSnapshot.data, start + 1, length))
+                .where(LeaderboardSnapshot.id == snapshot_id)
+            ).scalar()
+
+        history = []
+        for snapshot_id, taken_at, prefix in rows:
+            if len(prefix) < _header_size(prefix):
+                prefix = read(snapshot_id, 0, _header_size(prefix))
+            count, block_size, first_ids, offsets, start = _read_header(prefix)
+            block = int(np.searchsorted(first_ids, user_id, side='right')) - 1
+            entry = {'snapshot_id': snapshot_id, 'taken_at': taken_at.isoformat(), 'rank': None,
+                     'incoscore': None, 'users': count}
+            if block >= 0:
+                ids, ranks, scores = _decode_block(
+                    read(snapshot_id, start + int(offsets[block]), int(offsets[block + 1] - offsets[block])),
+                    int(first_ids[block]), min(block_size, count - block * block_size))
+                position = int(np.searchsorted(ids, user_id))
+                if position < len(ids) and ids[position] == user_id:
+                    entry['rank'], entry['incoscore'] = int(ranks[position]), int(scores[position]) / 100
+            history.append(entry)
+        return history
@@ -0,0 +1,120 @@
+"""
+Opportunity Lifecycle
+Deactivates opportunities whose deadline has passed and moves long-inactive ones
+(with their application history) into archive tables.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, update
+
+from app import db
+from app.models.archive import ArchivedApplication, ArchivedOpportunity
+from app.models.notification import Notification
+from app.models.opportunity import Application, Opportunity
+
+logger = logging.getLogger(__name__)
+
+
+class OpportunityLifecycle:
+    """Batch jobs that keep the active opportunity working set small."""
+
+    ARCHIVED_OPPORTUNITY_COLUMNS = [
+        'id', 'title', 'description', 'university', 'domain', 'category', 'deadline', 'url',
+        'requirements', 'location', 'is_active', 'created_by', 'extracted_at', 'updated_at',
+    ]
+    ARCHIVED_APPLICATION_COLUMNS = ['id', 'student_id', 'opportunity_id', 'status', 'submitted_at']
+
+    @staticmethod
+    def expire_past_deadline(batch_size: int = 1000, now: Optional[datetime] = None) -> int:
+        """
+        Mark active opportunities whose deadline day has passed as inactive.
+
+        Works in batches over the ``(is_active, deadline)`` index so each
+        transaction stays short.
+
+        Args:
+            batch_size: Rows updated per transaction
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Number of opportunities deactivated
+        """
+        now = now or datetime.utcnow()
+        cutoff = Opportunity.open_deadline_from(now)
+        expired = 0
+
+        while True:
+            ids = db.session.execute(
+                select(Opportunity.id)
+                .where(Opportunity.is_active.is_(True), Opportunity.deadline < cutoff)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+
+            db.session.execute(
+                update(Opportunity).where(Opportunity.id.in_(ids)).values(is_active=False),
+                execution_options={'synchronize_session': False}
+            )
+            db.session.commit()
+            expired += len(ids)
+
+        logger.info(f"Expired {expired} past-deadline opportunities")
+        return expired
+
+    @staticmethod
+    def archive_inactive(older_than_days: int = 180, batch_size: int = 500,
+                         now: Optional[datetime] = None) -> int:
+        """
+        Move opportunities inactive for longer than ``older_than_days`` into the archive tables.
+
+        Each batch copies the opportunities and their applications with
+        ``INSERT ... SELECT`` and then deletes the originals in one transaction.
+
+        Args:
+            older_than_days: Minimum days since the opportunity was last updated
+            batch_size: Opportunities moved per transaction
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Number of opportunities archived
+        """
+        cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+        opp_cols = OpportunityLifecycle.ARCHIVED_OPPORTUNITY_COLUMNS
+        app_cols = OpportunityLifecycle.ARCHIVED_APPLICATION_COLUMNS
+        archived = 0
+
+        while True:
+            ids = db.session.execute(
+                select(Opportunity.id)
+                .where(Opportunity.is_active.is_(False), Opportunity.updated_at < cutoff)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+
+            try:
+                db.session.execute(insert(ArchivedOpportunity).from_select(
+                    opp_cols,
+                    select(*[getattr(Opportunity, c) for c in opp_cols]).where(Opportunity.id.in_(ids))
+                ))
+                db.session.execute(insert(ArchivedApplication).from_select(
+                    app_cols,
+                    select(*[getattr(Application, c) for c in app_cols]).where(Application.opportunity_id.in_(ids))
+                ))
+                db.session.execute(delete(Application).where(Application.opportunity_id.in_(ids)),
+                                   execution_options={'synchronize_session': False})
+                db.session.execute(delete(Notification).where(Notification.opportunity_id.in_(ids)),
+                                   execution_options={'synchronize_session': False})
+                db.session.execute(delete(Opportunity).where(Opportunity.id.in_(ids)),
+                                   execution_options={'synchronize_session': False})
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            archived += len(ids)
+
+        logger.info(f"Archived {archived} inactive opportunities")
+        return archived
@@ -0,0 +1,137 @@
+"""
+HTTP Load-Test Harness
+Drives the main student-facing routes with authenticated sessions and reports
+per-route latency percentiles and throughput.
+"""
+import logging
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class LoadTester:
+    """Multi-threaded HTTP load generator for the Flask app."""
+
+    # Route name -> (method, path template, relative weight, statuses that count as success)
+    ROUTES = {
+        'dashboard': ('GET', '/opportunities/dashboard', 4, {200}),
+        'leaderboard': ('GET', '/ranking/leaderboard', 2, {200}),
+        'community': ('GET', '/community/', 3, {200}),
+        'apply': ('POST', '/opportunities/{opportunity_id}/apply', 1, {302}),  # Redirects on success and repeat
+    }
+
+    def __init__(self, base_url: str, credentials: List[Tuple[str, str]], opportunity_ids: List[int],
+                 concurrency: int = 10, duration: float = 30.0, timeout: float = 30.0,
+                 routes: Optional[List[str]] = None):
+        self.base_url = base_url.rstrip('/')
+        self.credentials = credentials
+        self.opportunity_ids = opportunity_ids
+        self.concurrency = concurrency
+        self.duration = duration
+        self.timeout = timeout
+        self.routes = {name: spec for name, spec in self.ROUTES.items() if not routes or name in routes}
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._throttled: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _login(self, username: str, password: str) -> requests.Session:
+        session = requests.Session()
+        response = session.post(f'{self.base_url}/login', data={'username': username, 'password': password},
+                                allow_redirects=False, timeout=self.timeout)
+        if response.status_code != 302:
+            raise RuntimeError(f'Login failed for {username} (HTTP {response.status_code})')
+        return session
+
+    @staticmethod
+    def classify(response: requests.Response, expected) -> str:
+        """``'ok'``, ``'throttled'`` (429) or ``'error'``; a redirect to the login page is an error."""
+        if response.status_code == 429:
+            return 'throttled'
+        if response.status_code not in expected or '/login' in response.headers.get('Location', ''):
+            return 'error'
+        return 'ok'
+
+    def _record(self, route: str, elapsed: float, outcome: str) -> None:
+        with self._lock:
+            self._latencies[route].append(elapsed)
+            if outcome == 'throttled':
+                self._throttled[route] += 1
+            elif outcome != 'ok':
+                self._errors[route] += 1
+
+    def _worker(self, worker_id: int, deadline: float) -> None:
+        username, password = self.credentials[worker_id % len(self.credentials)]
+        try:
+            session = self._login(username, password)
+        except Exception as e:
+            logger.error(f"Worker {worker_id}: {str(e)}")
+            return
+
+        rng = random.Random(worker_id)
+        names = list(self.routes)
+        weights = [self.routes[name][2] for name in names]
+
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, path, _, expected = self.routes[name]
+            if '{opportunity_id}' in path:
+                if not self.opportunity_ids:
+                    continue
+                path = path.format(opportunity_id=rng.choice(self.opportunity_ids))
+
+            start = time.perf_counter()
+            try:
+                response = session.request(method, self.base_url + path, allow_redirects=False,
+                                           timeout=self.timeout)
+                outcome = self.classify(response, expected)
+            except requests.RequestException:
+                outcome = 'error'
+            self._record(name, time.perf_counter() - start, outcome)
+
+    @staticmethod
+    def percentile(sorted_values: List[float], pct: float) -> float:
+        """Nearest-rank percentile of an already sorted list."""
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+        return sorted_values[index]
+
+    def run(self) -> Dict[str, Dict]:
+        """
+        Run the load test.
+
+        Returns:
+            Per-route statistics: requests, errors, throttled (429) responses, throughput (req/s)
+            and p50/p95/p99 latency (ms)
+        """
+        started = time.monotonic()
+        deadline = started + self.duration
+        threads = [threading.Thread(target=self._worker, args=(i, deadline), daemon=True)
+                   for i in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        report = {}
+        for route, values in sorted(self._latencies.items()):
+            values.sort()
+            report[route] = {
+                'requests': len(values),
+                'errors': self._errors[route],
+                'throttled': self._throttled[route],
+                'throughput': round(len(values) / elapsed, 2),
+                'p50_ms': round(self.percentile(values, 50) * 1000, 2),
+                'p95_ms': round(self.percentile(values, 95) * 1000, 2),
+                'p99_ms': round(self.percentile(values, 99) * 1000, 2),
+            }
+        return report
@@ -0,0 +1,145 @@
+"""
+Notification Fan-out
+Matches newly ingested opportunities against student domains and interests with
+set-based INSERT ... SELECT statements and coalesces the results into periodic digests.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, literal, or_, select, update
+
+from app import db
+from app.models.notification import Digest, Notification
+from app.models.opportunity import Opportunity
+from app.models.user import User
+from app.services.bulk import chunked, insert_ignore
+
+logger = logging.getLogger(__name__)
+
+# Interests are stored as ``a,b`` (User.normalize_list), so whole entries match ``%,<domain>,%``
+_INTEREST_LIST = ',' + User.interests + ','
+
+
+def interest_pattern(domain: str) -> str:
+    """LIKE pattern matching ``domain`` as a whole interest, with ``%`` and ``_`` escaped by a backslash."""
+    escaped = domain.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%,{escaped},%'
+
+
+class NotificationFanout:
+    """Fan-out of new-opportunity alerts to matching students."""
+
+    KIND_NEW = 'new_opportunities'
+
+    @staticmethod
+    def group_by_domain(opportunity_ids: List[int], chunk_size: int = 5000) -> Dict[str, Tuple[int, int]]:
+        """
+        Collapse an ingest batch into one group per domain.
+
+        Args:
+            opportunity_ids: IDs of newly inserted opportunities
+            chunk_size: IDs per aggregate query
+
+        Returns:
+            Mapping of domain -> (opportunity count, newest opportunity ID)
+        """
+        groups: Dict[str, Tuple[int, int]] = {}
+        for chunk in chunked(opportunity_ids, chunk_size):
+            rows = db.session.execute(
+                select(Opportunity.domain, func.count(Opportunity.id), func.max(Opportunity.id))
+                .where(Opportunity.id.in_(chunk), Opportunity.domain.isnot(None))
+                .group_by(Opportunity.domain)
+            ).all()
+            for domain, count, max_id in rows:
+                old_count, old_max = groups.get(domain, (0, 0))
+                groups[domain] = (old_count + count, max(old_max, max_id))
+        return groups
+
+    @staticmethod
+    def fan_out(opportunity_ids: List[int], user_batch: int = 50000,
+                progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """
+        Notify every student whose domain or interests match the new opportunities.
+
+        Users are processed in primary-key ranges of ``user_batch``; each range is one
+        ``INSERT ... SELECT`` per domain group, so time and memory are bounded by the
+        number of ranges and domains rather than by opportunities x users.
+
+        Args:
+            opportunity_ids: IDs of newly inserted opportunities
+            user_batch: Width of each user ID range
+            progress: Optional callback ``(ranges_done, ranges_total)``
+
+        Returns:
+            Number of domain groups and notifications written
+        """
+        groups = NotificationFanout.group_by_domain(opportunity_ids)
+        min_id, max_id = db.session.execute(select(func.min(User.id), func.max(User.id))).one()
+        if not groups or min_id is None:
+            return {'groups': len(groups), 'notifications': 0}
+
+        now = datetime.utcnow()
+        columns = ['user_id', 'kind', 'domain', 'opportunity_id', 'item_count', 'created_at']
+        starts = range(min_id, max_id + 1, user_batch)
+        written = 0
+
+        for done, start in enumerate(starts, 1):
+            for domain, (count, newest_id) in groups.items():
+                matches = select(
+                    User.id, literal(NotificationFanout.KIND_NEW), literal(domain),
+                    literal(newest_id), literal(count), literal(now),
+                ).where(
+                    User.id >= start,
+                    User.id < start + user_batch,
+                    or_(User.domain == domain, _INTEREST_LIST.ilike(interest_pattern(domain), escape='\\')),
+                )
+                written += db.session.execute(insert_ignore(Notification).from_select(columns, matches)).rowcount
+            db.session.commit()
+            if progress:
+                progress(done, len(starts))
+
+        logger.info(f"Fan-out of {len(opportunity_ids)} opportunities wrote {written} notifications")
+        return {'groups': len(groups), 'notifications': written}
+
+    @staticmethod
+    def build_digests(user_batch: int = 50000, now: Optional[datetime] = None) -> int:
+        """
+        Coalesce each user's pending notifications into a single digest.
+
+        Args:
+            user_batch: Width of each user ID range
+            now: Digest timestamp (defaults to current UTC time)
+
+        Returns:
+            Number of digests created
+        """
+        now = now or datetime.utcnow()
+        pending = Notification.digest_id.is_(None)
+        watermark, min_user, max_user = db.session.execute(
+            select(func.max(Notification.id), func.min(Notification.user_id), func.max(Notification.user_id))
+            .where(pending)
+        ).one()
+        if watermark is None:
+            return 0
+
+        created = 0
+        for start in range(min_user, max_user + 1, user_batch):
+            in_range = (pending, Notification.id <= watermark,
+                        Notification.user_id >= start, Notification.user_id < start + user_batch)
+
+            created += db.session.execute(insert(Digest).from_select(
+                ['user_id', 'item_count', 'created_at'],
+                select(Notification.user_id, func.sum(Notification.item_count), literal(now))
+                .where(*in_range).group_by(Notification.user_id)
+            )).rowcount
+
+            digest_id = select(Digest.id).where(
+                Digest.user_id == Notification.user_id, Digest.created_at == now
+            ).scalar_subquery()
+            db.session.execute(update(Notification).where(*in_range).values(digest_id=digest_id),
+                               execution_options={'synchronize_session': False})
+            db.session.commit()
+
+        logger.info(f"Built {created} digests")
+        return created
@@ -0,0 +1,201 @@
+"""
+Password Hashing
+Runs Werkzeug's password hashing on a small per-process thread pool instead of inline
+in the request thread.
+
+``hashlib``'s scrypt and PBKDF2 release the GIL, so the pool's threads hash in
+parallel while the worker's other request threads keep serving. The pool is bounded
+twice: ``PASSWORD_HASH_WORKERS`` hashes run at once (each scrypt hash also holds
+~32 MB), and at most ``PASSWORD_HASH_MAX_PENDING`` may be running or queued; beyond
+that ``HasherBusy`` is raised and the login is answered with ``503``.
+
+Hashes record their method and cost (``scrypt:32768:8:1$salt$hash``). When
+``PASSWORD_HASH_METHOD`` changes, each user's hash is upgraded in the background
+after their next successful login.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, Dict, List, Optional, Tuple
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+logger = logging.getLogger(__name__)
+
+
+class HasherBusy(Exception):
+    """Too many password hashes are running or queued in this process, or one timed out."""
+
+
+def available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class PasswordHasher:
+    """Bounded executor for password hashing and verification."""
+
+    def __init__(self):
+        self.method = 'scrypt:32768:8:1'
+        self.workers = 1
+        self.max_pending = 32
+        self.timeout = 30.0
+        self._app = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._prefix: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid = None
+
+    def init_app(self, app) -> None:
+        """Read the hash method and pool limits from the config."""
+        self.method = app.config.get('PASSWORD_HASH_METHOD', self.method)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', self.workers)
+        self.max_pending = app.config.get('PASSWORD_HASH_MAX_PENDING', self.max_pending)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._prefix = None
+        self._app = app
+
+    @property
+    def prefix(self) -> str:
+        """Method and cost as written into hashes, e.g. ``pbkdf2:sha256:600000``."""
+        if self._prefix is None:
+            self._prefix = generate_password_hash('', method=self.method).split('$', 1)[0]
+        return self._prefix
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Threads do not survive a fork, so each gunicorn worker starts its own pool
+        if self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hash')
+            self._pid = os.getpid()
+        return self._executor
+
+    def _run(self, func: Callable, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._pool().submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the hash finishes, even if the caller stops waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()  # Dropped if still queued; a running hash keeps its slot
+            raise HasherBusy()
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        """Check a password against a stored hash (of any method Werkzeug supports)."""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        return pwhash.split('$', 1)[0] != self.prefix
+
+    def rehash_later(self, user_id: int, old_hash: str, password: str) -> None:
+        """
+        Upgrade a user's hash to the configured method in the background.
+
+        Skipped when the pool is busy (the next login tries again). Only replaces
+        ``old_hash``, so a password changed in the meantime is never overwritten.
+        """
+        if self._app is None or not self._slots.acquire(blocking=False):
+            return
+
+        def upgrade():
+            from sqlalchemy import update
+            from app import db
+            from app.models.user import User
+
+            try:
+                new_hash = generate_password_hash(password, self.method)
+                with self._app.app_context():
+                    db.session.execute(
+                        update(User).where(User.id == user_id, User.password_hash == old_hash)
+                        .values(password_hash=new_hash, updated_at=User.updated_at)  # Not a profile change
+                    )
+                    db.session.commit()
+            except Exception as e:
+                logger.warning(f"Password hash upgrade failed for user {user_id}: {e}")
+            finally:
+                self._slots.release()
+
+        self._pool().submit(upgrade)
+
+    @staticmethod
+    def measure_verify(pwhash: str, password: str, threads: int, seconds: float) -> float:
+        """Verifications per second with ``threads`` threads calling Werkzeug directly."""
+        counts = [0] * threads
+        deadline = time.perf_counter() + seconds
+
+        def worker(index: int) -> None:
+            while time.perf_counter() < deadline:
+                check_password_hash(pwhash, password)
+                counts[index] += 1
+
+        started = time.perf_counter()
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        return sum(counts) / (time.perf_counter() - started)
+
+    @staticmethod
+    def measure_logins(app, credentials: List[Tuple[str, str]], threads: int, seconds: float) -> Dict:
+        """
+        Drive ``POST /login`` in-process with the test client.
+
+        Returns:
+            Logins, rejections (503), throughput and latency percentiles
+        """
+        from app.services.loadtest import LoadTester
+
+        latencies: List[float] = []
+        statuses: Dict[int, int] = {}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def worker(index: int) -> None:
+            client = app.test_client()
+            n = index
+            while time.perf_counter() < deadline:
+                username, password = credentials[n % len(credentials)]
+                n += threads
+                started = time.perf_counter()
+                response = client.post('/login', data={'username': username, 'password': password})
+                elapsed = time.perf_counter() - started
+                client.get('/logout')
+                with lock:
+                    statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                    if response.status_code == 302:
+                        latencies.append(elapsed)
+
+        started = time.perf_counter()
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            'logins': len(latencies),
+            'rejected': statuses.get(503, 0),
+            'failed': sum(count for status, count in statuses.items() if status not in (302, 503)),
+            'per_second': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(LoadTester.percentile(latencies, 50) * 1000, 1) if latencies else None,
+            'p95_ms': round(LoadTester.percentile(latencies, 95) * 1000, 1) if latencies else None,
+        }
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,215 @@
+"""
+Bulk Purge
+Deletes users, posts and opportunities together with their dependent rows in short
+batched transactions instead of loading every child into the ORM session.
+Denormalized like/comment counters, hot scores and analytics rollups are adjusted
+batch by batch, so they stay consistent without a full recount. Large purges run as
+background jobs; ON DELETE CASCADE remains the safety net for anything left over.
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+
+from app import db, user_cache
+from app.models.analytics import ApplicationRollup, CommunityRollup
+from app.models.community import Comment, Like, Post
+from app.models.job import Job
+from app.models.notification import Digest, Notification
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+from app.services.analytics import AnalyticsRollups
+
+logger = logging.getLogger(__name__)
+
+
+class BulkPurge:
+    """Batched deletes of an object and everything that depends on it."""
+
+    TARGETS = ('user', 'post', 'opportunity')
+
+    def __init__(self, batch_size: int = 5000, progress: Optional[Callable[[int, int], None]] = None):
+        self.batch_size = batch_size
+        self.progress = progress
+        self.deleted = 0
+        self.total = 0
+
+    @staticmethod
+    def dependent_rows(target: str, object_id: int) -> int:
+        """
+        Count the rows a purge would delete besides the object itself.
+
+        Used to decide between deleting inline and starting a background job.
+        """
+        def count(model, condition) -> int:
+            return db.session.execute(select(func.count()).select_from(model).where(condition)).scalar()
+
+        if target == 'post':
+            post = db.session.get(Post, object_id)
+            return (post.likes_count or 0) + (post.comments_count or 0) if post else 0
+        if target == 'opportunity':
+            return (count(Application, Application.opportunity_id == object_id) +
+                    count(Notification, Notification.opportunity_id == object_id))
+        if target == 'user':
+            engagement = db.session.execute(
+                select(func.coalesce(func.sum(Post.likes_count + Post.comments_count), 0), func.count())
+                .where(Post.user_id == object_id)
+            ).one()
+            return (int(engagement[0]) + engagement[1] +
+                    count(Like, Like.user_id == object_id) +
+                    count(Comment, Comment.user_id == object_id) +
+                    count(Application, Application.student_id == object_id) +
+                    count(Notification, Notification.user_id == object_id))
+        raise ValueError(f'Unknown purge target: {target}')
+
+    def _report(self, rows: int) -> None:
+        self.deleted += rows
+        if self.progress:
+            self.progress(self.deleted, max(self.total, self.deleted))
+
+    def _delete_batches(self, model, condition, before_delete: Optional[Callable[[List[int]], None]] = None) -> int:
+        """Delete matching rows ``batch_size`` at a time, committing after each batch."""
+        deleted = 0
+        while True:
+            ids = db.session.execute(
+                select(model.id).where(condition).limit(self.batch_size)
+            ).scalars().all()
+            if not ids:
+                return deleted
+            if before_delete:
+                before_delete(ids)
+            db.session.execute(delete(model).where(model.id.in_(ids)))
+            db.session.commit()
+            deleted += len(ids)
+            self._report(len(ids))
+
+    def _release_engagement(self, model, ids: List[int]) -> None:
+        """Decrement counters, hot scores and rollups of the posts a batch of likes/comments belongs to."""
+        counts = dict(db.session.execute(
+            select(model.post_id, func.count()).where(model.id.in_(ids)).group_by(model.post_id)
+        ).all())
+        column = 'likes_count' if model is Like else 'comments_count'
+        rollup_deltas: Dict = {}
+        updates = []
+        for post in db.session.execute(
+                select(Post.id, Post.domain, Post.likes_count, Post.comments_count, Post.created_at)
+                .where(Post.id.in_(counts))):
+            values = {'likes_count': post.likes_count or 0, 'comments_count': post.comments_count or 0}
+            removed = min(counts[post.id], values[column])
+            values[column] -= removed
+            updates.append({'id': post.id, **values,
+                            'hot_score': Post.hot_score_for(values['likes_count'], values['comments_count'],
+                                                            post.created_at)})
+            key = (post.domain or '',)
+            delta = rollup_deltas.get(key, [0, 0, 0])
+            delta[1 if model is Like else 2] -= removed
+            rollup_deltas[key] = delta
+
+        if updates:
+            # Bulk UPDATE by primary key; bypasses the flush hook, so rollups are adjusted explicitly
+            db.session.execute(update(Post), updates)
+            AnalyticsRollups.apply_deltas(db.session.connection(), {CommunityRollup: rollup_deltas})
+
+    def _release_applications(self, ids: List[int]) -> None:
+        statuses = db.session.execute(
+            select(func.coalesce(Application.status, ''), func.count())
+            .where(Application.id.in_(ids)).group_by(Application.status)
+        ).all()
+        AnalyticsRollups.apply_deltas(db.session.connection(), {
+            ApplicationRollup: {(status,): [-count] for status, count in statuses}
+        })
+
+    def _release_posts(self, ids: List[int]) -> None:
+        """Delete the likes/comments of a batch of posts and subtract the posts from the rollups."""
+        self._delete_batches(Like, Like.post_id.in_(ids))
+        self._delete_batches(Comment, Comment.post_id.in_(ids))
+        totals = {}
+        for domain, posts, likes, comments in db.session.execute(
+                select(func.coalesce(Post.domain, ''), func.count(),
+                       func.coalesce(func.sum(Post.likes_count), 0), func.coalesce(func.sum(Post.comments_count), 0))
+                .where(Post.id.in_(ids)).group_by(Post.domain)):
+            totals[(domain,)] = [-posts, -likes, -comments]
+        AnalyticsRollups.apply_deltas(db.session.connection(), {CommunityRollup: totals})
+
+    def purge_post(self, post_id: int) -> Dict:
+        """Delete a post with its likes and comments."""
+        from app.services.timeline import timeline_cache
+
+        self.total = self.dependent_rows('post', post_id) + 1
+        self._delete_batches(Post, Post.id == post_id, before_delete=self._release_posts)
+        timeline_cache.clear()
+        logger.info(f"Purged post {post_id}: {self.deleted} rows")
+        return {'target': 'post', 'id': post_id, 'deleted': self.deleted}
+
+    def purge_opportunity(self, opportunity_id: int) -> Dict:
+        """Delete an opportunity with its applications and notifications."""
+        self.total = self.dependent_rows('opportunity', opportunity_id) + 1
+        self._delete_batches(Application, Application.opportunity_id == opportunity_id,
+                             before_delete=self._release_applications)
+        self._delete_batches(Notification, Notification.opportunity_id == opportunity_id)
+
+        # The parent row goes through the ORM so the rollup hook sees it
+        opportunity = db.session.get(Opportunity, opportunity_id)
+        if opportunity is not None:
+            db.session.delete(opportunity)
+            db.session.commit()
+            self._report(1)
+        logger.info(f"Purged opportunity {opportunity_id}: {self.deleted} rows")
+        return {'target': 'opportunity', 'id': opportunity_id, 'deleted': self.deleted}
+
+    def purge_user(self, user_id: int) -> Dict:
+        """Delete a user with their posts, likes, comments, applications and notifications."""
+        from app.services.skill_index import skill_index
+        from app.services.timeline import timeline_cache
+
+        self.total = self.dependent_rows('user', user_id) + 1
+        self._delete_batches(Post, Post.user_id == user_id, before_delete=self._release_posts)
+        self._delete_batches(Like, Like.user_id == user_id,
+                             before_delete=lambda ids: self._release_engagement(Like, ids))
+        self._delete_batches(Comment, Comment.user_id == user_id,
+                             before_delete=lambda ids: self._release_engagement(Comment, ids))
+        self._delete_batches(Application, Application.student_id == user_id,
+                             before_delete=self._release_applications)
+        self._delete_batches(Notification, Notification.user_id == user_id)
+        self._delete_batches(Digest, Digest.user_id == user_id)
+
+        db.session.execute(update(Opportunity).where(Opportunity.created_by == user_id).values(created_by=None))
+        db.session.execute(update(Job).where(Job.created_by == user_id).values(created_by=None))
+        deleted = db.session.execute(delete(User).where(User.id == user_id)).rowcount
+        db.session.commit()
+        self._report(deleted)
+
+        user_cache.invalidate(user_id)
+        skill_index.remove_user(user_id)
+        timeline_cache.clear()
+        logger.info(f"Purged user {user_id}: {self.deleted} rows")
+        return {'target': 'user', 'id': user_id, 'deleted': self.deleted}
+
+    def purge(self, target: str, object_id: int) -> Dict:
+        """Dispatch to ``purge_<target>``."""
+        if target not in self.TARGETS:
+            raise ValueError(f'Unknown purge target: {target}')
+        return getattr(self, f'purge_{target}')(object_id)
+
+
+def run_purge(target: str, object_id: int, batch_size: int = 5000, progress=None) -> Dict:
+    """Background job entry point."""
+    return BulkPurge(batch_size=batch_size, progress=progress).purge(target, object_id)
+
+
+def purge_or_schedule(target: str, object_id: int, created_by: Optional[int] = None) -> Optional[int]:
+    """
+    Purge inline when few rows depend on the object, otherwise start a background job.
+
+    Returns:
+        ID of the started job, or None if the purge already finished
+    """
+    from flask import current_app
+    from app.services.jobs import job_runner
+
+    batch_size = current_app.config['PURGE_BATCH_SIZE']
+    if BulkPurge.dependent_rows(target, object_id) <= current_app.config['PURGE_SYNC_LIMIT']:
+        BulkPurge(batch_size=batch_size).purge(target, object_id)
+        return None
+    return job_runner.submit(f'purge-{target}', run_purge, target, object_id,
+                             batch_size=batch_size, created_by=created_by)
@@ -2,7 +2,7 @@
 Module 6: InCoScore Ranking Engine
 Intelligent Competency Score calculation and ranking system
 """
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.models.user import User
 
 
@@ -73,20 +73,37 @@ class InCoScoreEngine:
         return leaderboard
     
     @staticmethod
-    def recommend_students_for_opportunity(opportunity_domain: str, limit: int = 5) -> List[User]:
+    def recommend_students_for_opportunity(opportunity_domain: str, limit: int = 5,
+                                           requirements: Optional[str] = None,
+                                           skills: Optional[List[str]] = None) -> List[User]:
         """
-        Recommend top students for a specific opportunity based on domain match and InCoScore.
+        Recommend top students for a specific opportunity.
+        
+        Without requirements or skills, students of the domain are ranked by InCoScore.
+        Otherwise candidates sharing a required skill or the domain are ranked by skill
+        overlap, InCoScore and domain match using the in-memory skill index.
         
         Args:
             opportunity_domain: Domain of the opportunity
             limit: Number of students to recommend
+            requirements: Free-text requirements of the opportunity (optional)
+            skills: Required skills (optional)
             
         Returns:
             List of recommended students
         """
-        students = User.query.filter_by(domain=opportunity_domain)\
-                            .order_by(User.incoscore.desc())\
-                            .limit(limit)\
-                            .all()
+        if not requirements and not skills:
+            return User.query.filter_by(domain=opportunity_domain)\
+                             .order_by(User.incoscore.desc())\
+                             .limit(limit)\
+                             .all()
+        
+        from app.services.resume_parser import normalize_skill
+        from app.services.skill_index import skill_index
+        
+        wanted = set(skill_index.match_skills(requirements)) if requirements else set()
+        wanted.update(normalize_skill(skill) for skill in skills or [] if skill.strip())
+        ranked = skill_index.top_candidates(wanted, domain=opportunity_domain, limit=limit)
         
-        return students
+        students = {user.id: user for user in User.query.filter(User.id.in_([user_id for user_id, _, _ in ranked]))}
+        return [students[user_id] for user_id, _, _ in ranked if user_id in students]
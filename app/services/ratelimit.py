@@ -0,0 +1,269 @@
+"""
+Rate Limiting and Admission Control
+Token buckets per user and per route, and a cap on concurrent requests, for endpoints
+that are expensive to serve (scraping, rescoring, bulk jobs).
+
+Limits are configured by name in ``RATE_LIMITS`` and attached with
+``@rate_limiter.limit('<name>')``:
+
+- ``user``: rate for one user (or client address), e.g. ``'2/minute'``. Exceeding it
+  returns ``429 Too Many Requests``.
+- ``route``: rate for all users together. Exceeding it sheds load with ``503``.
+- ``concurrency``: requests allowed to run at once; further ones get ``503``.
+
+Every rejection carries ``Retry-After``. With ``RATELIMIT_STORAGE = 'memory'`` each
+worker process keeps its own buckets; ``'sqlite'`` keeps them in a small SQLite file
+under the instance folder, so all workers on the host share the same buckets and slots.
+If the store fails, requests are let through rather than rejected.
+"""
+import logging
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from functools import wraps
+from typing import Dict, Optional, Tuple
+
+from flask import jsonify, request
+from flask_login import current_user
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_rate(spec: str) -> Tuple[float, float]:
+    """
+    Parse ``'<count>/<period>'``, e.g. ``'10/minute'``.
+
+    Returns:
+        ``(tokens per second, bucket capacity)``; the capacity is the count, so a
+        quiet client may use its whole allowance in one burst
+    """
+    count, _, period = spec.partition('/')
+    seconds = PERIODS.get(period.strip().rstrip('s'))
+    if seconds is None or not count.strip().isdigit() or int(count) <= 0:
+        raise ValueError(f'Invalid rate {spec!r}, use e.g. "10/minute"')
+    return int(count) / seconds, float(count)
+
+
+class MemoryStore:
+    """Buckets and slots of this worker process."""
+
+    SWEEP_SIZE = 10000  # Drop refilled buckets once this many are tracked
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}  # key -> (tokens, updated, full at)
+        self._slots: Dict[str, Dict[str, float]] = {}  # key -> {token: expires}
+
+    def consume(self, key: str, rate: float, capacity: float, now: float) -> float:
+        """Take one token; return 0 on success or the seconds until one is available."""
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if wait == 0:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+            if len(self._buckets) > self.SWEEP_SIZE:
+                # A full bucket behaves exactly like a missing one
+                for stale in [name for name, entry in self._buckets.items() if entry[2] <= now]:
+                    del self._buckets[stale]
+            return wait
+
+    def acquire(self, key: str, limit: int, ttl: float, now: float) -> Optional[str]:
+        """Take one of ``limit`` concurrency slots; returns its token, or None when all are taken."""
+        with self._lock:
+            slots = self._slots.setdefault(key, {})
+            for token in [token for token, expires in slots.items() if expires < now]:
+                del slots[token]
+            if len(slots) >= limit:
+                return None
+            token = uuid.uuid4().hex
+            slots[token] = now + ttl
+            return token
+
+    def release(self, key: str, token: str) -> None:
+        with self._lock:
+            self._slots.get(key, {}).pop(token, None)
+
+
+class SQLiteStore:
+    """
+    Buckets and slots shared by every process on the host through one SQLite file.
+
+    Each update is a short ``BEGIN IMMEDIATE`` transaction, which serializes writers
+    across processes. Slots expire after ``ttl`` so a killed worker cannot hold one forever.
+    """
+
+    SWEEP_PROBABILITY = 0.001  # Share of updates that also delete refilled buckets
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        connection = self._connect()
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, '
+                               'updated REAL NOT NULL, full_at REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS ix_buckets_full_at ON buckets (full_at)')
+            connection.execute('CREATE TABLE IF NOT EXISTS slots '
+                               '(token TEXT PRIMARY KEY, key TEXT NOT NULL, expires REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS ix_slots_key ON slots (key, expires)')
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=2.0, isolation_level=None)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened after a fork
+        if getattr(self._local, 'pid', None) != os.getpid():
+            self._local.connection = self._connect()
+            self._local.connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    def _transaction(self, work):
+        connection = self._connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            result = work(connection)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        return result
+
+    def consume(self, key: str, rate: float, capacity: float, now: float) -> float:
+        def work(connection):
+            row = connection.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if wait == 0:
+                tokens -= 1
+            connection.execute('INSERT OR REPLACE INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?)',
+                               (key, tokens, now, now + (capacity - tokens) / rate))
+            if random.random() < self.SWEEP_PROBABILITY:
+                connection.execute('DELETE FROM buckets WHERE full_at <= ?', (now,))
+            return wait
+        return self._transaction(work)
+
+    def acquire(self, key: str, limit: int, ttl: float, now: float) -> Optional[str]:
+        def work(connection):
+            connection.execute('DELETE FROM slots WHERE key = ? AND expires < ?', (key, now))
+            if connection.execute('SELECT COUNT(*) FROM slots WHERE key = ?', (key,)).fetchone()[0] >= limit:
+                return None
+            token = uuid.uuid4().hex
+            connection.execute('INSERT INTO slots (token, key, expires) VALUES (?, ?, ?)', (token, key, now + ttl))
+            return token
+        return self._transaction(work)
+
+    def release(self, key: str, token: str) -> None:
+        self._connection.execute('DELETE FROM slots WHERE token = ?', (token,))
+
+
+class RateLimiter:
+    """Named limits applied to views with the ``limit`` decorator."""
+
+    def __init__(self):
+        self.enabled = True
+        self.limits: Dict[str, Dict] = {}
+        self.store = MemoryStore()
+        self.slot_ttl = 300.0
+        self.busy_retry_after = 5
+
+    def init_app(self, app) -> None:
+        """Read limits from the config and open the configured store."""
+        self.enabled = app.config.get('RATELIMIT_ENABLED', self.enabled)
+        self.slot_ttl = app.config.get('RATELIMIT_SLOT_TTL_SECONDS', self.slot_ttl)
+        self.busy_retry_after = app.config.get('RATELIMIT_BUSY_RETRY_AFTER', self.busy_retry_after)
+        self.limits = {}
+        for name, limit in app.config.get('RATE_LIMITS', {}).items():
+            self.limits[name] = {
+                'user': parse_rate(limit['user']) if limit.get('user') else None,
+                'route': parse_rate(limit['route']) if limit.get('route') else None,
+                'concurrency': limit.get('concurrency'),
+            }
+        if app.config.get('RATELIMIT_STORAGE', 'memory') == 'sqlite':
+            self.store = SQLiteStore(app.config['RATELIMIT_SQLITE_PATH'])
+        else:
+            self.store = MemoryStore()
+
+    @staticmethod
+    def _client() -> str:
+        if current_user.is_authenticated:
+            return f'user:{current_user.id}'
+        return f'ip:{request.remote_addr}'
+
+    @staticmethod
+    def _reject(status: int, message: str, retry_after: float):
+        retry_after = max(1, math.ceil(retry_after))
+        response = jsonify({'error': message, 'retry_after': retry_after})
+        response.headers['Retry-After'] = str(retry_after)
+        return response, status
+
+    def check(self, name: str) -> Tuple[Optional[tuple], Optional[str]]:
+        """
+        Admit or reject the current request under the named limit.
+
+        Returns:
+            ``(rejection response or None, concurrency slot to release or None)``
+        """
+        limit = self.limits.get(name)
+        if not self.enabled or limit is None:
+            return None, None
+        now = time.time()
+        slot = None
+        try:
+            if limit['concurrency']:
+                slot = self.store.acquire(f'{name}:running', limit['concurrency'], self.slot_ttl, now)
+                if slot is None:
+                    logger.warning(f"Shedding {name}: {limit['concurrency']} requests already running")
+                    return self._reject(503, 'Server busy, retry later', self.busy_retry_after), None
+            if limit['user']:
+                wait = self.store.consume(f'{name}:{self._client()}', *limit['user'], now)
+                if wait:
+                    self.release(name, slot)
+                    return self._reject(429, 'Too many requests, slow down', wait), None
+            if limit['route']:
+                wait = self.store.consume(f'{name}:*', *limit['route'], now)
+                if wait:
+                    self.release(name, slot)
+                    logger.warning(f"Shedding {name}: route rate exceeded")
+                    return self._reject(503, 'Server busy, retry later', wait), None
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limit store unavailable, admitting request: {e}")
+        return None, slot
+
+    def release(self, name: str, slot: Optional[str]) -> None:
+        if slot is None:
+            return
+        try:
+            self.store.release(f'{name}:running', slot)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not release {name} slot (expires in {self.slot_ttl:.0f}s): {e}")
+
+    def limit(self, name: str):
+        """Decorator applying the limit ``name`` from ``RATE_LIMITS`` to a view."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                rejection, slot = self.check(name)
+                if rejection is not None:
+                    return rejection
+                try:
+                    return view(*args, **kwargs)
+                finally:
+                    self.release(name, slot)
+            return wrapper
+        return decorator
+
+
+rate_limiter = RateLimiter()
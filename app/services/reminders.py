@@ -0,0 +1,146 @@
+"""
+Deadline Reminders
+Reminds applicants ``DEADLINE_REMINDER_HOURS`` before an opportunity closes (at the
+end of its deadline day, see ``Opportunity.closes_at``).
+
+The scheduler process keeps a min-heap of upcoming reminder times, one entry per
+opportunity rather than per application. It is filled incrementally from the
+``(is_active, deadline)`` index: each pass only reads deadlines that have entered the
+look-ahead window since the previous pass, plus opportunities changed since the last
+``updated_at`` watermark, so edited deadlines are rescheduled and deactivated ones
+dropped. Due entries are sent as one ``INSERT ... SELECT`` over their applications,
+so a pass costs work proportional to the reminders due, not to the size of the
+``applications`` table. Deleted opportunities simply match no rows when they come due,
+and the unique notification constraint makes re-sending after a restart harmless.
+"""
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, literal, select
+
+from app import db
+from app.models.notification import Notification
+from app.models.opportunity import Application, Opportunity
+from app.services.bulk import chunked, insert_ignore
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineReminders:
+    """Heap of upcoming deadline reminders for the scheduler process."""
+
+    KIND = 'deadline_reminder'
+    OPEN_STATUSES = ('pending', 'submitted')
+    SETTLE = timedelta(minutes=1)  # After this, no transaction commits with an older updated_at
+
+    def __init__(self, lead_hours: float = 48, horizon_hours: float = 24, batch_size: int = 500):
+        self.lead = timedelta(hours=lead_hours)
+        self.horizon = timedelta(hours=horizon_hours)  # Look-ahead beyond the reminder time
+        self.batch_size = batch_size
+        self._heap: List[Tuple[datetime, int]] = []  # (remind_at, opportunity_id)
+        self._scheduled: Dict[int, datetime] = {}  # opportunity_id -> current remind_at
+        self._loaded_until: Optional[datetime] = None  # Deadlines up to here are in the heap
+        self._watermark: Optional[datetime] = None  # Last Opportunity.updated_at seen
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def _schedule(self, opportunity_id: int, deadline: Optional[datetime], is_active: bool,
+                  now: datetime) -> None:
+        if not is_active or deadline is None or deadline > self._loaded_until \
+                or Opportunity.closes_at(deadline) <= now:
+            # Inactive, closed, or beyond the window (the window scan picks it up later)
+            self._scheduled.pop(opportunity_id, None)
+            return
+        remind_at = Opportunity.closes_at(deadline) - self.lead
+        if self._scheduled.get(opportunity_id) != remind_at:
+            self._scheduled[opportunity_id] = remind_at
+            heapq.heappush(self._heap, (remind_at, opportunity_id))
+
+    def _track(self, updated_at: Optional[datetime]) -> None:
+        if updated_at is not None and (self._watermark is None or updated_at > self._watermark):
+            self._watermark = updated_at
+
+    def load(self, now: datetime) -> int:
+        """
+        Extend the window to ``now + lead + horizon`` and apply opportunity changes.
+
+        Returns:
+            Number of opportunity rows read
+        """
+        columns = (Opportunity.id, Opportunity.deadline, Opportunity.is_active, Opportunity.updated_at)
+        until = now + self.lead + self.horizon
+        rows = 0
+
+        if self._loaded_until is None:
+            # First pass: everything still open, including reminders already due
+            entering = Opportunity.deadline >= Opportunity.open_deadline_from(now)
+            self._watermark = db.session.execute(
+                select(Opportunity.updated_at).order_by(Opportunity.updated_at.desc()).limit(1)
+            ).scalar()
+        else:
+            entering = Opportunity.deadline > self._loaded_until
+            if self._watermark is None:
+                changed_since = Opportunity.updated_at.is_not(None)
+            elif now - self._watermark < self.SETTLE:
+                # Re-read a small overlap: rows committed late with an earlier timestamp
+                changed_since = Opportunity.updated_at >= self._watermark - timedelta(seconds=1)
+            else:
+                changed_since = Opportunity.updated_at > self._watermark
+            changed = db.session.execute(select(*columns).where(changed_since))
+            for opportunity_id, deadline, is_active, updated_at in changed:
+                self._schedule(opportunity_id, deadline, is_active, now)
+                self._track(updated_at)
+                rows += 1
+
+        self._loaded_until = until
+        entered = db.session.execute(
+            select(*columns).where(Opportunity.is_active.is_(True), entering, Opportunity.deadline <= until)
+        )
+        for opportunity_id, deadline, is_active, updated_at in entered:
+            self._schedule(opportunity_id, deadline, is_active, now)
+            rows += 1
+        return rows
+
+    def pop_due(self, now: datetime) -> List[int]:
+        """Remove and return the opportunities whose reminder time has come."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            remind_at, opportunity_id = heapq.heappop(self._heap)
+            if self._scheduled.get(opportunity_id) == remind_at:  # Skip superseded entries
+                del self._scheduled[opportunity_id]
+                due.append(opportunity_id)
+        return due
+
+    def send(self, opportunity_ids: List[int], now: datetime) -> int:
+        """
+        Notify every open applicant of the given opportunities, one statement per batch.
+
+        Returns:
+            Number of reminders written
+        """
+        written = 0
+        columns = ['user_id', 'kind', 'domain', 'opportunity_id', 'item_count', 'created_at']
+        for chunk in chunked(opportunity_ids, self.batch_size):
+            recipients = select(
+                Application.student_id, literal(self.KIND), Opportunity.domain,
+                Opportunity.id, literal(1), literal(now),
+            ).join(Opportunity, and_(Opportunity.id == Application.opportunity_id,
+                                     Opportunity.is_active.is_(True),
+                                     Opportunity.deadline >= Opportunity.open_deadline_from(now))
+                   ).where(Application.opportunity_id.in_(chunk), Application.status.in_(self.OPEN_STATUSES))
+            written += db.session.execute(insert_ignore(Notification).from_select(columns, recipients)).rowcount
+            db.session.commit()
+        return written
+
+    def run_due(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Scheduler entry point: refresh the heap, then send everything that is due."""
+        now = now or datetime.utcnow()
+        read = self.load(now)
+        due = self.pop_due(now)
+        sent = self.send(due, now) if due else 0
+        if due:
+            logger.info(f"Sent {sent} deadline reminders for {len(due)} opportunities")
+        return {'rows_read': read, 'due': len(due), 'reminders': sent, 'scheduled': len(self)}
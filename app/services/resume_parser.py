@@ -0,0 +1,109 @@
+"""
+Resume Parser
+Streams text out of PDF resumes page by page and extracts skills and interests.
+Kept free of database access so it can run inside worker processes.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set
+
+# Canonical skill names; matching is done on lower-cased token n-grams
+SKILL_VOCABULARY = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Golang', 'Rust', 'SQL', 'MATLAB',
+    'HTML', 'CSS', 'React', 'Angular', 'Node.js', 'Flask', 'Django', 'Spring', 'Docker', 'Kubernetes',
+    'AWS', 'Azure', 'GCP', 'Linux', 'Git', 'Machine Learning', 'Deep Learning', 'Data Science',
+    'Data Analysis', 'Computer Vision', 'Natural Language Processing', 'NLP', 'TensorFlow', 'PyTorch',
+    'Scikit-learn', 'Pandas', 'NumPy', 'Statistics', 'Algorithms', 'Data Structures', 'Linear Algebra',
+    'Calculus', 'Econometrics', 'Finance', 'Accounting', 'Legal Writing', 'Legal Research', 'Litigation',
+    'Public Speaking', 'Research', 'Biology', 'Chemistry', 'Physics', 'Genomics', 'Bioinformatics',
+    'CAD', 'SolidWorks', 'AutoCAD', 'Circuit Design', 'Embedded Systems', 'Robotics',
+]
+
+MAX_NGRAM = 3
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill name for matching ("  Machine  learning " -> "machine learning")."""
+    return ' '.join(skill.lower().split())
+
+
+def _tokenize(text: str) -> List[str]:
+    # nltk pulls in scipy on import; only resume parsing needs it, not every process
+    # that imports normalize_skill
+    from nltk.tokenize import wordpunct_tokenize
+
+    return wordpunct_tokenize(text)
+
+
+def _phrase_key(text: str) -> str:
+    """Tokenize a phrase the same way resume text is tokenized."""
+    return ' '.join(_tokenize(text.lower()))
+
+
+@lru_cache(maxsize=None)
+def _skills_by_key() -> Dict[str, str]:
+    return {_phrase_key(skill): skill for skill in SKILL_VOCABULARY}
+
+
+def _ngrams(tokens: List[str], max_n: int = MAX_NGRAM) -> Iterable[str]:
+    for n in range(1, max_n + 1):
+        for i in range(len(tokens) - n + 1):
+            yield ' '.join(tokens[i:i + n])
+
+
+def extract_keywords(pages: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Extract skills and interest domains from an iterable of page texts.
+
+    Args:
+        pages: Page texts (consumed one at a time)
+
+    Returns:
+        Dictionary with sorted ``skills`` and ``interests`` lists and the page count
+    """
+    from app.services.classifier import DomainClassifier
+
+    domain_keys = {domain: {_phrase_key(keyword) for keyword in keywords}
+                   for domain, keywords in DomainClassifier.DOMAIN_KEYWORDS.items()}
+    skills_by_key = _skills_by_key()
+    skills: Set[str] = set()
+    domain_hits: Dict[str, int] = {}
+    page_count = 0
+
+    for text in pages:
+        page_count += 1
+        tokens = _tokenize((text or '').lower())
+        for gram in _ngrams(tokens):
+            if gram in skills_by_key:
+                skills.add(skills_by_key[gram])
+            for domain, keys in domain_keys.items():
+                if gram in keys:
+                    domain_hits[domain] = domain_hits.get(domain, 0) + 1
+
+    interests = [domain for domain, hits in sorted(domain_hits.items(), key=lambda item: -item[1]) if hits >= 2]
+    return {'skills': sorted(skills), 'interests': interests, 'pages': page_count}
+
+
+def iter_pdf_pages(path: str, max_pages: int = 50) -> Iterable[str]:
+    """Yield the text of each page without holding the whole document's text in memory."""
+    from PyPDF2 import PdfReader
+
+    with open(path, 'rb') as stream:
+        reader = PdfReader(stream)
+        for index, page in enumerate(reader.pages):
+            if index >= max_pages:
+                break
+            yield page.extract_text() or ''
+
+
+def parse_resume(path: str, max_pages: int = 50) -> Dict[str, List[str]]:
+    """
+    Parse a PDF resume. Entry point for the process pool.
+
+    Args:
+        path: Path of the stored PDF
+        max_pages: Pages to read at most
+
+    Returns:
+        Extracted ``skills``, ``interests`` and ``pages``
+    """
+    return extract_keywords(iter_pdf_pages(path, max_pages))
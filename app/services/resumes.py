@@ -0,0 +1,135 @@
+"""
+Module 3: Resume Ingestion Pipeline
+Stores uploaded resumes by content hash, parses them in a process pool off the
+request path and merges the extracted skills and interests into the student profile.
+"""
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+
+from app import db, user_cache
+from app.models.resume import ResumeExtraction
+from app.models.user import User
+from app.services.bulk import insert_ignore
+from app.services.resume_parser import parse_resume
+from app.services.skill_index import skill_index
+
+logger = logging.getLogger(__name__)
+
+
+class ResumePipeline:
+    """Upload, parse and apply resumes."""
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def store_upload(file_storage, folder: str, chunk_size: int = 64 * 1024) -> Tuple[str, str]:
+        """
+        Stream an uploaded file to disk while hashing it.
+
+        Args:
+            file_storage: Werkzeug ``FileStorage`` from ``request.files``
+            folder: Destination directory
+            chunk_size: Bytes read per iteration
+
+        Returns:
+            Tuple of (stored path, SHA-256 hex digest)
+        """
+        os.makedirs(folder, exist_ok=True)
+        digest = hashlib.sha256()
+
+        with tempfile.NamedTemporaryFile(dir=folder, suffix='.part', delete=False) as tmp:
+            while True:
+                chunk = file_storage.stream.read(chunk_size)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        content_hash = digest.hexdigest()
+        path = os.path.join(folder, f'{content_hash}.pdf')
+        os.replace(tmp.name, path)
+        return path, content_hash
+
+    @classmethod
+    def executor(cls) -> ProcessPoolExecutor:
+        """Process pool shared by all parse jobs in this process (created on first use)."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=current_app.config['RESUME_PARSE_WORKERS'],
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return cls._executor
+
+    @staticmethod
+    def cached_result(content_hash: str) -> Optional[ResumeExtraction]:
+        """Return a previous extraction of identical content, if any."""
+        return db.session.get(ResumeExtraction, content_hash)
+
+    @staticmethod
+    def _merge(existing: Optional[str], extracted: List[str]) -> str:
+        values = [value.strip() for value in (existing or '').split(',') if value.strip()]
+        seen = {value.lower() for value in values}
+        for value in extracted:
+            if value and value.lower() not in seen:
+                values.append(value)
+                seen.add(value.lower())
+        return ', '.join(values)
+
+    @staticmethod
+    def apply_to_user(user_id: int, extraction: ResumeExtraction) -> None:
+        """Merge extracted skills and interests into the user's profile."""
+        user = db.session.get(User, user_id)
+        if user is None:
+            return
+        user.skills = ResumePipeline._merge(user.skills, (extraction.skills or '').split(', '))
+        user.interests = ResumePipeline._merge(user.interests, (extraction.interests or '').split(', '))
+        db.session.commit()
+        user_cache.invalidate(user_id)
+        skill_index.update_user(user)
+
+    @classmethod
+    def process(cls, user_id: int, path: str, content_hash: str, progress=None) -> Dict:
+        """
+        Parse a stored resume (unless cached) and update the student profile.
+
+        Args:
+            user_id: Owner of the resume
+            path: Stored PDF path
+            content_hash: SHA-256 of the file
+            progress: Optional job progress callback
+
+        Returns:
+            Extracted skills and interests and whether the cache was hit
+        """
+        extraction = cls.cached_result(content_hash)
+        cached = extraction is not None
+
+        if not cached:
+            result = cls.executor().submit(
+                parse_resume, path, current_app.config['RESUME_MAX_PAGES']
+            ).result(timeout=current_app.config['RESUME_PARSE_TIMEOUT'])
+            db.session.execute(insert_ignore(ResumeExtraction).values(
+                content_hash=content_hash,
+                skills=', '.join(result['skills']),
+                interests=', '.join(result['interests']),
+                pages=result['pages'],
+            ))
+            db.session.commit()
+            extraction = cls.cached_result(content_hash)
+
+        cls.apply_to_user(user_id, extraction)
+        if progress:
+            progress(1, 1)
+
+        logger.info(f"Resume {content_hash[:12]} applied to user {user_id} (cached={cached})")
+        return {'skills': extraction.skills, 'interests': extraction.interests, 'cached': cached}
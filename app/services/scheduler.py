@@ -0,0 +1,101 @@
+"""
+Periodic Job Scheduler
+Runs maintenance jobs (expiry, archival, ...) at fixed intervals inside an application context.
+Started once per deployment with ``flask --app run run-scheduler``, not inside web workers.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from flask import Flask
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    """A job and its run interval."""
+    name: str
+    interval: float
+    func: Callable[[], object]
+    next_run: float = 0.0
+
+
+class JobScheduler:
+    """Single-threaded interval scheduler."""
+
+    def __init__(self, app: Flask):
+        self.app = app
+        self.jobs: List[ScheduledJob] = []
+
+    def register(self, name: str, interval: float, func: Callable[[], object]) -> None:
+        """
+        Register a job to run every ``interval`` seconds.
+
+        Args:
+            name: Job name used in logs
+            interval: Seconds between runs
+            func: Callable executed inside an application context
+        """
+        self.jobs.append(ScheduledJob(name=name, interval=interval, func=func))
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        Run every job that is due.
+
+        Returns:
+            Number of jobs executed
+        """
+        now = now if now is not None else time.monotonic()
+        executed = 0
+        for job in self.jobs:
+            if job.next_run > now:
+                continue
+            with self.app.app_context():
+                try:
+                    result = job.func()
+                    if result is not None:  # None: nothing was due
+                        logger.info(f"Job {job.name} finished: {result}")
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Job {job.name} failed: {str(e)}")
+            job.next_run = now + job.interval
+            executed += 1
+        return executed
+
+    def run_forever(self, poll_interval: float = 1.0) -> None:
+        """Run jobs until interrupted."""
+        logger.info(f"Scheduler started with jobs: {', '.join(job.name for job in self.jobs)}")
+        while True:
+            self.run_pending()
+            time.sleep(poll_interval)
+
+
+def create_scheduler(app: Flask) -> JobScheduler:
+    """Build the scheduler with all standard maintenance jobs."""
+    from app.services.analytics import AnalyticsRollups
+    from app.services.catalog import catalog
+    from app.services.leaderboard import LeaderboardHistory
+    from app.services.lifecycle import OpportunityLifecycle
+    from app.services.notifications import NotificationFanout
+    from app.services.reminders import DeadlineReminders
+
+    scheduler = JobScheduler(app)
+    scheduler.register('expire-opportunities', app.config['EXPIRY_INTERVAL_SECONDS'],
+                       OpportunityLifecycle.expire_past_deadline)
+    scheduler.register('archive-opportunities', app.config['ARCHIVE_INTERVAL_SECONDS'],
+                       lambda: OpportunityLifecycle.archive_inactive(app.config['ARCHIVE_AFTER_DAYS']))
+    scheduler.register('build-digests', app.config['DIGEST_INTERVAL_SECONDS'],
+                       NotificationFanout.build_digests)
+    scheduler.register('refresh-analytics', app.config['ANALYTICS_REFRESH_INTERVAL_SECONDS'],
+                       AnalyticsRollups.refresh)
+    scheduler.register('rebuild-catalog', app.config['CATALOG_STALE_CHECK_SECONDS'], catalog.refresh)
+    reminders = DeadlineReminders(lead_hours=app.config['DEADLINE_REMINDER_HOURS'])
+    scheduler.register('deadline-reminders', app.config['REMINDER_INTERVAL_SECONDS'], reminders.run_due)
+    scheduler.register('snapshot-leaderboard', app.config['LEADERBOARD_SNAPSHOT_INTERVAL_SECONDS'],
+                       lambda: LeaderboardHistory.run(app.config['LEADERBOARD_KEEP_HOURLY_DAYS'],
+                                                      app.config['LEADERBOARD_RETENTION_DAYS']))
+    return scheduler
@@ -0,0 +1,134 @@
+"""
+Schema Upgrades
+``flask init-db`` creates missing tables with ``create_all``, which never changes a table
+that already exists. Columns, indexes and constraints added to existing tables later are
+applied here, after ``create_all``. Every upgrade inspects the live schema (or data) first, so
+running ``init-db`` again (or against a freshly created database) changes nothing.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import bindparam, inspect, select, text, update
+
+from app import db
+from app.models.community import Post
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+from app.services.bulk import chunked
+
+logger = logging.getLogger(__name__)
+
+
+def has_column(connection, table: str, column: str) -> bool:
+    return column in {info['name'] for info in inspect(connection).get_columns(table)}
+
+
+def has_index(connection, table: str, name: str) -> bool:
+    """Index or (named) unique constraint ``name`` exists on ``table``."""
+    inspector = inspect(connection)
+    return name in ({info['name'] for info in inspector.get_indexes(table)}
+                    | {info['name'] for info in inspector.get_unique_constraints(table)})
+
+
+def add_column(connection, model, name: str) -> bool:
+    """Add a mapped column the table lacks (as nullable, without default); returns whether it was added."""
+    table = model.__tablename__
+    if has_column(connection, table, name):
+        return False
+    column_type = model.__table__.c[name].type.compile(dialect=connection.dialect)
+    connection.execute(text(f'ALTER TABLE {table} ADD COLUMN {name} {column_type}'))
+    return True
+
+
+def create_indexes(connection, model, names: Iterable[str]) -> List[str]:
+    """Create the model's declared indexes among ``names`` that the table lacks."""
+    wanted = set(names)
+    created = []
+    for index in model.__table__.indexes:
+        if index.name in wanted and not has_index(connection, model.__tablename__, index.name):
+            index.create(connection)
+            created.append(index.name)
+    return created
+
+
+def _unique_applications(connection) -> Optional[str]:
+    """One application per student and opportunity, which auto-apply's insert-ignore relies on."""
+    if has_index(connection, 'applications', 'unique_application'):
+        return None
+    # Keep the first application of each pair (wrapped in a derived table for MySQL)
+    removed = connection.execute(text(
+        'DELETE FROM applications WHERE id NOT IN (SELECT id FROM '
+        '(SELECT MIN(id) AS id FROM applications GROUP BY student_id, opportunity_id) AS keep)'
+    )).rowcount
+    connection.execute(text('CREATE UNIQUE INDEX unique_application ON applications (student_id, opportunity_id)'))
+    return f'unique_application index ({removed} duplicate applications removed)'
+
+
+def _application_updated_at(connection) -> Optional[str]:
+    """``applications.updated_at`` for incremental exports, backfilled from ``submitted_at``."""
+    if not add_column(connection, Application, 'updated_at'):
+        return None
+    connection.execute(text('UPDATE applications SET updated_at = submitted_at WHERE updated_at IS NULL'))
+    create_indexes(connection, Application, ['ix_applications_updated_at'])
+    return 'applications.updated_at'
+
+
+def _post_hot_score(connection) -> Optional[str]:
+    """``posts.hot_score`` for the hot feed, computed for every existing post."""
+    if not add_column(connection, Post, 'hot_score'):
+        return None
+    rows = connection.execute(select(Post.id, Post.likes_count, Post.comments_count, Post.created_at)).all()
+    now = datetime.utcnow()
+    stmt = update(Post).where(Post.id == bindparam('post_id')).values(hot_score=bindparam('score'))
+    for chunk in chunked(rows, 5000):
+        connection.execute(stmt, [{'post_id': post_id, 'score': Post.hot_score_for(likes, comments, created_at or now)}
+                                  for post_id, likes, comments, created_at in chunk])
+    create_indexes(connection, Post, ['ix_posts_hot_score', 'ix_posts_domain_hot_score'])
+    return f'posts.hot_score ({len(rows)} posts scored)'
+
+
+def _opportunity_content_hash(connection) -> Optional[str]:
+    """Scrape change detection; existing rows get their hash when next re-scraped."""
+    if not add_column(connection, Opportunity, 'content_hash'):
+        return None
+    create_indexes(connection, Opportunity, ['ix_opportunities_url'])
+    return 'opportunities.content_hash'
+
+
+def _normalize_interests(connection) -> Optional[str]:
+    """Rewrite interests saved before they were normalized on write (``AI, Law`` -> ``AI,Law``)."""
+    rows = connection.execute(select(User.id, User.interests).where(User.interests.is_not(None))).all()
+    changed = [{'user_id': user_id, 'interests': User.normalize_list(interests)}
+               for user_id, interests in rows if User.normalize_list(interests) != interests]
+    stmt = update(User).where(User.id == bindparam('user_id'))\
+        .values(interests=bindparam('interests'), updated_at=User.updated_at)  # Not a profile change
+    for chunk in chunked(changed, 5000):
+        connection.execute(stmt, chunk)
+    return f'users.interests normalized ({len(changed)} users)' if changed else None
+
+
+UPGRADES: List[Callable] = [
+    _unique_applications,
+    _application_updated_at,
+    _post_hot_score,
+    _opportunity_content_hash,
+    _normalize_interests,
+]
+
+
+def upgrade_schema() -> List[str]:
+    """
+    Apply the pending upgrades, each in its own transaction.
+
+    Returns:
+        Descriptions of the upgrades that changed the schema
+    """
+    applied = []
+    for upgrade in UPGRADES:
+        with db.engine.begin() as connection:
+            result = upgrade(connection)
+        if result:
+            logger.info(f"Schema upgrade: {result}")
+            applied.append(result)
+    return applied
@@ -2,8 +2,6 @@
 Module 1: Real-Time Opportunity Extraction
 Web scraping service for Ivy League universities
 """
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict
 from datetime import datetime
 import logging
@@ -42,6 +40,9 @@ class OpportunityScraper:
         Returns:
             List of opportunity dictionaries
         """
+        import requests
+        from bs4 import BeautifulSoup
+
         opportunities = []
         
         try:
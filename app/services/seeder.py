@@ -0,0 +1,204 @@
+"""
+Synthetic Data Generator
+Bulk-generates realistic users, opportunities, applications and community activity
+for capacity planning and load testing.
+"""
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import func, insert
+
+from app import db
+from app.models.community import Comment, Like, Post
+from app.models.opportunity import Application, Opportunity
+from app.models.user import User
+from app.services.bulk import chunked
+from app.services.classifier import DomainClassifier
+from app.services.passwords import password_hasher
+from app.services.ranking import InCoScoreEngine
+
+logger = logging.getLogger(__name__)
+
+
+class DataSeeder:
+    """Generates synthetic rows at configurable scale using bulk inserts."""
+
+    USERNAME_PREFIX = 'seed_user_'
+    DEFAULT_PASSWORD = 'loadtest123'
+
+    UNIVERSITIES = ['Harvard', 'MIT', 'Yale', 'Princeton', 'Columbia', 'Cornell', 'UPenn', 'Brown']
+    CATEGORIES = ['Workshop', 'Hackathon', 'Research', 'Scholarship', 'Conference']
+    SKILLS = [
+        'Python', 'Java', 'C++', 'SQL', 'Machine Learning', 'Deep Learning', 'Data Science',
+        'Statistics', 'Public Speaking', 'Legal Writing', 'CAD', 'MATLAB', 'React', 'Flask',
+        'Research', 'Biology', 'Chemistry', 'Econometrics', 'Algorithms', 'Linear Algebra',
+    ]
+
+    def __init__(self, batch_size: int = 5000, seed: Optional[int] = None,
+                 password: str = DEFAULT_PASSWORD):
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.now = datetime.utcnow()
+        # Hash once: per-row hashing would dominate seeding time
+        self.password_hash = password_hasher.hash(password)
+
+    def _past(self, days: int = 180) -> datetime:
+        return self.now - timedelta(seconds=self.random.randint(0, days * 86400))
+
+    def _insert_chunks(self, model, rows: Iterator[Dict], progress: Optional[Callable] = None) -> List[int]:
+        """Bulk insert generated rows chunk by chunk and return the new primary keys."""
+        ids: List[int] = []
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        for chunk in chunked(rows, self.batch_size):
+            ids.extend(db.session.execute(stmt, chunk).scalars().all())
+            db.session.commit()
+            if progress:
+                progress(model.__tablename__, len(ids))
+        return ids
+
+    def _user_rows(self, count: int, offset: int) -> Iterator[Dict]:
+        for n in range(offset, offset + count):
+            row = {
+                'username': f'{self.USERNAME_PREFIX}{n}',
+                'email': f'{self.USERNAME_PREFIX}{n}@example.edu',
+                'password_hash': self.password_hash,
+                'full_name': f'Seed Student {n}',
+                'domain': self.random.choice(DomainClassifier.DOMAINS),
+                'skills': ', '.join(self.random.sample(self.SKILLS, self.random.randint(2, 6))),
+                'interests': ','.join(self.random.sample(DomainClassifier.DOMAINS, 2)),
+                'academic_background': 'Synthetic academic background for load testing.',
+                'hackathons_count': self.random.randint(0, 10),
+                'internships_count': self.random.randint(0, 5),
+                'research_papers_count': self.random.randint(0, 4),
+                'coding_score': round(self.random.uniform(0, 1000), 1),
+                'competition_wins': self.random.randint(0, 6),
+                'created_at': self._past(),
+            }
+            row['incoscore'] = round(
+                row['hackathons_count'] * InCoScoreEngine.WEIGHTS['hackathons'] +
+                row['internships_count'] * InCoScoreEngine.WEIGHTS['internships'] +
+                row['research_papers_count'] * InCoScoreEngine.WEIGHTS['research_papers'] +
+                row['coding_score'] * InCoScoreEngine.WEIGHTS['coding_score'] +
+                row['competition_wins'] * InCoScoreEngine.WEIGHTS['competition_wins'], 2)
+            yield row
+
+    def _opportunity_rows(self, count: int, offset: int) -> Iterator[Dict]:
+        for n in range(offset, offset + count):
+            domain = self.random.choice(DomainClassifier.DOMAINS)
+            category = self.random.choice(self.CATEGORIES)
+            keywords = ', '.join(DomainClassifier.DOMAIN_KEYWORDS.get(domain, ['general studies'])[:3])
+            yield {
+                'title': f'{domain} {category} #{n}',
+                'description': f'A {category.lower()} for students interested in {keywords}. ' * 4,
+                'university': self.random.choice(self.UNIVERSITIES),
+                'domain': domain,
+                'category': category,
+                'deadline': self.now + timedelta(days=self.random.randint(-30, 120)),
+                'url': f'https://example.edu/opportunities/{n}',
+                'requirements': ', '.join(self.random.sample(self.SKILLS, 3)),
+                'location': self.random.choice(['Online', 'On campus', 'Hybrid']),
+                'is_active': True,
+                'extracted_at': self._past(90),
+            }
+
+    def _application_rows(self, student_ids: List[int], opportunity_ids: List[int],
+                          per_student: int) -> Iterator[Dict]:
+        k = min(per_student, len(opportunity_ids))
+        for student_id in student_ids:
+            for opportunity_id in self.random.sample(opportunity_ids, k):
+                yield {
+                    'student_id': student_id,
+                    'opportunity_id': opportunity_id,
+                    'status': self.random.choice(['pending', 'submitted', 'accepted', 'rejected']),
+                    'submitted_at': self._past(60),
+                }
+
+    def seed(self, users: int = 1000, opportunities: int = 500, applications_per_user: int = 5,
+             posts: int = 2000, comments_per_post: int = 3, likes_per_post: int = 10,
+             progress: Optional[Callable] = None) -> Dict[str, int]:
+        """
+        Generate a full synthetic dataset.
+
+        Args:
+            users: Number of students to create
+            opportunities: Number of opportunities spread across all domains
+            applications_per_user: Distinct applications per student
+            posts: Number of community posts
+            comments_per_post: Average comments per post
+            likes_per_post: Average likes per post (capped by user count)
+            progress: Optional callback ``(table, rows_so_far)``
+
+        Returns:
+            Number of rows inserted per table
+        """
+        user_offset = (db.session.query(func.max(User.id)).scalar() or 0) + 1
+        opp_offset = (db.session.query(func.max(Opportunity.id)).scalar() or 0) + 1
+
+        user_ids = self._insert_chunks(User, self._user_rows(users, user_offset), progress)
+        opportunity_ids = self._insert_chunks(
+            Opportunity, self._opportunity_rows(opportunities, opp_offset), progress)
+
+        application_count = 0
+        if user_ids and opportunity_ids:
+            for student_chunk in chunked(user_ids, self.batch_size):
+                rows = list(self._application_rows(student_chunk, opportunity_ids, applications_per_user))
+                application_count += len(self._insert_chunks(Application, iter(rows)))
+                if progress:
+                    progress(Application.__tablename__, application_count)
+
+        counts = {'users': len(user_ids), 'opportunities': len(opportunity_ids),
+                  'applications': application_count, 'posts': 0, 'comments': 0, 'likes': 0}
+        if user_ids:
+            counts.update(self._seed_community(user_ids, posts, comments_per_post, likes_per_post, progress))
+
+        logger.info(f"Seeded {counts}")
+        return counts
+
+    def _seed_community(self, user_ids: List[int], posts: int, comments_per_post: int,
+                        likes_per_post: int, progress: Optional[Callable]) -> Dict[str, int]:
+        """Insert posts chunk by chunk, then their comments and likes with matching counters."""
+        counts = {'posts': 0, 'comments': 0, 'likes': 0}
+        post_stmt = insert(Post).returning(Post.id, sort_by_parameter_order=True)
+
+        for chunk_start in range(0, posts, self.batch_size):
+            chunk_size = min(self.batch_size, posts - chunk_start)
+            post_rows = []
+            for _ in range(chunk_size):
+                n_likes = min(self.random.randint(0, likes_per_post * 2), len(user_ids))
+                n_comments = self.random.randint(0, comments_per_post * 2)
+                created_at = self._past(30)
+                post_rows.append({
+                    'user_id': self.random.choice(user_ids),
+                    'title': f'Sharing my latest {self.random.choice(self.CATEGORIES).lower()} experience',
+                    'content': 'Synthetic community post generated for load testing. ' * 5,
+                    'domain': self.random.choice(DomainClassifier.DOMAINS),
+                    'likes_count': n_likes,
+                    'comments_count': n_comments,
+                    'hot_score': Post.hot_score_for(n_likes, n_comments, created_at),
+                    'created_at': created_at,
+                })
+            post_ids = db.session.execute(post_stmt, post_rows).scalars().all()
+
+            comment_rows, like_rows = [], []
+            for post_id, row in zip(post_ids, post_rows):
+                for _ in range(row['comments_count']):
+                    comment_rows.append({'post_id': post_id, 'user_id': self.random.choice(user_ids),
+                                         'content': 'Great post, thanks for sharing!',
+                                         'created_at': self._past(30)})
+                for user_id in self.random.sample(user_ids, row['likes_count']):
+                    like_rows.append({'post_id': post_id, 'user_id': user_id, 'created_at': self._past(30)})
+
+            for rows, model in ((comment_rows, Comment), (like_rows, Like)):
+                for chunk in chunked(rows, self.batch_size):
+                    db.session.execute(insert(model), chunk)
+            db.session.commit()
+
+            counts['posts'] += len(post_ids)
+            counts['comments'] += len(comment_rows)
+            counts['likes'] += len(like_rows)
+            if progress:
+                progress(Post.__tablename__, counts['posts'])
+
+        return counts
@@ -0,0 +1,279 @@
+"""
+Skill Index
+In-memory inverted index from normalized skills to students, used to rank candidates
+for an opportunity by skill overlap with its requirements, InCoScore and domain.
+
+Students occupy dense slots in numpy arrays and every posting list is an append-only
+array of slots. Changing a student's skills retires the old slot and appends a new
+one, so updates never rewrite posting lists; retired slots are compacted away once
+they make up a quarter of the index. Each worker process keeps its own index, built
+on first use and caught up from ``User.updated_at`` at most every
+``SKILL_INDEX_SYNC_SECONDS``, so profile changes made elsewhere show up within that interval.
+"""
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app import db
+from app.models.user import User
+from app.services.resume_parser import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r'[a-z0-9+#][a-z0-9+#.\-]*')
+MAX_SKILL_WORDS = 3
+
+
+def parse_skills(text: Optional[str]) -> FrozenSet[str]:
+    """Normalized skills of a comma-separated ``User.skills`` value."""
+    return frozenset(normalize_skill(skill) for skill in (text or '').split(',') if skill.strip())
+
+
+def text_phrases(text: Optional[str]) -> Set[str]:
+    """Every 1-3 word phrase of free text, normalized like ``parse_skills`` output."""
+    tokens = [token.rstrip('.') for token in _TOKEN.findall((text or '').lower())]
+    tokens = [token for token in tokens if token]
+    return {
+        ' '.join(tokens[i:i + n])
+        for n in range(1, MAX_SKILL_WORDS + 1)
+        for i in range(len(tokens) - n + 1)
+    }
+
+
+class _Postings:
+    """Growable array of slots."""
+    __slots__ = ('slots', 'size')
+
+    def __init__(self, capacity: int = 8):
+        self.slots = np.empty(capacity, dtype=np.int32)
+        self.size = 0
+
+    def append(self, slot: int) -> None:
+        if self.size == len(self.slots):
+            self.slots = np.resize(self.slots, len(self.slots) * 2)
+        self.slots[self.size] = slot
+        self.size += 1
+
+    def view(self) -> np.ndarray:
+        return self.slots[:self.size]
+
+
+class SkillIndex:
+    """Thread-safe skill -> student index with vectorized top-K scoring."""
+
+    SKILL_WEIGHT = 0.6
+    INCOSCORE_WEIGHT = 0.3
+    DOMAIN_WEIGHT = 0.1
+
+    def __init__(self, sync_interval: float = 5.0):
+        self.sync_interval = sync_interval
+        self._lock = threading.RLock()
+        self._built = False
+        self._reset(capacity=1024)
+
+    def init_app(self, app) -> None:
+        """Read the catch-up interval from the application config."""
+        self.sync_interval = app.config.get('SKILL_INDEX_SYNC_SECONDS', self.sync_interval)
+
+    def _reset(self, capacity: int) -> None:
+        self._size = 0
+        self._dead = 0
+        self._user_ids = np.zeros(capacity, dtype=np.int64)
+        self._incoscore = np.zeros(capacity, dtype=np.float64)
+        self._domain = np.zeros(capacity, dtype=np.int32)  # 0 = no domain
+        self._skills_hash = np.zeros(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._slot_of: Dict[int, int] = {}
+        self._domain_codes: Dict[str, int] = {}
+        self._postings: Dict[str, _Postings] = {}
+        self._watermark: Optional[datetime] = None
+        self._synced_at = 0.0
+        self._best: Optional[float] = None  # Highest live InCoScore, recomputed lazily
+
+    def _grow(self) -> None:
+        capacity = len(self._alive) * 2
+        for name in ('_user_ids', '_incoscore', '_domain', '_skills_hash', '_alive'):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def _domain_code(self, domain: Optional[str]) -> int:
+        if not domain:
+            return 0
+        return self._domain_codes.setdefault(domain, len(self._domain_codes) + 1)
+
+    def _apply(self, user_id: int, skills_text: Optional[str], domain: Optional[str],
+               incoscore: Optional[float]) -> None:
+        skills = parse_skills(skills_text)
+        skills_hash = hash(skills)
+        slot = self._slot_of.get(user_id)
+
+        if slot is None or self._skills_hash[slot] != skills_hash:
+            if slot is not None:
+                self._alive[slot] = False
+                self._dead += 1
+            if self._size == len(self._alive):
+                self._grow()
+            slot = self._size
+            self._size += 1
+            self._slot_of[user_id] = slot
+            self._user_ids[slot] = user_id
+            self._skills_hash[slot] = skills_hash
+            self._alive[slot] = True
+            for skill in skills:
+                postings = self._postings.get(skill)
+                if postings is None:
+                    postings = self._postings[skill] = _Postings()
+                postings.append(slot)
+
+        incoscore = incoscore or 0.0
+        if self._best is not None and (incoscore > self._best or self._incoscore[slot] >= self._best):
+            self._best = None
+        self._incoscore[slot] = incoscore
+        self._domain[slot] = self._domain_code(domain)
+
+    def _compact(self) -> None:
+        """Drop retired slots and renumber posting lists."""
+        alive = self._alive[:self._size]
+        new_slot = np.cumsum(alive) - 1
+        for name in ('_user_ids', '_incoscore', '_domain', '_skills_hash', '_alive'):
+            array = getattr(self, name)
+            kept = array[:self._size][alive]
+            compacted = np.zeros(len(array), dtype=array.dtype)
+            compacted[:len(kept)] = kept
+            setattr(self, name, compacted)
+
+        for skill in list(self._postings):
+            slots = self._postings[skill].view()
+            slots = new_slot[slots[alive[slots]]]
+            if len(slots):
+                postings = _Postings(capacity=max(8, len(slots)))
+                postings.slots[:len(slots)] = slots
+                postings.size = len(slots)
+                self._postings[skill] = postings
+            else:
+                del self._postings[skill]
+
+        self._size = int(alive.sum())
+        self._dead = 0
+        self._slot_of = {int(user_id): slot for slot, user_id in enumerate(self._user_ids[:self._size])}
+
+    def _load(self, since: Optional[datetime]) -> int:
+        stmt = select(User.id, User.skills, User.domain, User.incoscore, User.updated_at)
+        if since is not None:
+            stmt = stmt.where(User.updated_at >= since)
+        rows = 0
+        for user_id, skills, domain, incoscore, updated_at in db.session.execute(
+                stmt, execution_options={'yield_per': 10000}):
+            self._apply(user_id, skills, domain, incoscore)
+            if updated_at is not None and (self._watermark is None or updated_at > self._watermark):
+                self._watermark = updated_at
+            rows += 1
+        return rows
+
+    def sync(self, force: bool = False) -> None:
+        """Build the index on first use, then apply profile changes since the last sync."""
+        with self._lock:
+            if not force and self._built and time.monotonic() - self._synced_at < self.sync_interval:
+                return
+            if not self._built:
+                started = time.perf_counter()
+                rows = self._load(since=None)
+                self._built = True
+                logger.info(f"Skill index built: {rows} students, {len(self._postings)} skills "
+                            f"in {time.perf_counter() - started:.2f}s")
+            elif self._watermark is not None:
+                # Re-read a small overlap: rows committed late with an earlier timestamp
+                self._load(since=self._watermark - timedelta(seconds=1))
+            if self._dead > max(1000, self._size // 4):
+                self._compact()
+            self._synced_at = time.monotonic()
+
+    def update_user(self, user: User) -> None:
+        """Apply a profile change made in this process immediately."""
+        with self._lock:
+            if self._built:
+                self._apply(user.id, user.skills, user.domain, user.incoscore)
+
+    def remove_user(self, user_id: int) -> None:
+        """Retire a deleted user's slot."""
+        with self._lock:
+            slot = self._slot_of.pop(user_id, None)
+            if slot is not None:
+                self._alive[slot] = False
+                self._dead += 1
+                self._best = None
+
+    def clear(self) -> None:
+        """Drop the index; it is rebuilt on next use."""
+        with self._lock:
+            self._built = False
+            self._reset(capacity=1024)
+
+    def match_skills(self, text: Optional[str]) -> List[str]:
+        """Indexed skills mentioned in free text such as ``Opportunity.requirements``."""
+        self.sync()
+        with self._lock:
+            return sorted(phrase for phrase in text_phrases(text) if phrase in self._postings)
+
+    def top_candidates(self, skills: Iterable[str], domain: Optional[str] = None,
+                       limit: int = 5) -> List[Tuple[int, float, int]]:
+        """
+        Rank students by skill overlap, InCoScore and domain match.
+
+        Only students sharing at least one skill or the domain are candidates.
+        Score = 0.6 * share of the requested skills held + 0.3 * InCoScore relative to
+        the best student + 0.1 * domain match.
+
+        Args:
+            skills: Normalized skills to match
+            domain: Opportunity domain (optional)
+            limit: Number of candidates
+
+        Returns:
+            List of ``(user_id, score, matched_skill_count)``, best first
+        """
+        self.sync()
+        with self._lock:
+            n = self._size
+            wanted = [skill for skill in set(skills) if skill in self._postings]
+            domain_code = self._domain_codes.get(domain, -1) if domain else -1
+
+            same_domain = self._domain[:n] == domain_code
+            if wanted:
+                overlap = np.bincount(
+                    np.concatenate([self._postings[skill].view() for skill in wanted]), minlength=n)
+                candidates = np.flatnonzero(((overlap > 0) | same_domain) & self._alive[:n])
+                matched = overlap[candidates]
+            else:
+                candidates = np.flatnonzero(same_domain & self._alive[:n])
+                matched = np.zeros(len(candidates), dtype=np.int64)
+            if not len(candidates):
+                return []
+
+            best = self._best_incoscore()
+            score = self._incoscore[candidates] * (self.INCOSCORE_WEIGHT / best if best > 0 else 0.0)
+            score += self.DOMAIN_WEIGHT * same_domain[candidates]
+            if wanted:
+                score += (self.SKILL_WEIGHT / len(wanted)) * matched
+
+            limit = min(limit, len(candidates))
+            top = np.argpartition(-score, limit - 1)[:limit]
+            top = top[np.argsort(-score[top], kind='stable')]
+            return [(int(self._user_ids[candidates[i]]), round(float(score[i]), 4), int(matched[i]))
+                    for i in top]
+
+    def _best_incoscore(self) -> float:
+        if self._best is None:
+            alive = self._alive[:self._size]
+            self._best = float(self._incoscore[:self._size][alive].max()) if alive.any() else 0.0
+        return self._best
+
+skill_index = SkillIndex()
@@ -0,0 +1,93 @@
+"""
+Startup Profiling
+Measures how long a fresh interpreter takes to import the app and run ``create_app``,
+and which modules it spends that time on. Every measurement runs in a new
+subprocess so module caches of the calling process do not hide import costs.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Imported only by the code paths that use them; loading any of these during
+# create_app() adds hundreds of milliseconds to every worker and CLI start
+LAZY_MODULES = ('sklearn', 'scipy', 'nltk', 'bs4', 'requests', 'pandas', 'pyarrow', 'PyPDF2')
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_BOOT = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app()
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'create_app_ms': (finished - imported) * 1000,
+    'lazy_loaded': sorted(name for name in %r if name in sys.modules),
+}))
+""" % (LAZY_MODULES,)
+
+
+class StartupProfiler:
+    """Cold-start measurements of the application factory."""
+
+    @staticmethod
+    def _run(args: List[str]) -> subprocess.CompletedProcess:
+        return subprocess.run([sys.executable, *args, '-c', _BOOT], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True)
+
+    @classmethod
+    def import_profile(cls, limit: int = 25) -> Dict:
+        """
+        Break down import time with ``python -X importtime``.
+
+        Args:
+            limit: Number of modules to return
+
+        Returns:
+            Dictionary with ``modules`` (slowest first by cumulative time, in ms),
+            ``packages`` (self time summed per top-level package) and the boot report
+        """
+        result = cls._run(['-X', 'importtime'])
+        modules, packages = [], {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or line.endswith('| imported package'):
+                continue
+            self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+            depth = (len(name) - len(name.lstrip())) // 2
+            name = name.strip()
+            modules.append({'module': name, 'depth': depth,
+                            'self_ms': int(self_us) / 1000, 'cumulative_ms': int(cumulative_us) / 1000})
+            package = name.split('.')[0]
+            packages[package] = packages.get(package, 0) + int(self_us) / 1000
+
+        modules.sort(key=lambda module: -module['cumulative_ms'])
+        return {
+            'modules': modules[:limit],
+            'packages': sorted(packages.items(), key=lambda item: -item[1])[:limit],
+            'boot': json.loads(result.stdout.splitlines()[-1]),
+        }
+
+    @classmethod
+    def cold_start(cls, runs: int = 5) -> Dict:
+        """
+        Time ``runs`` fresh interpreters importing the app and calling ``create_app``.
+
+        Returns:
+            Median and max of the import, create_app and total times in ms, plus
+            any ``LAZY_MODULES`` that were loaded during startup
+        """
+        samples = [json.loads(cls._run([]).stdout.splitlines()[-1]) for _ in range(runs)]
+        report = {}
+        for key in ('import_ms', 'create_app_ms'):
+            values = [sample[key] for sample in samples]
+            report[key] = {'median': round(statistics.median(values), 1), 'max': round(max(values), 1)}
+        totals = [sample['import_ms'] + sample['create_app_ms'] for sample in samples]
+        report['total_ms'] = {'median': round(statistics.median(totals), 1), 'max': round(max(totals), 1)}
+        report['lazy_loaded'] = sorted({name for sample in samples for name in sample['lazy_loaded']})
+        report['runs'] = runs
+        return report
@@ -0,0 +1,156 @@
+"""
+Community Timeline Cache
+Per-process ring buffers of the newest post summaries, one per domain plus one for the
+global feed. ``create_post`` pushes into them on write, so the default feed pages are
+served from memory. Each timeline is loaded from the database on first read and
+rebuilt after ``TIMELINE_CACHE_TTL_SECONDS``, which bounds how long posts written by
+other worker processes can be missing. At most ``TIMELINE_CACHE_MAX_DOMAINS`` domain
+timelines are kept; the least recently read one is dropped first.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from app import db
+from app.models.community import Post
+from app.models.user import User
+
+EXCERPT_LENGTH = 200
+
+
+class PostSummary(NamedTuple):
+    """Just what a feed card renders."""
+    id: int
+    user_id: int
+    author_name: str
+    title: str
+    excerpt: str
+    truncated: bool
+    domain: Optional[str]
+    likes_count: int
+    comments_count: int
+    created_at: datetime
+
+
+def summary_query():
+    """SELECT of feed-card columns joined with the author's name (no full post bodies)."""
+    return select(
+        Post.id, Post.user_id, User.full_name, Post.title,
+        func.substr(Post.content, 1, EXCERPT_LENGTH + 1), Post.domain,
+        Post.likes_count, Post.comments_count, Post.created_at,
+    ).join(User, User.id == Post.user_id)
+
+
+def to_summaries(rows) -> List[PostSummary]:
+    """Convert ``summary_query`` rows into summaries."""
+    return [
+        PostSummary(post_id, user_id, author_name, title, (content or '')[:EXCERPT_LENGTH],
+                    len(content or '') > EXCERPT_LENGTH, domain, likes or 0, comments or 0, created_at)
+        for post_id, user_id, author_name, title, content, domain, likes, comments, created_at in rows
+    ]
+
+
+def summarize(post: Post, author_name: str) -> PostSummary:
+    """Build a summary of a post that is already in memory."""
+    content = post.content or ''
+    return PostSummary(post.id, post.user_id, author_name, post.title, content[:EXCERPT_LENGTH],
+                       len(content) > EXCERPT_LENGTH, post.domain, post.likes_count or 0,
+                       post.comments_count or 0, post.created_at)
+
+
+class TimelineCache:
+    """Thread-safe, bounded, newest-first timelines keyed by domain (``None`` = all posts)."""
+
+    def __init__(self, capacity: int = 500, ttl: float = 300.0, max_domains: int = 32):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.max_domains = max_domains
+        self._timelines: 'OrderedDict[Optional[str], Tuple[float, Deque[PostSummary]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Read capacity, TTL and the number of domain timelines from the application config."""
+        self.capacity = app.config.get('TIMELINE_CACHE_SIZE', self.capacity)
+        self.ttl = app.config.get('TIMELINE_CACHE_TTL_SECONDS', self.ttl)
+        self.max_domains = app.config.get('TIMELINE_CACHE_MAX_DOMAINS', self.max_domains)
+
+    def _load(self, domain: Optional[str]) -> Deque[PostSummary]:
+        stmt = summary_query().order_by(Post.created_at.desc(), Post.id.desc()).limit(self.capacity)
+        if domain is not None:
+            stmt = stmt.where(Post.domain == domain)
+        return deque(to_summaries(db.session.execute(stmt)), maxlen=self.capacity)
+
+    def _timeline(self, domain: Optional[str]) -> Deque[PostSummary]:
+        with self._lock:
+            entry = self._timelines.get(domain)
+            if entry is not None and entry[0] > time.monotonic():
+                self._timelines.move_to_end(domain)
+                return entry[1]
+
+        # Rebuild outside the lock; a concurrent rebuild of the same key is harmless
+        timeline = self._load(domain)
+        with self._lock:
+            self._timelines[domain] = (time.monotonic() + self.ttl, timeline)
+            self._timelines.move_to_end(domain)
+            # Any /community/domain/<name> URL creates a key; keep the global feed
+            while len(self._timelines) > self.max_domains + 1:
+                oldest = next(key for key in self._timelines if key is not None)
+                del self._timelines[oldest]
+        return timeline
+
+    def page(self, domain: Optional[str], page: int, per_page: int) -> Optional[Tuple[List[PostSummary], bool]]:
+        """
+        Return one feed page from memory.
+
+        Args:
+            domain: Domain feed, or None for all posts
+            page: 1-based page number
+            per_page: Posts per page
+
+        Returns:
+            Tuple of (summaries, has_next), or None when the page lies beyond the
+            buffered posts and has to come from the database
+        """
+        timeline = self._timeline(domain)
+        start = (page - 1) * per_page
+        end = start + per_page
+        with self._lock:
+            if end >= len(timeline) and len(timeline) == self.capacity:
+                return None  # Older posts may exist beyond the buffer
+            items = [timeline[i] for i in range(start, min(end, len(timeline)))]
+            has_next = end < len(timeline)
+        return items, has_next
+
+    def push(self, summary: PostSummary) -> None:
+        """Prepend a new post to the global and its domain timeline (if loaded)."""
+        with self._lock:
+            for key in {None, summary.domain}:
+                entry = self._timelines.get(key)
+                if entry is not None:
+                    entry[1].appendleft(summary)
+
+    def update_counts(self, post: Post) -> None:
+        """Refresh like/comment counts of a buffered post after engagement."""
+        with self._lock:
+            for key in {None, post.domain}:
+                entry = self._timelines.get(key)
+                if entry is None:
+                    continue
+                timeline = entry[1]
+                for index, summary in enumerate(timeline):
+                    if summary.id == post.id:
+                        timeline[index] = summary._replace(likes_count=post.likes_count,
+                                                           comments_count=post.comments_count)
+                        break
+
+    def clear(self) -> None:
+        """Drop all timelines; they are reloaded on the next read."""
+        with self._lock:
+            self._timelines.clear()
+
+
+timeline_cache = TimelineCache()
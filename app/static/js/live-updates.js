@@ -0,0 +1,71 @@
+/**
+ * Live Updates
+ * Subscribes to the server's event stream (<meta name="live-events">) and patches
+ * like/comment counts and new-opportunity notices into the page without reloading.
+ * Like buttons are submitted in the background instead of reloading the page.
+ */
+
+// Replace the count shown for every post in a "counts" event
+const updateCounts = (posts) => {
+    posts.forEach((post) => {
+        document.querySelectorAll(`[data-likes-for="${post.id}"]`).forEach((el) => {
+            el.textContent = post.likes;
+        });
+        if (post.comments !== undefined) {
+            document.querySelectorAll(`[data-comments-for="${post.id}"]`).forEach((el) => {
+                el.textContent = post.comments;
+            });
+        }
+    });
+};
+
+// Show a running total of opportunities published since the page was loaded
+let newOpportunities = 0;
+const announceOpportunities = (batch) => {
+    const notice = document.getElementById('live-opportunities');
+    if (!notice) {
+        return;
+    }
+    newOpportunities += batch.count;
+    const titles = batch.newest.map((opp) => opp.title).join(', ');
+    notice.querySelector('[data-live-text]').textContent =
+        `${newOpportunities} new ${newOpportunities === 1 ? 'opportunity' : 'opportunities'} (latest: ${titles}).`;
+    notice.hidden = false;
+};
+
+const connect = () => {
+    const meta = document.querySelector('meta[name="live-events"]');
+    if (!meta || !window.EventSource) {
+        return;
+    }
+    // EventSource reconnects by itself when the server ends the stream
+    const source = new EventSource(meta.content);
+    source.addEventListener('counts', (event) => updateCounts(JSON.parse(event.data)));
+    source.addEventListener('opportunities', (event) => announceOpportunities(JSON.parse(event.data)));
+};
+
+// Submit like forms with XHR and show the returned count right away
+const enhanceLikeForms = () => {
+    document.querySelectorAll('form[data-like-form]').forEach((form) => {
+        form.addEventListener('submit', (event) => {
+            event.preventDefault();
+            fetch(form.action, {
+                method: 'POST',
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+                credentials: 'same-origin',
+            })
+                .then((response) => response.json())
+                .then((data) => {
+                    if (data.success) {
+                        updateCounts([{ id: form.dataset.likeForm, likes: data.likes }]);
+                    }
+                })
+                .catch(() => form.submit());
+        });
+    });
+};
+
+document.addEventListener('DOMContentLoaded', () => {
+    enhanceLikeForms();
+    connect();
+});
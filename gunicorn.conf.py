@@ -0,0 +1,65 @@
+"""
+Gunicorn configuration for production serving
+Usage: gunicorn -c gunicorn.conf.py wsgi:app
+
+The application is imported once in the master (preload_app) and forked into the
+workers, so code and read-only data are shared copy-on-write. Send HUP to the master
+to gracefully replace all workers; with preload_app new code needs a full restart
+(USR2 to start a new master, then QUIT the old one).
+"""
+import gc
+import multiprocessing
+import os
+import time
+
+bind = os.environ.get('BIND', '0.0.0.0:5001')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('WEB_THREADS', 2))
+worker_class = 'gthread'
+preload_app = True
+
+# An event stream holds a request thread for minutes, so the site's few threads per
+# worker must not serve them: streams beyond WEB_THREADS // 4 per worker get 503, and
+# pages only connect when /events/ is routed to gunicorn.events.conf.py
+raw_env = [
+    f"EVENTS_MAX_SUBSCRIBERS={os.environ.get('EVENTS_MAX_SUBSCRIBERS', threads // 4)}",
+    f"EVENTS_LIVE_UPDATES={os.environ.get('EVENTS_LIVE_UPDATES', '0')}",
+]
+
+timeout = int(os.environ.get('WEB_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
+
+_started = time.monotonic()
+
+
+def when_ready(server):
+    """Master is ready: the app is preloaded, workers are about to be forked."""
+    server.log.info(f"App preloaded in {time.monotonic() - _started:.2f}s")
+    # Move everything allocated so far out of the GC's reach, so collections in the
+    # workers do not touch (and copy) the pages shared with the master
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    worker.fork_started = time.monotonic()
+
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master; each worker opens its own."""
+    from app import db
+
+    with worker.app.wsgi().app_context():
+        db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    worker.log.info(f"Worker {worker.pid} booted in {(time.monotonic() - worker.fork_started) * 1000:.1f}ms")
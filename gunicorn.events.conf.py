@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for the live event streams (/events/)
+Usage: gunicorn -c gunicorn.events.conf.py wsgi:app
+
+Route /events/ to this server (e.g. an nginx location) and everything else to
+gunicorn.conf.py. Streams are idle almost all the time, so one worker holds many:
+as greenlets when the optional gevent package is installed, otherwise as threads
+that sleep until an event or the heartbeat. Set EVENTS_REDIS_URL so events published
+by the site's workers reach these processes.
+"""
+import os
+
+bind = os.environ.get('EVENTS_BIND', '0.0.0.0:5002')
+workers = int(os.environ.get('EVENTS_WORKERS', 2))
+streams = int(os.environ.get('EVENTS_STREAMS_PER_WORKER', 1000))
+
+try:
+    import gevent  # noqa: F401
+    worker_class = 'gevent'
+    worker_connections = streams + 10
+except ImportError:
+    worker_class = 'gthread'
+    threads = streams + 10  # Headroom for requests rejected with 503
+
+# gevent patches the standard library when the worker starts, so the app is imported
+# in each worker rather than preloaded in the master
+preload_app = False
+timeout = int(os.environ.get('WEB_TIMEOUT', 60))
+graceful_timeout = 10  # Clients reconnect to another worker
+keepalive = 75
+
+raw_env = [f'EVENTS_MAX_SUBSCRIBERS={streams}', 'EVENTS_LIVE_UPDATES=1']
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
@@ -26,6 +26,8 @@ def make_shell_context():
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
+        from app.services.schema import upgrade_schema
+        upgrade_schema()
         print("Database tables created successfully!")
         print("Starting Flask application...")
     